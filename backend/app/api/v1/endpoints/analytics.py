@@ -1,28 +1,33 @@
 from typing import List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, desc
+from sqlalchemy.orm import load_only
 from datetime import datetime, timedelta
 
-from app.core.auth import get_current_active_user
-from app.core.database import get_db
+from app.core.auth import get_current_active_user, get_current_active_user_async
+from app.core.database import replica_engine
+from app.core.read_replica import get_async_read_db
 from app.models.user import User
 from app.models.child import Child
 from app.models.session import GameSession
 from app.models.passion import PassionDomain, PassionInsight
+from app.ml.model_registry import get_model_registry
+from app.ml.result_cache import get_result_cache
+from app.core.pool_metrics import get_pool_metrics
 
 router = APIRouter()
 
 @router.get("/child/{child_id}/progress")
-def get_child_progress(
+async def get_child_progress(
     child_id: int,
     days: int = Query(30, description="Number of days to analyze"),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get progress analytics for a child"""
     # Verify child access
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = await db.get(Child, child_id)
     if not child:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -39,12 +44,14 @@ def get_child_progress(
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
     
-    # Get sessions in date range
-    sessions = db.query(GameSession).filter(
+    # Get sessions in date range (only the columns the metrics use)
+    sessions = (await db.execute(select(GameSession).options(
+        load_only(GameSession.status, GameSession.duration_seconds)
+    ).where(
         GameSession.child_id == child_id,
         GameSession.created_at >= start_date,
         GameSession.created_at <= end_date
-    ).all()
+    ))).scalars().all()
     
     # Calculate metrics
     total_sessions = len(sessions)
@@ -53,16 +60,16 @@ def get_child_progress(
     average_session_duration = total_play_time / total_sessions if total_sessions > 0 else 0
     
     # Get passion domains
-    domains = db.query(PassionDomain).filter(
+    domains = (await db.execute(select(PassionDomain).where(
         PassionDomain.child_id == child_id,
         PassionDomain.is_active == True
-    ).all()
+    ))).scalars().all()
     
     # Get recent insights
-    insights = db.query(PassionInsight).filter(
+    insights = (await db.execute(select(PassionInsight).where(
         PassionInsight.child_id == child_id,
         PassionInsight.created_at >= start_date
-    ).order_by(desc(PassionInsight.created_at)).limit(10).all()
+    ).order_by(desc(PassionInsight.created_at)).limit(10))).scalars().all()
     
     return {
         "child_id": child_id,
@@ -78,15 +85,15 @@ def get_child_progress(
     }
 
 @router.get("/child/{child_id}/activity-timeline")
-def get_activity_timeline(
+async def get_activity_timeline(
     child_id: int,
     days: int = Query(7, description="Number of days to analyze"),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get activity timeline for a child"""
     # Verify child access
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = await db.get(Child, child_id)
     if not child:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -104,15 +111,15 @@ def get_activity_timeline(
     start_date = end_date - timedelta(days=days)
     
     # Get daily activity
-    daily_activity = db.query(
+    daily_activity = (await db.execute(select(
         func.date(GameSession.created_at).label('date'),
         func.count(GameSession.id).label('sessions'),
         func.sum(GameSession.duration_seconds).label('total_duration')
-    ).filter(
+    ).where(
         GameSession.child_id == child_id,
         GameSession.created_at >= start_date,
         GameSession.created_at <= end_date
-    ).group_by(func.date(GameSession.created_at)).all()
+    ).group_by(func.date(GameSession.created_at)))).all()
     
     # Format timeline data
     timeline = []
@@ -130,14 +137,14 @@ def get_activity_timeline(
     }
 
 @router.get("/child/{child_id}/game-performance")
-def get_game_performance(
+async def get_game_performance(
     child_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get game performance analytics for a child"""
     # Verify child access
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = await db.get(Child, child_id)
     if not child:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -151,16 +158,16 @@ def get_game_performance(
         )
     
     # Get game performance data
-    game_performance = db.query(
+    game_performance = (await db.execute(select(
         GameSession.game_id,
         func.count(GameSession.id).label('total_sessions'),
         func.avg(GameSession.score).label('average_score'),
         func.avg(GameSession.accuracy).label('average_accuracy'),
         func.avg(GameSession.duration_seconds).label('average_duration')
-    ).filter(
+    ).where(
         GameSession.child_id == child_id,
         GameSession.status == "completed"
-    ).group_by(GameSession.game_id).all()
+    ).group_by(GameSession.game_id))).all()
     
     # Format performance data
     performance_data = []
@@ -179,14 +186,14 @@ def get_game_performance(
     }
 
 @router.get("/child/{child_id}/passion-evolution")
-def get_passion_evolution(
+async def get_passion_evolution(
     child_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get passion domain evolution over time"""
     # Verify child access
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = await db.get(Child, child_id)
     if not child:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -200,10 +207,10 @@ def get_passion_evolution(
         )
     
     # Get passion domains with timestamps
-    domains = db.query(PassionDomain).filter(
+    domains = (await db.execute(select(PassionDomain).where(
         PassionDomain.child_id == child_id,
         PassionDomain.is_active == True
-    ).order_by(PassionDomain.first_detected).all()
+    ).order_by(PassionDomain.first_detected))).scalars().all()
     
     # Format evolution data
     evolution = []
@@ -223,14 +230,14 @@ def get_passion_evolution(
     }
 
 @router.get("/dashboard/{child_id}")
-def get_dashboard_data(
+async def get_dashboard_data(
     child_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get comprehensive dashboard data for a child"""
     # Verify child access
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = await db.get(Child, child_id)
     if not child:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -244,14 +251,16 @@ def get_dashboard_data(
         )
     
     # Get all relevant data
-    sessions = db.query(GameSession).filter(GameSession.child_id == child_id).all()
-    domains = db.query(PassionDomain).filter(
+    sessions = (await db.execute(select(GameSession).options(
+        load_only(GameSession.game_id, GameSession.status, GameSession.duration_seconds, GameSession.score)
+    ).where(GameSession.child_id == child_id))).scalars().all()
+    domains = (await db.execute(select(PassionDomain).where(
         PassionDomain.child_id == child_id,
         PassionDomain.is_active == True
-    ).all()
-    insights = db.query(PassionInsight).filter(
+    ))).scalars().all()
+    insights = (await db.execute(select(PassionInsight).where(
         PassionInsight.child_id == child_id
-    ).order_by(desc(PassionInsight.created_at)).limit(5).all()
+    ).order_by(desc(PassionInsight.created_at)).limit(5))).scalars().all()
     
     # Calculate dashboard metrics
     total_play_time = sum([s.duration_seconds or 0 for s in sessions]) / 60
@@ -286,4 +295,40 @@ def get_dashboard_data(
         "recent_insights": insights,
         "top_games": top_games,
         "last_activity": child.last_activity.isoformat() if child.last_activity else None
-    } 
\ No newline at end of file
+    } 
+
+@router.get("/models")
+def get_model_stats(current_user: User = Depends(get_current_active_user)):
+    """Get load time and memory usage of the loaded ML models (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return {"models": get_model_registry().stats()}
+
+@router.get("/cache")
+def get_cache_stats(current_user: User = Depends(get_current_active_user)):
+    """Get hit/miss statistics of the analysis result cache (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return {"analysis_cache": get_result_cache().stats()}
+
+@router.get("/database")
+def get_database_stats(current_user: User = Depends(get_current_active_user)):
+    """Get connection pool checkout waits and occupancy of the engines (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    stats = {"pool": get_pool_metrics().stats(), "async_pool": get_pool_metrics("async").stats()}
+    if replica_engine is not None:
+        stats.update(replica_pool=get_pool_metrics("replica").stats(), replica_async_pool=get_pool_metrics("replica_async").stats())
+    return stats
\ No newline at end of file
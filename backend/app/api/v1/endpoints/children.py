@@ -8,6 +8,8 @@ from app.core.database import get_db
 from app.models.user import User
 from app.models.child import Child
 from app.schemas.child import ChildCreate, Child as ChildSchema, ChildUpdate, ChildSummary
+from app.ml.result_cache import invalidate_child_results
+from app.ml.cohort_stats import remove_child_scores
 
 router = APIRouter()
 
@@ -107,6 +109,7 @@ def update_child(child_id: int, child_update: ChildUpdate, current_user: User =
     
     db.commit()
     db.refresh(child)
+    invalidate_child_results(child_id)
     
     return child
 
@@ -128,8 +131,11 @@ def delete_child(child_id: int, current_user: User = Depends(get_current_active_
             detail="Access denied"
         )
     
+    # The child's scores leave its age cohort along with it
+    remove_child_scores(db, child.id)
     db.delete(child)
     db.commit()
+    invalidate_child_results(child_id)
     
     return {"message": "Child profile deleted successfully"}
 
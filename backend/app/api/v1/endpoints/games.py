@@ -1,48 +1,54 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_active_user
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.read_replica import get_read_db
+from app.core.pagination import PageParams, paginate
 from app.models.user import User
-from app.models.game import Game
+from app.models.game import Game, GamePassionDomain
 from app.models.child import Child
 from app.schemas.game import Game as GameSchema, GameCreate, GameUpdate
+from app.ml.recommender import recommend_games, invalidate_game_catalog
 
 router = APIRouter()
 
 @router.get("/", response_model=List[GameSchema])
 def get_games(
+    response: Response,
     category: Optional[str] = Query(None, description="Filter by game category"),
     age_min: Optional[int] = Query(None, description="Minimum age filter"),
     age_max: Optional[int] = Query(None, description="Maximum age filter"),
     difficulty: Optional[str] = Query(None, description="Difficulty level"),
     passion_domain: Optional[str] = Query(None, description="Filter by passion domain"),
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Get available games with optional filters"""
+    """Get available games with optional filters, by id"""
     query = db.query(Game).filter(Game.is_active == True)
     
     if category:
         query = query.filter(Game.category == category)
     
+    # Indexed columns mirroring the age_range and passion_domains JSON
     if passion_domain:
-        query = query.filter(Game.passion_domains.contains([passion_domain]))
+        query = query.join(GamePassionDomain).filter(GamePassionDomain.domain == passion_domain)
     
     if age_min is not None:
-        query = query.filter(Game.age_range['min'] >= age_min)
+        query = query.filter(Game.age_min >= age_min)
     
     if age_max is not None:
-        query = query.filter(Game.age_range['max'] <= age_max)
+        query = query.filter(Game.age_max <= age_max)
     
-    games = query.all()
-    return games
+    return paginate(query, [Game.id], page, response)
 
 @router.get("/recommended", response_model=List[GameSchema])
 def get_recommended_games(
     child_id: int,
-    limit: int = Query(5, description="Number of recommendations"),
+    limit: int = Query(5, ge=1, le=settings.RECOMMENDATION_LIST_SIZE, description=f"Number of recommendations (at most {settings.RECOMMENDATION_LIST_SIZE}, the stored ranking size)"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -61,18 +67,11 @@ def get_recommended_games(
             detail="Access denied"
         )
     
-    # Simple recommendation logic (can be enhanced with ML)
-    # For now, return games appropriate for the child's age
-    recommended_games = db.query(Game).filter(
-        Game.is_active == True,
-        Game.age_range['min'] <= child.age,
-        Game.age_range['max'] >= child.age
-    ).limit(limit).all()
-    
-    return recommended_games
+    # Served from the child's precomputed ranking of age-appropriate games
+    return recommend_games(db, child, limit)
 
 @router.get("/{game_id}", response_model=GameSchema)
-def get_game(game_id: int, db: Session = Depends(get_db)):
+def get_game(game_id: int, db: Session = Depends(get_read_db)):
     """Get a specific game by ID"""
     game = db.query(Game).filter(Game.id == game_id).first()
     
@@ -101,6 +100,7 @@ def create_game(
     db.add(db_game)
     db.commit()
     db.refresh(db_game)
+    invalidate_game_catalog()
     
     return db_game
 
@@ -131,6 +131,7 @@ def update_game(
     
     db.commit()
     db.refresh(game)
+    invalidate_game_catalog()
     
     return game
 
@@ -156,6 +157,7 @@ def delete_game(
     
     db.delete(game)
     db.commit()
+    invalidate_game_catalog()
     
     return {"message": "Game deleted successfully"}
 
@@ -1,9 +1,11 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_active_user
 from app.core.database import get_db
+from app.core.read_replica import get_read_db
+from app.core.pagination import PageParams, paginate
 from app.models.user import User
 from app.models.child import Child
 from app.models.passion import PassionDomain, PassionInsight
@@ -11,8 +13,11 @@ from app.schemas.passion import (
     PassionDomain as PassionDomainSchema,
     PassionInsight as PassionInsightSchema,
     PassionAnalysis,
-    PassionRecommendation
+    PassionRecommendation,
+    CohortComparison
 )
+from app.ml.passion_detector import PassionDetector
+from app.ml.cohort_stats import PASSION, domain_percentiles
 
 router = APIRouter()
 
@@ -20,7 +25,7 @@ router = APIRouter()
 def get_passion_domains(
     child_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get detected passion domains for a child"""
     # Verify child access
@@ -44,13 +49,51 @@ def get_passion_domains(
     
     return domains
 
+@router.get("/domains/{child_id}/percentiles", response_model=CohortComparison)
+def get_passion_percentiles(
+    child_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Compare a child's passion domain confidences with children of the same age"""
+    # Verify child access
+    child = db.query(Child).filter(Child.id == child_id).first()
+    if not child:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Child not found"
+        )
+    
+    if child.parent_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    scores = {
+        domain: confidence
+        for domain, confidence in db.query(PassionDomain.domain, PassionDomain.confidence_score).filter(
+            PassionDomain.child_id == child_id,
+            PassionDomain.is_active == True
+        ).order_by(PassionDomain.confidence_score.desc()).all()
+    }
+    
+    return CohortComparison(
+        child_id=child_id,
+        age=child.age,
+        source=PASSION,
+        domains=domain_percentiles(db, PASSION, child.age, scores)
+    )
+
 @router.get("/insights/{child_id}", response_model=List[PassionInsightSchema])
 def get_passion_insights(
     child_id: int,
+    response: Response,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Get passion insights for a child"""
+    """Get passion insights for a child, newest first"""
     # Verify child access
     child = db.query(Child).filter(Child.id == child_id).first()
     if not child:
@@ -65,17 +108,14 @@ def get_passion_insights(
             detail="Access denied"
         )
     
-    insights = db.query(PassionInsight).filter(
-        PassionInsight.child_id == child_id
-    ).order_by(PassionInsight.created_at.desc()).all()
-    
-    return insights
+    query = db.query(PassionInsight).filter(PassionInsight.child_id == child_id)
+    return paginate(query, [PassionInsight.created_at, PassionInsight.id], page, response, descending=True)
 
 @router.get("/recommendations/{child_id}", response_model=List[PassionRecommendation])
 def get_recommendations(
     child_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get personalized recommendations for a child"""
     # Verify child access
@@ -115,6 +155,59 @@ def get_recommendations(
     
     return recommendations
 
+@router.post("/analyze/{child_id}", response_model=PassionAnalysis)
+def analyze_passions(
+    child_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Run passion detection for a child and store the detected domains and insights"""
+    # Verify child access
+    child = db.query(Child).filter(Child.id == child_id).first()
+    if not child:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Child not found"
+        )
+    
+    if child.parent_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    analysis = PassionDetector().analyze_and_save(child_id, db)
+    db.commit()
+    
+    # Return the stored rows
+    detected = [d.domain for d in analysis["domains"]]
+    domains = db.query(PassionDomain).filter(
+        PassionDomain.child_id == child_id,
+        PassionDomain.domain.in_(detected),
+        PassionDomain.is_active == True
+    ).order_by(PassionDomain.confidence_score.desc()).all() if detected else []
+    
+    # Insights are refreshed in place, so match them by type and title rather than by newest id;
+    # the first (newest) row per key is the one save_analysis wrote
+    generated = {(i.insight_type, i.title) for i in analysis["insights"]}
+    newest = {}
+    for insight in db.query(PassionInsight).filter(
+        PassionInsight.child_id == child_id,
+        PassionInsight.title.in_([title for _, title in generated])
+    ).order_by(PassionInsight.id.desc()).all() if generated else []:
+        newest.setdefault((insight.insight_type, insight.title), insight)
+    insights = [insight for key, insight in newest.items() if key in generated]
+    
+    return PassionAnalysis(
+        child_id=child_id,
+        domains=domains,
+        insights=insights,
+        overall_confidence=analysis["overall_confidence"],
+        recommended_next_activities=analysis["recommended_next_activities"],
+        development_trends=analysis["development_trends"],
+        last_updated=analysis["last_updated"]
+    )
+
 @router.post("/domains/{domain_id}/verify")
 def verify_passion_domain(
     domain_id: int,
@@ -148,7 +241,7 @@ def verify_passion_domain(
 def get_passion_summary(
     child_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get a summary of passion detection results"""
     # Verify child access
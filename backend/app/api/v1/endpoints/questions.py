@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from app.core.database import get_db
-from app.core.auth import get_current_active_user
+from app.core.database import get_db, get_async_db, SessionLocal
+from app.core.auth import get_current_active_user, get_current_active_user_async
+from app.core.pagination import PageParams, paginate
+from app.core.read_replica import get_read_db
 from app.models.user import User
 from app.models.question import Question, QuestionResponse, TalentAssessment
 from app.models.child import Child
@@ -15,22 +18,29 @@ from app.schemas.question import (
     QuestionResponseCreate,
     TalentAssessment as TalentAssessmentSchema,
     TalentAssessmentCreate,
+    AnalysisJob as AnalysisJobSchema,
     QuestionSet
 )
+from app.schemas.passion import CohortComparison
 from app.ml.passion_detector import analyze_talent_responses
+from app.ml.jobs import get_job_manager
+from app.ml.result_cache import get_result_cache, invalidate_child_results
+from app.ml.cohort_stats import TALENT, lock_children, record_score_deltas, talent_score_deltas, domain_percentiles
 
 router = APIRouter()
 
 @router.get("/", response_model=List[QuestionSchema])
 def get_questions(
+    response: Response,
     category: Optional[str] = None,
     talent_domain: Optional[str] = None,
     age: Optional[int] = None,
     difficulty: Optional[str] = None,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Get questions with optional filtering"""
+    """Get questions with optional filtering, by id"""
     query = db.query(Question).filter(Question.is_active == True)
     
     if category:
@@ -42,12 +52,12 @@ def get_questions(
     if difficulty:
         query = query.filter(Question.difficulty_level == difficulty)
     
-    return query.all()
+    return paginate(query, [Question.id], page, response)
 
 @router.get("/categories", response_model=List[str])
 def get_question_categories(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all available question categories"""
     categories = db.query(Question.category).distinct().all()
@@ -56,7 +66,7 @@ def get_question_categories(
 @router.get("/talent-domains", response_model=List[str])
 def get_talent_domains(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all available talent domains"""
     domains = db.query(Question.talent_domain).distinct().all()
@@ -104,14 +114,14 @@ def get_assessment_questions(
     )
 
 @router.post("/response", response_model=QuestionResponseSchema)
-def submit_response(
+async def submit_response(
     response: QuestionResponseCreate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Submit a response to a question"""
     # Verify child exists and user has access
-    child = db.query(Child).filter(Child.id == response.child_id).first()
+    child = await db.get(Child, response.child_id)
     if not child:
         raise HTTPException(status_code=404, detail="Child not found")
     
@@ -119,7 +129,7 @@ def submit_response(
         raise HTTPException(status_code=403, detail="Access denied")
     
     # Verify question exists
-    question = db.query(Question).filter(Question.id == response.question_id).first()
+    question = await db.get(Question, response.question_id)
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
     
@@ -141,8 +151,9 @@ def submit_response(
     )
     
     db.add(db_response)
-    db.commit()
-    db.refresh(db_response)
+    await db.commit()
+    await db.refresh(db_response)
+    invalidate_child_results(response.child_id)
     
     return db_response
 
@@ -162,19 +173,72 @@ def analyze_talents(
         raise HTTPException(status_code=403, detail="Access denied")
     
     # Get recent responses for this child
-    responses = db.query(QuestionResponse).filter(
-        QuestionResponse.child_id == child_id
-    ).order_by(QuestionResponse.created_at.desc()).limit(20).all()
+    responses = _recent_responses(child_id, db)
     
     if not responses:
         raise HTTPException(status_code=400, detail="No responses found for analysis")
     
-    # Analyze responses using ML model
-    analysis_result = analyze_talent_responses(responses, child)
+    return _create_assessment(child, responses, db)
+
+@router.post("/assessment/{child_id}/analyze/jobs", response_model=AnalysisJobSchema, status_code=status.HTTP_202_ACCEPTED)
+def submit_analysis_job(
+    child_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Queue a talent analysis for a child; concurrent requests for the same child share one job"""
+    # Verify child exists and user has access
+    child = db.query(Child).filter(Child.id == child_id).first()
+    if not child:
+        raise HTTPException(status_code=404, detail="Child not found")
+    
+    if child.parent_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    has_responses = db.query(QuestionResponse.id).filter(
+        QuestionResponse.child_id == child_id
+    ).first()
+    
+    if not has_responses:
+        raise HTTPException(status_code=400, detail="No responses found for analysis")
+    
+    job, _ = get_job_manager().submit(f"talent_assessment:{child_id}", current_user.id, child_id, _run_assessment_job, child_id)
+    return _job_status(job)
+
+@router.get("/assessment/jobs/{job_id}", response_model=AnalysisJobSchema)
+def get_analysis_job(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get the status, and once completed the result, of a talent analysis job"""
+    job = get_job_manager().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    return _job_status(job)
+
+def _recent_responses(child_id: int, db: Session) -> List[QuestionResponse]:
+    """Most recent responses used for a talent analysis"""
+    return db.query(QuestionResponse).filter(
+        QuestionResponse.child_id == child_id
+    ).order_by(QuestionResponse.created_at.desc()).limit(20).all()
+
+def _create_assessment(child: Child, responses: List[QuestionResponse], db: Session) -> TalentAssessment:
+    """Analyze responses and store the resulting talent assessment"""
+    # Analyze responses using ML model, reusing the result while the child's data is unchanged
+    analysis_result = get_result_cache().get_or_compute(
+        "talent_assessment",
+        child.id,
+        db,
+        lambda: analyze_talent_responses(responses, child)
+    )
     
     # Create talent assessment
     assessment = TalentAssessment(
-        child_id=child_id,
+        child_id=child.id,
         talent_domains=analysis_result["talent_domains"],
         primary_talent=analysis_result["primary_talent"],
         secondary_talents=analysis_result["secondary_talents"],
@@ -186,19 +250,61 @@ def analyze_talents(
         development_path=analysis_result["development_path"]
     )
     
+    # The new assessment replaces the previous one in the child's age cohort; the
+    # child's row stays locked until commit so concurrent assessments take turns
+    lock_children(db, [child.id])
+    previous = db.query(TalentAssessment.talent_domains).filter(
+        TalentAssessment.child_id == child.id
+    ).order_by(TalentAssessment.id.desc()).first()
+    record_score_deltas(db, TALENT, talent_score_deltas(
+        child.age, previous.talent_domains if previous else None, assessment.talent_domains
+    ))
+    
     db.add(assessment)
     db.commit()
     db.refresh(assessment)
     
     return assessment
 
+def _run_assessment_job(child_id: int) -> Dict[str, Any]:
+    """Worker body of an analysis job, using its own database session; returns the stored JSON result"""
+    db = SessionLocal()
+    try:
+        child = db.query(Child).filter(Child.id == child_id).first()
+        if not child:
+            raise ValueError("Child not found")
+        
+        responses = _recent_responses(child_id, db)
+        if not responses:
+            raise ValueError("No responses found for analysis")
+        
+        return TalentAssessmentSchema.model_validate(_create_assessment(child, responses, db)).model_dump(mode="json")
+    finally:
+        db.close()
+
+def _job_status(job) -> AnalysisJobSchema:
+    """API view of an analysis job"""
+    return AnalysisJobSchema(
+        job_id=job.id,
+        child_id=job.child_id,
+        status=job.status,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        coalesced_requests=job.coalesced_requests,
+        result=job.result,
+        error=job.error
+    )
+
 @router.get("/assessment/{child_id}/history", response_model=List[TalentAssessmentSchema])
 def get_assessment_history(
     child_id: int,
+    response: Response,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get assessment history for a child"""
+    """Get assessment history for a child, newest first"""
     # Verify child exists and user has access
     child = db.query(Child).filter(Child.id == child_id).first()
     if not child:
@@ -207,8 +313,33 @@ def get_assessment_history(
     if child.parent_id != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    assessments = db.query(TalentAssessment).filter(
+    query = db.query(TalentAssessment).filter(TalentAssessment.child_id == child_id)
+    return paginate(query, [TalentAssessment.assessment_date, TalentAssessment.id], page, response, descending=True) 
+
+@router.get("/assessment/{child_id}/percentiles", response_model=CohortComparison)
+def get_assessment_percentiles(
+    child_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Compare the latest talent assessment scores with children of the same age"""
+    # Verify child exists and user has access
+    child = db.query(Child).filter(Child.id == child_id).first()
+    if not child:
+        raise HTTPException(status_code=404, detail="Child not found")
+    
+    if child.parent_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    latest = db.query(TalentAssessment.talent_domains).filter(
         TalentAssessment.child_id == child_id
-    ).order_by(TalentAssessment.assessment_date.desc()).all()
+    ).order_by(TalentAssessment.id.desc()).first()
+    if not latest:
+        raise HTTPException(status_code=404, detail="No talent assessment found")
     
-    return assessments 
\ No newline at end of file
+    return CohortComparison(
+        child_id=child_id,
+        age=child.age,
+        source=TALENT,
+        domains=domain_percentiles(db, TALENT, child.age, latest.talent_domains)
+    )
\ No newline at end of file
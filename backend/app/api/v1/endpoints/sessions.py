@@ -1,28 +1,34 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session, undefer, undefer_group
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 import uuid
 
-from app.core.auth import get_current_active_user
-from app.core.database import get_db
+from app.core.auth import get_current_active_user, get_current_active_user_async
+from app.core.database import get_db, get_async_db
+from app.core.pagination import PageParams, paginate
 from app.models.user import User
 from app.models.child import Child
 from app.models.game import Game
-from app.models.session import GameSession
-from app.schemas.game import GameSessionCreate, GameSession as GameSessionSchema, GameSessionUpdate
+from app.models.session import FULL_ROW, TELEMETRY, GameSession
+from app.schemas.game import GameSessionCreate, GameSession as GameSessionSchema, GameSessionSummary, GameSessionUpdate
+from app.ml.feature_store import record_session_update, rebuild_child_features
+from app.ml.result_cache import invalidate_child_results
+from app.ml.recommender import refresh_recommendations
 
 router = APIRouter()
 
 @router.post("/", response_model=GameSessionSchema)
-def create_session(
+async def create_session(
     session_data: GameSessionCreate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new game session"""
     # Verify child access
-    child = db.query(Child).filter(Child.id == session_data.child_id).first()
+    child = await db.get(Child, session_data.child_id)
     if not child:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -36,7 +42,7 @@ def create_session(
         )
     
     # Verify game exists
-    game = db.query(Game).filter(Game.id == session_data.game_id).first()
+    game = await db.get(Game, session_data.game_id)
     if not game:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -62,24 +68,27 @@ def create_session(
     )
     
     db.add(db_session)
-    db.commit()
-    db.refresh(db_session)
+    await db.commit()
+    await db.refresh(db_session, FULL_ROW)
     
     # Update child's last activity
     child.last_activity = datetime.now()
-    db.commit()
+    await db.commit()
+    invalidate_child_results(child.id)
     
     return db_session
 
-@router.get("/", response_model=List[GameSessionSchema])
+@router.get("/", response_model=List[GameSessionSummary])
 def get_sessions(
+    response: Response,
     child_id: int = None,
     game_id: int = None,
     status: str = None,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get game sessions with optional filters"""
+    """Get game sessions with optional filters, newest first (without telemetry, see get_session)"""
     query = db.query(GameSession)
     
     if child_id:
@@ -103,8 +112,7 @@ def get_sessions(
     if status:
         query = query.filter(GameSession.status == status)
     
-    sessions = query.order_by(GameSession.created_at.desc()).all()
-    return sessions
+    return paginate(query, [GameSession.created_at, GameSession.id], page, response, descending=True)
 
 @router.get("/{session_id}", response_model=GameSessionSchema)
 def get_session(
@@ -113,7 +121,7 @@ def get_session(
     db: Session = Depends(get_db)
 ):
     """Get a specific game session"""
-    session = db.query(GameSession).filter(GameSession.session_id == session_id).first()
+    session = db.query(GameSession).options(undefer_group(TELEMETRY)).filter(GameSession.session_id == session_id).first()
     
     if not session:
         raise HTTPException(
@@ -131,14 +139,14 @@ def get_session(
     return session
 
 @router.put("/{session_id}", response_model=GameSessionSchema)
-def update_session(
+async def update_session(
     session_id: str,
     session_update: GameSessionUpdate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a game session (for data collection)"""
-    session = db.query(GameSession).filter(GameSession.session_id == session_id).first()
+    session = (await db.execute(select(GameSession).options(undefer_group(TELEMETRY)).where(GameSession.session_id == session_id))).scalars().first()
     
     if not session:
         raise HTTPException(
@@ -153,25 +161,35 @@ def update_session(
             detail="Access denied"
         )
     
+    was_completed = session.status == "completed"
+    
     # Update fields
     update_data = session_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(session, field, value)
     
+    changed_fields = set(update_data)
+    
     # If session is being completed, calculate duration
     if session_update.status == "completed" and session.started_at:
         session.completed_at = datetime.now()
         session.duration_seconds = (session.completed_at - session.started_at).total_seconds()
+        changed_fields.add("duration_seconds")
         
         # Update child's total play time
-        child = db.query(Child).filter(Child.id == session.child_id).first()
+        child = await db.get(Child, session.child_id)
         if child:
             child.total_play_time += session.duration_seconds / 60  # Convert to minutes
             child.sessions_completed += 1
             child.last_activity = datetime.now()
     
-    db.commit()
-    db.refresh(session)
+    # Fold a first completion into the feature store, rebuild it when a completed session changes
+    if await db.run_sync(lambda sync_db: record_session_update(sync_db, session, was_completed, changed_fields)):
+        await db.run_sync(lambda sync_db: refresh_recommendations(sync_db, [session.child_id]))
+    
+    await db.commit()
+    await db.refresh(session, FULL_ROW)
+    invalidate_child_results(session.child_id)
     
     return session
 
@@ -197,19 +215,32 @@ def delete_session(
             detail="Access denied"
         )
     
+    was_completed = session.status == "completed"
     db.delete(session)
+    
+    # Aggregates cannot be un-applied, so recompute the child's features without it
+    if was_completed:
+        db.flush()
+        rebuild_child_features(db, session.child_id)
+        refresh_recommendations(db, [session.child_id])
+    
     db.commit()
+    invalidate_child_results(session.child_id)
     
     return {"message": "Session deleted successfully"}
 
 @router.post("/{session_id}/complete")
-def complete_session(
+async def complete_session(
     session_id: str,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Mark a session as completed"""
-    session = db.query(GameSession).filter(GameSession.session_id == session_id).first()
+    # The feature store reads these two telemetry columns
+    session = (await db.execute(select(GameSession).options(
+        undefer(GameSession.speed_metrics),
+        undefer(GameSession.emotional_reactions)
+    ).where(GameSession.session_id == session_id))).scalars().first()
     
     if not session:
         raise HTTPException(
@@ -223,6 +254,8 @@ def complete_session(
             detail="Access denied"
         )
     
+    was_completed = session.status == "completed"
+    
     session.status = "completed"
     session.completed_at = datetime.now()
     session.completion_percentage = 100.0
@@ -231,12 +264,18 @@ def complete_session(
         session.duration_seconds = (session.completed_at - session.started_at).total_seconds()
     
     # Update child's stats
-    child = db.query(Child).filter(Child.id == session.child_id).first()
+    child = await db.get(Child, session.child_id)
     if child:
         child.total_play_time += session.duration_seconds / 60 if session.duration_seconds else 0
         child.sessions_completed += 1
         child.last_activity = datetime.now()
     
-    db.commit()
+    # Fold a first completion into the feature store; completing again changes the duration
+    changed_fields = ["status", "duration_seconds"]
+    if await db.run_sync(lambda sync_db: record_session_update(sync_db, session, was_completed, changed_fields)):
+        await db.run_sync(lambda sync_db: refresh_recommendations(sync_db, [session.child_id]))
+    
+    await db.commit()
+    invalidate_child_results(session.child_id)
     
     return {"message": "Session completed successfully"} 
\ No newline at end of file
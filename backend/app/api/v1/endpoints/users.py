@@ -1,9 +1,10 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_active_user, get_password_hash
 from app.core.database import get_db
+from app.core.pagination import PageParams, paginate
 from app.models.user import User
 from app.schemas.user import User as UserSchema, UserUpdate
 
@@ -33,18 +34,19 @@ def update_current_user(
 
 @router.get("/", response_model=List[UserSchema])
 def get_users(
+    response: Response,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get all users (admin only)"""
+    """Get all users by id (admin only)"""
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
     
-    users = db.query(User).all()
-    return users
+    return paginate(db.query(User), [User.id], page, response)
 
 @router.get("/{user_id}", response_model=UserSchema)
 def get_user(
@@ -4,10 +4,12 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.models.user import User
 
 # Password hashing
@@ -44,8 +46,8 @@ def verify_token(token: str) -> Optional[dict]:
     except JWTError:
         return None
 
-async def get_current_user(token: str = Depends(security), db: Session = Depends(get_db)) -> User:
-    """Get the current authenticated user"""
+def _token_user_id(token: HTTPAuthorizationCredentials) -> int:
+    """User id from a bearer token, or 401"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -60,13 +62,33 @@ async def get_current_user(token: str = Depends(security), db: Session = Depends
         user_id: int = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-            
+    
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    return user_id
+
+async def get_current_user(token: str = Depends(security), db: Session = Depends(get_db)) -> User:
+    """Get the current authenticated user"""
+    user = db.query(User).filter(User.id == _token_user_id(token)).first()
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return user
+
+async def get_current_user_async(token: str = Depends(security), db: AsyncSession = Depends(get_async_db)) -> User:
+    """Get the current authenticated user through the async session"""
+    user = (await db.execute(select(User).where(User.id == _token_user_id(token)))).scalars().first()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
     return user
 
@@ -76,6 +98,12 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+async def get_current_active_user_async(current_user: User = Depends(get_current_user_async)) -> User:
+    """Get the current active user for async def endpoints"""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """Authenticate a user with email and password"""
     user = db.query(User).filter(User.email == email).first()
@@ -1,18 +1,134 @@
-from sqlalchemy import create_engine
+import threading
+from typing import Dict, Any
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 from app.core.config import settings
+from app.core.pool_metrics import POOL_CLASSES, metered_pool_class, get_pool_metrics
+
+# Async drivers used for each DATABASE_URL backend
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite"
+}
+
+def is_memory_sqlite(url: str) -> bool:
+    """True for SQLite databases that live inside a single connection"""
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    )
+
+def shared_memory_url(url: str) -> str:
+    """Name an in-memory SQLite database so the sync and async engines open the same one
+    
+    Each connection to sqlite:// gets its own empty database, so the async
+    engine would not see the tables the sync engine created. A named
+    shared-cache memory database lives as long as either engine's connection.
+    """
+    if not is_memory_sqlite(url):
+        return url
+    url = make_url(url)
+    database = url.database if (url.database or "").startswith("file:") else "file:passion_detection"
+    query = {**url.query, "mode": "memory", "cache": "shared", "uri": "true"}
+    return url.set(database=database, query=query).render_as_string(hide_password=False)
+
+def async_database_url(url: str) -> str:
+    """The same database addressed through its async driver"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend} databases")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def engine_options(url: str, engine_kind: str = "sync") -> Dict[str, Any]:
+    """create_engine keyword arguments for the configured connection pool"""
+    options: Dict[str, Any] = {}
+    if make_url(url).get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    
+    # An in-memory SQLite database only exists on its one connection
+    pool_name = "static" if is_memory_sqlite(url) else settings.DB_POOL_CLASS
+    if pool_name not in POOL_CLASSES:
+        raise ValueError(f"Unknown DB_POOL_CLASS {pool_name!r}, expected one of {', '.join(POOL_CLASSES)}")
+    options["poolclass"] = metered_pool_class(pool_name, engine_kind)
+    options["pool_pre_ping"] = settings.DB_POOL_PRE_PING
+    options["pool_recycle"] = settings.DB_POOL_RECYCLE
+    
+    if pool_name == "queue":
+        options["pool_size"] = settings.DB_POOL_SIZE
+        options["max_overflow"] = settings.DB_MAX_OVERFLOW
+        options["pool_timeout"] = settings.DB_POOL_TIMEOUT
+    return options
 
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=StaticPool,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+database_url = shared_memory_url(settings.DATABASE_URL)
+engine = create_engine(database_url, **engine_options(database_url))
+get_pool_metrics().attach(engine.pool)
+
+def enable_sqlite_wal(engine) -> None:
+    """Let SQLite readers run while another connection writes (local runs share one file between both engines)"""
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+def is_file_sqlite(url: str) -> bool:
+    """True for SQLite databases stored in a file"""
+    return make_url(url).get_backend_name() == "sqlite" and not is_memory_sqlite(url)
 
-# Create session factory
+if is_file_sqlite(database_url):
+    enable_sqlite_wal(engine)
+
+# Optional read replica for the routes on get_read_db (app/core/read_replica.py)
+replica_engine = None
+if settings.READ_REPLICA_URL:
+    replica_engine = create_engine(settings.READ_REPLICA_URL, **engine_options(settings.READ_REPLICA_URL, "replica"))
+    get_pool_metrics("replica").attach(replica_engine.pool)
+    if is_file_sqlite(settings.READ_REPLICA_URL):
+        enable_sqlite_wal(replica_engine)
+
+# Async engines for async def endpoints, keyed by pool metrics name
+_async_engines: Dict[str, AsyncEngine] = {}
+_async_engines_lock = threading.Lock()
+
+def get_async_engine(engine_kind: str = "async") -> AsyncEngine:
+    """Async engine on the primary ("async") or the read replica ("replica_async"), created on first use
+    
+    Scripts that only use the sync engine never create it, so they keep
+    working with databases that have no async driver configured.
+    """
+    with _async_engines_lock:
+        if engine_kind not in _async_engines:
+            url = settings.READ_REPLICA_URL if engine_kind == "replica_async" else database_url
+            async_engine = create_async_engine(async_database_url(url), **engine_options(url, engine_kind))
+            get_pool_metrics(engine_kind).attach(async_engine.sync_engine.pool)
+            if is_file_sqlite(url):
+                enable_sqlite_wal(async_engine.sync_engine)
+            _async_engines[engine_kind] = async_engine
+        return _async_engines[engine_kind]
+
+class LazyAsyncSessionmaker:
+    """async_sessionmaker bound to an async engine that is only created when the first session is"""
+    
+    def __init__(self, engine_kind: str):
+        self.engine_kind = engine_kind
+        self._sessionmaker = None
+    
+    def __call__(self) -> AsyncSession:
+        if self._sessionmaker is None:
+            self._sessionmaker = async_sessionmaker(get_async_engine(self.engine_kind), autoflush=False, expire_on_commit=False)
+        return self._sessionmaker()
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = LazyAsyncSessionmaker("async")
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine or engine)
+AsyncReplicaSessionLocal = LazyAsyncSessionmaker("replica_async" if settings.READ_REPLICA_URL else "async")
 
 # Create base class for models
 Base = declarative_base()
@@ -23,4 +139,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -0,0 +1,108 @@
+import os
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import DBAPIError
+
+from app.core.database import engine, is_memory_sqlite
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+# Revision matching the tables create_all made before the schema was versioned
+BASELINE_REVISION = "0000"
+
+# Key of the PostgreSQL advisory lock held while migrating
+MIGRATION_LOCK_KEY = zlib.crc32(b"passion_detection.migrations")
+
+def alembic_config(connection=None) -> Config:
+    """Alembic config for the bundled migrations, optionally bound to a connection"""
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["connection"] = connection
+    return config
+
+def head_revision() -> Optional[str]:
+    """Latest revision shipped with the code (read from the migration files)"""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+def current_revision(bind: Engine = engine) -> Optional[str]:
+    """Revision recorded in the database, None when it has never been migrated"""
+    try:
+        with bind.connect() as connection:
+            return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except DBAPIError:
+        return None
+
+@contextmanager
+def migration_lock(bind: Engine):
+    """Serialize migrations between the processes that start against one database"""
+    url = make_url(str(bind.url))
+    if bind.dialect.name == "postgresql":
+        with bind.connect() as connection:
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            connection.commit()
+            try:
+                yield
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+                connection.commit()
+    
+    elif bind.dialect.name == "sqlite" and not is_memory_sqlite(str(url)):
+        # SQLite has no advisory locks, use a lock file beside the database
+        import fcntl
+        with open(f"{os.path.abspath(url.database)}.migrate.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    else:
+        yield
+
+def upgrade_database(bind: Engine = engine) -> bool:
+    """Bring the schema to the head revision, returns True when anything ran
+    
+    An up-to-date database costs one indexed read of alembic_version. Otherwise
+    the first process to take the migration lock migrates and the others
+    re-check once it is released. A database created by create_all before
+    migrations existed is stamped at the baseline revision and upgraded from
+    there.
+    """
+    head = head_revision()
+    if current_revision(bind) == head:
+        return False
+    
+    with migration_lock(bind):
+        current = current_revision(bind)
+        if current == head:
+            return False
+        
+        with bind.connect() as connection:
+            unversioned = current is None and inspect(connection).has_table("users")
+            # Alembic manages its own transactions (and autocommit blocks)
+            connection.commit()
+            
+            config = alembic_config(connection)
+            if unversioned:
+                command.stamp(config, BASELINE_REVISION)
+            command.upgrade(config, "head")
+            connection.commit()
+    return True
+
+def ensure_schema(bind: Engine = engine, migrate: bool = True) -> bool:
+    """Startup check: migrate when allowed, otherwise refuse to run on an old schema"""
+    if migrate:
+        return upgrade_database(bind)
+    
+    current, head = current_revision(bind), head_revision()
+    if current != head:
+        raise RuntimeError(f"Database schema is at revision {current}, expected {head}; run `alembic upgrade head`")
+    return False
\ No newline at end of file
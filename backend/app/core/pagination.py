@@ -0,0 +1,80 @@
+"""
+Keyset Pagination
+Paged list endpoints order their rows by a sort key ending in a unique column
+(usually id), return one page and put an opaque cursor for the next page in
+the X-Next-Cursor response header. The next page starts strictly after the
+last row's key values, so it is an index range scan however deep it is (no
+OFFSET rows to skip) and rows inserted meanwhile do not shift the pages.
+"""
+
+import json
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import String, literal, tuple_, type_coerce
+from sqlalchemy.orm import Query as ORMQuery
+
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+class PageParams:
+    """cursor and limit query parameters of a paged list endpoint"""
+    
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description=f"Cursor from the previous page's {NEXT_CURSOR_HEADER} header"),
+        limit: Optional[int] = Query(None, ge=1, le=settings.PAGE_SIZE_MAX, description=f"Page size (default {settings.PAGE_SIZE_DEFAULT})")
+    ):
+        self.cursor = cursor
+        self.limit = limit or settings.PAGE_SIZE_DEFAULT
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor holding the key values of a page's last row"""
+    payload = [{"dt": value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, keys: Sequence) -> List[Any]:
+    """Bound key values of a cursor, raising 400 for a cursor this list did not issue"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(payload, list) or len(payload) != len(keys):
+            raise ValueError("cursor does not match the sort key")
+        
+        values = []
+        for key, value in zip(keys, payload):
+            if isinstance(value, dict):
+                values.append(literal(datetime.fromisoformat(value["dt"]), key.type))
+            elif isinstance(value, str):
+                # Datetimes read back from SQLite as stored text compare as text
+                values.append(literal(value, String()))
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                values.append(literal(value, key.type))
+            else:
+                raise ValueError(f"unexpected cursor value {value!r}")
+        return values
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def paginate(query: ORMQuery, keys: Sequence, page: PageParams, response: Response, descending: bool = False) -> list:
+    """One page of query ordered by keys, setting the cursor header when more rows follow
+    
+    keys are non-null columns whose last one is unique, e.g.
+    (GameSession.created_at, GameSession.id), all sorted in one direction.
+    """
+    if page.cursor:
+        position, after = tuple_(*keys), tuple_(*decode_cursor(page.cursor, keys))
+        query = query.filter(position < after if descending else position > after)
+    query = query.order_by(*[key.desc() if descending else key.asc() for key in keys])
+    
+    # The keys are also selected as stored (SQLite datetimes unparsed), so a
+    # cursor compares equal to its row and never repeats or skips it
+    rows = query.add_columns(*[type_coerce(key, String) for key in keys]).limit(page.limit + 1).all()
+    if len(rows) > page.limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[page.limit - 1][1:])
+    return [row[0] for row in rows[:page.limit]]
\ No newline at end of file
@@ -0,0 +1,115 @@
+import re
+import zlib
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+from app.core.database import engine
+
+# Tables range-partitioned by month on PostgreSQL: table -> partition key
+PARTITIONED_TABLES = {
+    "game_sessions": "created_at"
+}
+
+# Key of the transaction-level advisory lock taken while adding partitions
+PARTITION_LOCK_KEY = zlib.crc32(b"passion_detection.partitions")
+
+PARTITION_NAME = re.compile(r"^(?P<table>\w+)_(?:y\d{4}m\d{2}|default)$")
+
+def month_start(value: date) -> date:
+    """First day of the month containing value"""
+    return date(value.year, value.month, 1)
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month months after month"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition holding month, e.g. game_sessions_y2026m10"""
+    return f"{table}_y{month:%Y}m{month:%m}"
+
+def is_partition(name: str) -> bool:
+    """True for the month and default partitions of a partitioned table"""
+    match = PARTITION_NAME.match(name)
+    return bool(match) and match.group("table") in PARTITIONED_TABLES
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    """True when table is a partitioned table on this database"""
+    if connection.dialect.name != "postgresql":
+        return False
+    return connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+        {"table": table}
+    ).scalar()
+
+def existing_partitions(connection: Connection, table: str) -> List[str]:
+    """Names of the partitions attached to table"""
+    return connection.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = to_regclass(:table) ORDER BY child.relname"
+    ), {"table": table}).scalars().all()
+
+def months_between(first_month: date, last_month: date) -> List[date]:
+    """First days of the months from first_month to last_month inclusive"""
+    months = []
+    month = month_start(first_month)
+    while month <= last_month:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+def month_partition_statements(table: str, month: date) -> List[str]:
+    """DDL attaching the partition of table for month"""
+    column = PARTITIONED_TABLES[table]
+    name = partition_name(table, month)
+    start, end = month, add_months(month, 1)
+    return [
+        f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        # Rows of a month without a partition land in the default one and
+        # have to move before the range can be attached
+        f"WITH moved AS (DELETE FROM {table}_default WHERE {column} >= '{start}' AND {column} < '{end}' RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved",
+        f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"
+    ]
+
+def missing_months(connection: Connection, table: str, first_month: date, last_month: date) -> List[date]:
+    """Months from first_month to last_month that have no partition yet"""
+    existing = set(existing_partitions(connection, table))
+    return [month for month in months_between(first_month, last_month) if partition_name(table, month) not in existing]
+
+def ensure_month_partitions(connection: Connection, table: str, first_month: date, last_month: date) -> List[str]:
+    """Create the missing monthly partitions of table from first_month to last_month"""
+    if not missing_months(connection, table, first_month, last_month):
+        return []
+    
+    # Another worker may be adding the same partitions
+    connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+    created = []
+    for month in missing_months(connection, table, first_month, last_month):
+        for statement in month_partition_statements(table, month):
+            connection.execute(text(statement))
+        created.append(partition_name(table, month))
+    return created
+
+def ensure_partitions(bind: Engine = engine, months_ahead: Optional[int] = None, since: Optional[date] = None) -> List[str]:
+    """Create partitions from since (default: this month) to months_ahead months ahead
+    
+    A no-op outside PostgreSQL, where the tables stay plain. When every
+    partition exists this only reads the catalog, so it runs at each startup.
+    """
+    if bind.dialect.name != "postgresql":
+        return []
+    
+    months_ahead = settings.SESSION_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    this_month = month_start(date.today())
+    created = []
+    with bind.begin() as connection:
+        for table in PARTITIONED_TABLES:
+            if is_partitioned(connection, table):
+                created.extend(ensure_month_partitions(connection, table, since or this_month, add_months(this_month, months_ahead)))
+    return created
\ No newline at end of file
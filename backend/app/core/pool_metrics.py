@@ -0,0 +1,133 @@
+"""
+Connection Pool Metrics
+Checkout wait times, timeouts and connections in use for the database engine
+pool, used to size DB_POOL_SIZE and DB_MAX_OVERFLOW under load. Pools are
+subclassed so the time spent waiting in connect() is measured, and in-use
+counts follow the pool's checkout/checkin events. The sync and async engines
+report separately.
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, Optional
+
+import numpy as np
+from sqlalchemy import event, exc
+from sqlalchemy.pool import Pool, QueuePool, AsyncAdaptedQueuePool, NullPool, StaticPool
+
+WAIT_SAMPLES = 10000  # Recent checkout waits kept for percentiles
+
+class PoolMetrics:
+    """Thread-safe counters for one engine pool"""
+    
+    def __init__(self, samples: int = WAIT_SAMPLES):
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=samples)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.in_use = 0
+        self.in_use_peak = 0
+        self.connections_opened = 0
+        self.invalidations = 0
+        self.pool: Optional[Pool] = None
+    
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self._waits.append(seconds)
+    
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+    
+    def attach(self, pool: Pool) -> None:
+        """Follow a pool's connection lifecycle events"""
+        self.pool = pool
+        
+        @event.listens_for(pool, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connections_opened += 1
+        
+        @event.listens_for(pool, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            with self._lock:
+                self.in_use += 1
+                self.in_use_peak = max(self.in_use_peak, self.in_use)
+        
+        @event.listens_for(pool, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            with self._lock:
+                self.in_use -= 1
+        
+        @event.listens_for(pool, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidations += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Checkout wait percentiles (ms), timeouts and pool occupancy"""
+        with self._lock:
+            waits = np.array(self._waits) * 1000
+            result = {
+                "pool_class": type(self.pool).__name__ if self.pool is not None else None,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_mean": self.wait_seconds_total * 1000 / self.checkouts if self.checkouts else 0.0,
+                "wait_ms_p50": float(np.percentile(waits, 50)) if len(waits) else 0.0,
+                "wait_ms_p95": float(np.percentile(waits, 95)) if len(waits) else 0.0,
+                "wait_ms_p99": float(np.percentile(waits, 99)) if len(waits) else 0.0,
+                "wait_ms_max": self.wait_seconds_max * 1000,
+                "in_use": self.in_use,
+                "in_use_peak": self.in_use_peak,
+                "connections_opened": self.connections_opened,
+                "invalidations": self.invalidations
+            }
+        
+        if isinstance(self.pool, QueuePool):
+            result.update({
+                "pool_size": self.pool.size(),
+                "idle": self.pool.checkedin(),
+                "overflow": max(self.pool.overflow(), 0),  # negative while below pool_size
+                "max_overflow": self.pool._max_overflow,
+                "timeout_seconds": self.pool.timeout()
+            })
+        return result
+
+_pool_metrics = {"sync": PoolMetrics(), "async": PoolMetrics(), "replica": PoolMetrics(), "replica_async": PoolMetrics()}
+
+def get_pool_metrics(engine_kind: str = "sync") -> PoolMetrics:
+    """Return the metrics of an application engine pool (sync, async, replica or replica_async)"""
+    return _pool_metrics[engine_kind]
+
+class MeteredPoolMixin:
+    """Times connect(), i.e. the wait for a free (or new) connection"""
+    
+    metrics: PoolMetrics
+    
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+POOL_CLASSES = {
+    "queue": QueuePool,
+    "null": NullPool,
+    "static": StaticPool
+}
+ASYNC_POOL_CLASSES = dict(POOL_CLASSES, queue=AsyncAdaptedQueuePool)
+
+def metered_pool_class(name: str, engine_kind: str = "sync") -> type:
+    """Pool class of a DB_POOL_CLASS name that reports into the engine's metrics"""
+    base = (ASYNC_POOL_CLASSES if engine_kind.endswith("async") else POOL_CLASSES)[name]
+    return type(f"Metered{base.__name__}", (MeteredPoolMixin, base), {"metrics": _pool_metrics[engine_kind]})
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Read Replica Routing
+get_read_db and get_async_read_db give the analytics, passions and catalog
+read endpoints a session on READ_REPLICA_URL, keeping their heavy queries off
+the primary that takes the session telemetry writes. A replica lags behind,
+so after a user's successful write request their reads go to the primary for
+READ_YOUR_WRITES_SECONDS: the worker that served the write remembers the user,
+and a cookie carries the deadline to the other workers. Without a replica
+every read uses the primary.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request
+from starlette.responses import Response
+
+from app.core.auth import verify_token
+from app.core.config import settings
+from app.core.database import SessionLocal, AsyncSessionLocal, ReplicaSessionLocal, AsyncReplicaSessionLocal, replica_engine
+
+# Requests that count as writes once they succeed
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# Cookie holding the epoch time until which the client reads from the primary
+PRIMARY_READS_COOKIE = "primary_reads_until"
+
+class RecentWrites:
+    """Thread-safe per-user deadlines until which reads stay on the primary"""
+    
+    def __init__(self, window_seconds: float = 5.0, max_users: int = 100000):
+        self.window_seconds = window_seconds
+        self.max_users = max_users
+        self._until: "OrderedDict[int, float]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def record(self, user_id: int) -> None:
+        """Note a write by user_id now"""
+        with self._lock:
+            self._until[user_id] = time.monotonic() + self.window_seconds
+            self._until.move_to_end(user_id)
+            # The oldest entries are the first to expire
+            while len(self._until) > self.max_users:
+                self._until.popitem(last=False)
+    
+    def is_recent(self, user_id: int) -> bool:
+        """True while user_id's last write is within the window"""
+        with self._lock:
+            until = self._until.get(user_id)
+            if until is None:
+                return False
+            if until <= time.monotonic():
+                del self._until[user_id]
+                return False
+            return True
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._until.clear()
+
+_recent_writes: Optional[RecentWrites] = None
+_recent_writes_lock = threading.Lock()
+
+def get_recent_writes() -> RecentWrites:
+    """Return the process-wide write tracker"""
+    global _recent_writes
+    if _recent_writes is None:
+        with _recent_writes_lock:
+            if _recent_writes is None:
+                _recent_writes = RecentWrites(settings.READ_YOUR_WRITES_SECONDS)
+    return _recent_writes
+
+def request_user_id(request: Request) -> Optional[int]:
+    """User id of a request's valid bearer token, without a database lookup"""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = verify_token(token)
+    try:
+        return int(payload["sub"]) if payload else None
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def reads_from_primary(request: Request) -> bool:
+    """True when a read request has to see the primary (no replica, or a recent write)"""
+    if replica_engine is None:
+        return True
+    
+    user_id = request_user_id(request)
+    if user_id is not None and get_recent_writes().is_recent(user_id):
+        return True
+    
+    try:
+        return float(request.cookies.get(PRIMARY_READS_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+async def track_writes(request: Request, call_next) -> Response:
+    """HTTP middleware pinning a user's reads to the primary after a successful write"""
+    response = await call_next(request)
+    if replica_engine is not None and request.method in WRITE_METHODS and response.status_code < 400:
+        user_id = request_user_id(request)
+        if user_id is not None:
+            get_recent_writes().record(user_id)
+            window = settings.READ_YOUR_WRITES_SECONDS
+            response.set_cookie(PRIMARY_READS_COOKIE, f"{time.time() + window:.3f}", max_age=max(int(window + 0.999), 1), httponly=True, samesite="lax")
+    return response
+
+def get_read_db(request: Request):
+    """Dependency to get a database session for reads, on the replica when possible"""
+    db = SessionLocal() if reads_from_primary(request) else ReplicaSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db(request: Request):
+    """Dependency to get an async database session for reads, on the replica when possible"""
+    session_factory = AsyncSessionLocal if reads_from_primary(request) else AsyncReplicaSessionLocal
+    async with session_factory() as db:
+        yield db
\ No newline at end of file
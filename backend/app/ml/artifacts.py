@@ -0,0 +1,57 @@
+"""
+Artifact Publishing
+Model versions and the similarity index are written into a fresh build
+directory beside their served path, which is a symlink to the current build.
+Publishing replaces that symlink with a single rename, so a reader resolving
+the path sees either the old build or the new one and never a missing or
+partial directory. The previous build is kept for readers still holding it.
+"""
+
+import os
+import shutil
+import tempfile
+from typing import List
+
+def new_build_directory(path: str) -> str:
+    """Create an empty build directory beside the served path"""
+    parent, name = os.path.split(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f".{name}-", dir=parent)
+
+def publish_directory(build_dir: str, path: str, keep: int = 2) -> None:
+    """Atomically point path at build_dir and prune all but the newest keep builds"""
+    parent, name = os.path.split(os.path.abspath(path))
+    
+    if os.path.isdir(path) and not os.path.islink(path):
+        # A real directory from before builds were symlinked; moved aside once
+        os.replace(path, tempfile.mkdtemp(prefix=f".{name}-", dir=parent))
+    
+    # Relative target so the whole directory can be moved or mounted elsewhere
+    link = os.path.join(parent, f".{name}.link-{os.getpid()}")
+    if os.path.lexists(link):
+        os.remove(link)
+    os.symlink(os.path.basename(build_dir), link)
+    os.replace(link, path)
+    
+    _prune_builds(parent, name, build_dir, keep)
+
+def discard_build(build_dir: str) -> None:
+    """Remove a build directory that was not published"""
+    shutil.rmtree(build_dir, ignore_errors=True)
+
+def _prune_builds(parent: str, name: str, current: str, keep: int) -> None:
+    """Delete old build directories of one artifact, newest first kept"""
+    builds: List[str] = [
+        os.path.join(parent, entry) for entry in os.listdir(parent)
+        if entry.startswith(f".{name}-") and os.path.isdir(os.path.join(parent, entry))
+    ]
+    builds.sort(key=os.path.getmtime, reverse=True)
+    current = os.path.abspath(current)
+    kept = 1
+    for build in builds:
+        if os.path.abspath(build) == current:
+            continue
+        if kept < keep:
+            kept += 1
+            continue
+        shutil.rmtree(build, ignore_errors=True)
\ No newline at end of file
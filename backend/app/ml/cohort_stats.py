@@ -0,0 +1,231 @@
+"""
+Cohort Statistics
+Per-(age, domain) score histograms for comparing a child with their peers.
+Passion histograms count each child's active PassionDomain confidence and
+talent histograms each child's latest TalentAssessment score. Writes apply
++1/-1 deltas to fixed score buckets with an atomic upsert, so counts from
+any number of workers merge by addition; reads use an in-process cumulative
+table so a percentile lookup is a couple of array reads. A writer locks the
+child's row before reading the score it replaces, so two concurrent writes
+for one child cannot both remove the same previous score. Deleting a child
+takes its scores back out of the histograms first.
+"""
+
+import time
+import threading
+from collections import Counter
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import bindparam, func, text
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.core.config import settings
+from app.models.child import Child
+from app.models.passion import PassionDomain
+from app.models.question import TalentAssessment
+from app.models.cohort_stats import CohortScoreBin
+
+COHORT_BINS = 100  # Score buckets over [0, 1]
+PASSION = "passion"
+TALENT = "talent"
+
+# (age, domain, score, delta) with delta +1 when a child's score enters a bucket and -1 when it leaves
+ScoreDelta = Tuple[int, str, float, int]
+
+# Upsert constructs (INSERT ... ON CONFLICT DO UPDATE) for the supported dialects
+DIALECT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert
+}
+
+def score_bin(score: float) -> int:
+    """Histogram bucket of a score in [0, 1]"""
+    return min(max(int(float(score) * COHORT_BINS), 0), COHORT_BINS - 1)
+
+def record_score_deltas(db: Session, source: str, deltas: Iterable[ScoreDelta]) -> int:
+    """Add score deltas to the cohort histograms (the caller commits); returns the cells touched"""
+    cells = Counter()
+    for age, domain, score, delta in deltas:
+        if age is None or score is None:
+            continue
+        cells[(age, domain, score_bin(score))] += delta
+    
+    rows = [
+        {"source": source, "age": age, "domain": domain, "bin": bin_index, "count": delta}
+        for (age, domain, bin_index), delta in sorted(cells.items()) if delta
+    ]
+    if not rows:
+        return 0
+    
+    dialect = db.get_bind().dialect.name
+    if dialect not in DIALECT_INSERTS:
+        raise ValueError(f"Cohort histogram upserts are not supported on {dialect} databases")
+    
+    # Increment in place; concurrent writers never overwrite each other's counts
+    statement = DIALECT_INSERTS[dialect](CohortScoreBin)
+    statement = statement.on_conflict_do_update(
+        index_elements=["source", "age", "domain", "bin"],
+        set_={"count": CohortScoreBin.count + statement.excluded["count"], "updated_at": func.now()}
+    )
+    db.execute(statement, rows)
+    
+    invalidate_cohort_percentiles()
+    return len(rows)
+
+def lock_children(db: Session, child_ids: Iterable[int]) -> Dict[int, Optional[int]]:
+    """Lock the children's rows until the caller commits and return their ages
+    
+    Taken before reading the scores a write replaces, so concurrent writers for
+    one child run one after the other; ids are locked in order to avoid
+    deadlocks between batches.
+    """
+    child_ids = sorted(child_ids)
+    if db.get_bind().dialect.name == "sqlite":
+        # No row locks: a no-op write takes the database write lock for the rest of the transaction
+        db.execute(text("UPDATE children SET id = id WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)), {"ids": child_ids})
+    return dict(db.query(Child.id, Child.age).filter(
+        Child.id.in_(child_ids)
+    ).order_by(Child.id).with_for_update().all())
+
+def remove_child_scores(db: Session, child_id: int) -> int:
+    """Take a child's current scores out of the histograms before it is deleted (the caller commits)"""
+    age = lock_children(db, [child_id]).get(child_id)
+    
+    passion_deltas = [
+        (age, domain, confidence, -1)
+        for domain, confidence in db.query(PassionDomain.domain, PassionDomain.confidence_score).filter(
+            PassionDomain.child_id == child_id,
+            PassionDomain.is_active == True
+        )
+    ]
+    latest = db.query(TalentAssessment.talent_domains).filter(
+        TalentAssessment.child_id == child_id
+    ).order_by(TalentAssessment.id.desc()).first()
+    
+    return (
+        record_score_deltas(db, PASSION, passion_deltas)
+        + record_score_deltas(db, TALENT, talent_score_deltas(age, latest.talent_domains if latest else None, None))
+    )
+
+def talent_score_deltas(age: Optional[int], previous: Optional[Dict[str, float]], current: Optional[Dict[str, float]]) -> List[ScoreDelta]:
+    """Deltas replacing a child's previous latest assessment scores with the new ones"""
+    deltas = [(age, domain, score, -1) for domain, score in (previous or {}).items()]
+    deltas.extend((age, domain, score, 1) for domain, score in (current or {}).items())
+    return deltas
+
+def rebuild_cohort_stats(db: Session, batch_size: int = 1000) -> Dict[str, int]:
+    """Recompute every histogram from current data, e.g. after ages roll over (commits)"""
+    db.query(CohortScoreBin).delete(synchronize_session=False)
+    
+    # Active passion domains, each child counted at its current age
+    passion_deltas = (
+        (age, domain, confidence, 1)
+        for domain, confidence, age in db.query(
+            PassionDomain.domain, PassionDomain.confidence_score, Child.age
+        ).join(Child, Child.id == PassionDomain.child_id).filter(
+            PassionDomain.is_active == True
+        ).yield_per(batch_size)
+    )
+    passion_cells = record_score_deltas(db, PASSION, passion_deltas)
+    
+    # Latest talent assessment of every child
+    ranked = db.query(
+        TalentAssessment.child_id,
+        TalentAssessment.talent_domains,
+        func.row_number().over(
+            partition_by=TalentAssessment.child_id,
+            order_by=TalentAssessment.id.desc()
+        ).label("position")
+    ).subquery()
+    talent_deltas = (
+        delta
+        for talent_domains, age in db.query(ranked.c.talent_domains, Child.age).join(
+            Child, Child.id == ranked.c.child_id
+        ).filter(ranked.c.position == 1).yield_per(batch_size)
+        for delta in talent_score_deltas(age, None, talent_domains)
+    )
+    talent_cells = record_score_deltas(db, TALENT, talent_deltas)
+    
+    db.commit()
+    return {"passion_cells": passion_cells, "talent_cells": talent_cells}
+
+class CohortPercentiles:
+    """Cumulative histograms of every cohort, for O(1) percentile lookups"""
+    
+    def __init__(self, rows: Iterable[Tuple[str, int, str, int, int]]):
+        counts: Dict[Tuple[str, int, str], np.ndarray] = {}
+        for source, age, domain, bin_index, count in rows:
+            histogram = counts.setdefault((source, age, domain), np.zeros(COHORT_BINS, dtype=np.int64))
+            histogram[bin_index] += count
+        
+        # Children strictly below each bucket, plus the bucket itself
+        self._tables = {
+            key: (np.concatenate([[0], np.cumsum(histogram)[:-1]]), histogram, int(histogram.sum()))
+            for key, histogram in counts.items()
+        }
+    
+    def lookup(self, source: str, age: int, domain: str, score: float) -> Tuple[Optional[float], int]:
+        """(percentile, cohort size) of a score; percentile is None for an empty cohort"""
+        table = self._tables.get((source, age, domain))
+        if table is None or table[2] <= 0:
+            return None, 0
+        below, histogram, total = table
+        bin_index = score_bin(score)
+        # Mid-rank within the bucket so ties land in the middle
+        percentile = (below[bin_index] + 0.5 * histogram[bin_index]) / total * 100
+        return round(float(percentile), 1), total
+
+class CohortPercentilesCache:
+    """Process-wide snapshot of the histograms, reloaded periodically and after local writes"""
+    
+    def __init__(self, refresh_interval: float = 60.0):
+        self.refresh_interval = refresh_interval
+        self._percentiles: Optional[CohortPercentiles] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+    
+    def get(self, db: Session) -> CohortPercentiles:
+        """Return the current snapshot, reloading it once it is older than refresh_interval"""
+        percentiles = self._percentiles
+        if percentiles is not None and time.monotonic() - self._loaded_at < self.refresh_interval:
+            return percentiles
+        
+        with self._lock:
+            if self._percentiles is None or time.monotonic() - self._loaded_at >= self.refresh_interval:
+                self._percentiles = CohortPercentiles(db.query(
+                    CohortScoreBin.source, CohortScoreBin.age, CohortScoreBin.domain, CohortScoreBin.bin, CohortScoreBin.count
+                ).all())
+                self._loaded_at = time.monotonic()
+            return self._percentiles
+    
+    def invalidate(self) -> None:
+        """Reload on next use"""
+        self._loaded_at = 0.0
+
+_percentiles_cache: Optional[CohortPercentilesCache] = None
+_percentiles_cache_lock = threading.Lock()
+
+def get_percentiles_cache() -> CohortPercentilesCache:
+    """Return the process-wide cohort percentile cache"""
+    global _percentiles_cache
+    if _percentiles_cache is None:
+        with _percentiles_cache_lock:
+            if _percentiles_cache is None:
+                _percentiles_cache = CohortPercentilesCache(refresh_interval=settings.COHORT_STATS_REFRESH_SECONDS)
+    return _percentiles_cache
+
+def invalidate_cohort_percentiles() -> None:
+    """Make this worker's next lookup see freshly written counts"""
+    get_percentiles_cache().invalidate()
+
+def domain_percentiles(db: Session, source: str, age: int, scores: Dict[str, float]) -> List[Dict[str, Any]]:
+    """Percentile of each domain score within the child's age cohort"""
+    percentiles = get_percentiles_cache().get(db)
+    results = []
+    for domain, score in scores.items():
+        percentile, cohort_size = percentiles.lookup(source, age, domain, score)
+        results.append({"domain": domain, "score": score, "percentile": percentile, "cohort_size": cohort_size})
+    return results
\ No newline at end of file
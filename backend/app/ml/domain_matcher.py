@@ -0,0 +1,60 @@
+"""
+Domain Matcher
+Compiled keyword matcher mapping free text (game categories, interests) to the
+set of domains whose keywords appear in it. Each domain's keywords compile to
+one regex, and results are memoized per text since the same handful of
+categories and interests are matched over and over.
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, List, FrozenSet, Tuple
+
+class DomainMatcher:
+    """Case-insensitive substring matcher from text to matching domains"""
+    
+    def __init__(self, keyword_map: Dict[str, List[str]], cache_size: int = 65536):
+        self.domains = list(keyword_map)
+        self._patterns = [
+            (domain, re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords)))
+            for domain, keywords in keyword_map.items()
+            if keywords
+        ]
+        self.matches = lru_cache(maxsize=cache_size)(self._match)
+    
+    def _match(self, text: str) -> FrozenSet[str]:
+        """Domains with at least one keyword contained in the text"""
+        text_lower = text.lower()
+        return frozenset(domain for domain, pattern in self._patterns if pattern.search(text_lower))
+    
+    def domain_counts(self, counts: Dict[str, int]) -> Dict[str, int]:
+        """Sum {text: count} into {domain: count} for every domain"""
+        totals = dict.fromkeys(self.domains, 0)
+        for text, count in counts.items():
+            for domain in self.matches(text):
+                totals[domain] += count
+        return totals
+    
+    def count_matches(self, texts: List[str]) -> Dict[str, int]:
+        """Number of texts matching each domain"""
+        totals = dict.fromkeys(self.domains, 0)
+        for text in texts:
+            for domain in self.matches(text):
+                totals[domain] += 1
+        return totals
+
+_matchers: Dict[Tuple, DomainMatcher] = {}
+_matchers_lock = threading.Lock()
+
+def get_domain_matcher(keyword_map: Dict[str, List[str]]) -> DomainMatcher:
+    """Return the shared matcher for a keyword catalog, compiling it on first use or after it changes"""
+    key = tuple((domain, tuple(keywords)) for domain, keywords in keyword_map.items())
+    matcher = _matchers.get(key)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                matcher = DomainMatcher(keyword_map)
+                _matchers[key] = matcher
+    return matcher
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+Feature Store
+Running per-child aggregates maintained as sessions complete, so passion
+analysis reads one row instead of re-scanning a child's session history.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
+
+from app.models.child_features import ChildFeatures
+from app.models.session import GameSession
+from app.models.game import Game
+
+# Session columns feature extraction reads; the other telemetry stays unloaded
+FEATURE_COLUMNS = (
+    GameSession.id,
+    GameSession.child_id,
+    GameSession.game_id,
+    GameSession.status,
+    GameSession.duration_seconds,
+    GameSession.score,
+    GameSession.accuracy,
+    GameSession.speed_metrics,
+    GameSession.emotional_reactions
+)
+
+# Session fields whose change alters a completed session's contribution
+FEATURE_FIELDS = frozenset(column.key for column in FEATURE_COLUMNS) - {"id", "child_id"}
+
+# Aggregate columns copied from a rebuilt row onto the stored one
+AGGREGATE_COLUMNS = [column.key for column in ChildFeatures.__table__.columns if column.key not in ("id", "child_id", "created_at", "updated_at")]
+
+def new_child_features(child_id: int) -> ChildFeatures:
+    """Create an empty feature row for a child"""
+    return ChildFeatures(
+        child_id=child_id,
+        session_count=0,
+        duration_sum=0.0,
+        duration_sum_sq=0.0,
+        score_count=0,
+        score_sum=0.0,
+        score_sum_sq=0.0,
+        max_score=None,
+        accuracy_count=0,
+        accuracy_sum=0.0,
+        accuracy_sum_sq=0.0,
+        response_time_count=0,
+        response_time_sum=0.0,
+        emotional_count=0,
+        emotional_sum=0.0,
+        category_counts={},
+        game_ids=[],
+        last_session_id=None
+    )
+
+def apply_session(row: ChildFeatures, session: GameSession, category: Optional[str]) -> None:
+    """Fold one completed session into a child's running aggregates"""
+    duration = session.duration_seconds or 0
+    row.session_count += 1
+    row.duration_sum += duration
+    row.duration_sum_sq += duration * duration
+    
+    if session.score is not None:
+        row.score_count += 1
+        row.score_sum += session.score
+        row.score_sum_sq += session.score * session.score
+        row.max_score = session.score if row.max_score is None else max(row.max_score, session.score)
+    
+    if session.accuracy is not None:
+        row.accuracy_count += 1
+        row.accuracy_sum += session.accuracy
+        row.accuracy_sum_sq += session.accuracy * session.accuracy
+    
+    if session.speed_metrics:
+        response_times = session.speed_metrics.get('response_times', [])
+        row.response_time_count += len(response_times)
+        row.response_time_sum += sum(response_times)
+    
+    if session.emotional_reactions:
+        row.emotional_count += 1
+        row.emotional_sum += session.emotional_reactions.get('positive', 0)
+    
+    # JSON columns are reassigned so the change is tracked
+    if category is not None:
+        category_counts = dict(row.category_counts or {})
+        category_counts[category] = category_counts.get(category, 0) + 1
+        row.category_counts = category_counts
+    
+    game_ids = row.game_ids or []
+    if session.game_id not in game_ids:
+        row.game_ids = game_ids + [session.game_id]
+    
+    if session.id is not None:
+        row.last_session_id = max(row.last_session_id or 0, session.id)
+
+def record_completed_session(db: Session, session: GameSession) -> None:
+    """Update the feature store for a session that just completed (caller commits)"""
+    row = db.query(ChildFeatures).filter(
+        ChildFeatures.child_id == session.child_id
+    ).with_for_update().first()
+    
+    if not row:
+        # First completion seen for this child, seed the row from its full history
+        db.flush()
+        rebuild_child_features(db, session.child_id)
+        return
+    
+    game = db.query(Game).filter(Game.id == session.game_id).first()
+    apply_session(row, session, game.category if game else None)
+
+def record_session_update(db: Session, session: GameSession, was_completed: bool, changed_fields: Iterable[str]) -> bool:
+    """Keep the feature store in step with an updated session, returns True when the child's features changed (caller commits)"""
+    if session.status == "completed" and not was_completed:
+        record_completed_session(db, session)
+        return True
+    
+    # Aggregates cannot be un-applied, so a completed session that changed or left "completed" means a rebuild
+    if was_completed and (session.status != "completed" or FEATURE_FIELDS.intersection(changed_fields)):
+        db.flush()
+        rebuild_child_features(db, session.child_id)
+        return True
+    
+    return False
+
+def features_from_store(row: ChildFeatures) -> Dict[str, Any]:
+    """Build the extract_features dictionary from a feature row"""
+    count = row.session_count
+    
+    features = {}
+    features['total_sessions'] = count
+    features['completed_sessions'] = count
+    features['completion_rate'] = 1.0 if count > 0 else 0
+    
+    features['total_play_time'] = row.duration_sum / 60  # Convert to minutes
+    features['avg_session_duration'] = row.duration_sum / count if count else 0
+    
+    features['avg_score'] = row.score_sum / row.score_count if row.score_count else 0
+    features['max_score'] = row.max_score if row.score_count else 0
+    
+    features['category_preferences'] = dict(row.category_counts or {})
+    
+    features['avg_response_time'] = row.response_time_sum / row.response_time_count if row.response_time_count else 0
+    features['avg_accuracy'] = row.accuracy_sum / row.accuracy_count if row.accuracy_count else 0
+    
+    features['emotional_engagement'] = row.emotional_sum / row.emotional_count if row.emotional_count else 0
+    
+    return features
+
+def stream_feature_rows(db: Session, child_ids: Optional[Any] = None, batch_size: int = 1000) -> Iterable[ChildFeatures]:
+    """Stream completed sessions child by child and yield transient feature rows (child_ids may be a list or a subquery)"""
+    categories = {game_id: category for game_id, category in db.query(Game.id, Game.category).all()}
+    
+    query = db.query(GameSession).options(load_only(*FEATURE_COLUMNS)).filter(GameSession.status == "completed")
+    if child_ids is not None:
+        query = query.filter(GameSession.child_id.in_(child_ids))
+    
+    row = None
+    for session in query.order_by(GameSession.child_id, GameSession.id).yield_per(batch_size):
+        if row is None or row.child_id != session.child_id:
+            if row is not None:
+                yield row
+            row = new_child_features(session.child_id)
+        apply_session(row, session, categories.get(session.game_id))
+    
+    if row is not None:
+        yield row
+
+def rebuild_feature_store(db: Session, child_ids: Optional[List[int]] = None, batch_size: int = 1000) -> int:
+    """Reconstruct feature rows from raw sessions, returning the number of rows written"""
+    delete_query = db.query(ChildFeatures)
+    if child_ids is not None:
+        delete_query = delete_query.filter(ChildFeatures.child_id.in_(child_ids))
+    delete_query.delete(synchronize_session=False)
+    
+    # Build in a separate pass so the session stream is not interleaved with writes
+    rows = list(stream_feature_rows(db, child_ids, batch_size))
+    db.add_all(rows)
+    db.commit()
+    
+    return len(rows)
+
+def rebuild_child_features(db: Session, child_id: int) -> None:
+    """Recompute one child's feature row, e.g. after a completed session is deleted (caller commits)"""
+    # The stored row is locked before the sessions are read, so concurrent rebuilds run one after the other
+    row = db.query(ChildFeatures).filter(ChildFeatures.child_id == child_id).with_for_update().first()
+    rows = list(stream_feature_rows(db, [child_id]))
+    fresh = rows[0] if rows else None
+    
+    if fresh is None:
+        if row is not None:
+            db.delete(row)
+        return
+    
+    if row is not None:
+        for key in AGGREGATE_COLUMNS:
+            setattr(row, key, getattr(fresh, key))
+        return
+    
+    try:
+        with db.begin_nested():
+            db.add(fresh)
+    except IntegrityError:
+        # Another transaction seeded the row first; rebuild onto it (it did not see this one's sessions)
+        rebuild_child_features(db, child_id)
+
+def verify_feature_store(db: Session, batch_size: int = 1000, tolerance: float = 1e-6) -> List[int]:
+    """Compare stored features against a rebuild from raw sessions and return mismatching child ids"""
+    stored = {row.child_id: row for row in db.query(ChildFeatures).all()}
+    mismatched = []
+    
+    for fresh in stream_feature_rows(db, None, batch_size):
+        row = stored.pop(fresh.child_id, None)
+        if row is None or not _features_match(features_from_store(row), features_from_store(fresh), tolerance):
+            mismatched.append(fresh.child_id)
+    
+    # Rows left over have no completed sessions behind them
+    mismatched.extend(child_id for child_id, row in stored.items() if row.session_count)
+    
+    return sorted(mismatched)
+
+def _features_match(stored: Dict[str, Any], fresh: Dict[str, Any], tolerance: float) -> bool:
+    """Check two feature dictionaries for equality within a float tolerance"""
+    for key, value in fresh.items():
+        if isinstance(value, dict):
+            if stored[key] != value:
+                return False
+        elif abs(stored[key] - value) > tolerance * max(1.0, abs(value)):
+            return False
+    return True
\ No newline at end of file
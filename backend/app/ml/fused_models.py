@@ -0,0 +1,223 @@
+"""
+Fused Domain Models
+Compiles the per-domain classifiers into one multi-output representation so
+that every domain score for N rows comes from a single vectorized evaluation
+instead of one predict_proba call (and its input validation) per domain.
+Each compiled model is checked against the per-domain predict_proba output on
+a probe matrix, and any domain that disagrees, or whose fused evaluation
+fails at prediction time, is scored by its own model instead.
+"""
+
+from typing import Dict, Iterable, List, Any, Set
+
+import numpy as np
+from scipy.special import expit
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.ensemble import RandomForestClassifier, ExtraTreesClassifier
+
+class FusedDomainModel:
+    """Multi-output evaluation of binary per-domain classifiers"""
+    
+    # Above this many rows sklearn's compiled per-tree traversal beats the packed numpy walk,
+    # so large batches evaluate tree domains with one predict_proba call per domain instead
+    PACKED_TREE_MAX_ROWS = 256
+    
+    # Rows of the probe matrix compared against predict_proba after compiling
+    PARITY_ROWS = 64
+    
+    def __init__(self, domains: List[str], models: Dict[str, Any], fallback_domains: Iterable[str] = ()):
+        self.domains = list(domains)
+        self.linear_domains = []
+        self.linear_models = []
+        self.tree_domains = []
+        self.tree_models = []
+        self.fallback_models = {}
+        self.n_features = None  # Input width shared by every compiled domain
+        
+        linear_coefs = []
+        linear_intercepts = []
+        trees_by_domain = []
+        
+        for column, domain in enumerate(self.domains):
+            model = models.get(domain)
+            if model is None:
+                continue
+            
+            width = getattr(model, "n_features_in_", None)
+            if domain in fallback_domains or width is None or self.n_features not in (None, width):
+                self.fallback_models[column] = model
+                continue
+            
+            if _is_binary_linear(model):
+                self.linear_domains.append(column)
+                self.linear_models.append(model)
+                linear_coefs.append(np.asarray(model.coef_[0], dtype=np.float64))
+                linear_intercepts.append(float(model.intercept_[0]))
+            elif _is_binary_tree_model(model):
+                self.tree_domains.append(column)
+                self.tree_models.append(model)
+                trees_by_domain.append(_estimators(model))
+            else:
+                # Pipelines, boosting and anything else keep their own predict_proba
+                self.fallback_models[column] = model
+                continue
+            self.n_features = width
+        
+        # Stacked linear weights: one column per linear domain
+        if linear_coefs:
+            self.coef = np.stack(linear_coefs, axis=1)
+            self.intercept = np.array(linear_intercepts)
+        else:
+            self.coef = None
+            self.intercept = None
+        
+        self._pack_trees(trees_by_domain)
+        
+        mismatched = self._parity_mismatches(models)
+        if mismatched:
+            print(f"Fused model disagrees with predict_proba for {sorted(mismatched)}, using their own models")
+            self.__init__(domains, models, set(fallback_domains) | mismatched)
+    
+    def _parity_mismatches(self, models: Dict[str, Any]) -> Set[str]:
+        """Compiled domains whose fused scores differ from their model's predict_proba on a probe matrix"""
+        compiled = self.linear_domains + self.tree_domains
+        if not compiled:
+            return set()
+        
+        # Non-negative features spanning a few magnitudes, like the session aggregates
+        rng = np.random.default_rng(0)
+        X = rng.random((self.PARITY_ROWS, self.n_features)) * 10.0 ** rng.integers(-1, 4, size=self.n_features)
+        X[0] = 0.0
+        X[1] = np.round(X[1])
+        
+        fused = self.predict(X)
+        reference = np.zeros_like(fused)
+        self._predict_columns(X, reference, {column: models[self.domains[column]] for column in compiled})
+        return {
+            self.domains[column] for column in compiled
+            if not np.allclose(fused[:, column], reference[:, column], rtol=0.0, atol=1e-9)
+        }
+    
+    def _pack_trees(self, trees_by_domain: List[List[Any]]) -> None:
+        """Pack every tree of every tree-based domain into flat node arrays"""
+        left, right, feature, threshold, leaf_value = [], [], [], [], []
+        roots = []
+        trees_per_domain = []
+        offset = 0
+        max_depth = 0
+        
+        for trees in trees_by_domain:
+            trees_per_domain.append(len(trees))
+            for tree in trees:
+                t = tree.tree_
+                roots.append(offset)
+                
+                # Child pointers move into the shared node index space; leaves keep -1
+                children_left = t.children_left.astype(np.int64)
+                children_right = t.children_right.astype(np.int64)
+                left.append(np.where(children_left >= 0, children_left + offset, -1))
+                right.append(np.where(children_right >= 0, children_right + offset, -1))
+                feature.append(np.maximum(t.feature, 0).astype(np.int64))
+                threshold.append(t.threshold.astype(np.float64))
+                
+                # Normalized positive-class probability per node, as DecisionTreeClassifier.predict_proba
+                values = t.value[:, 0, :]
+                totals = values.sum(axis=1)
+                totals[totals == 0] = 1.0
+                leaf_value.append(values[:, 1] / totals)
+                
+                offset += t.node_count
+                max_depth = max(max_depth, t.max_depth)
+        
+        self.tree_roots = np.array(roots, dtype=np.int64)
+        self.trees_per_domain = np.array(trees_per_domain, dtype=np.int64)
+        self.max_depth = max_depth
+        if roots:
+            self.node_left = np.concatenate(left)
+            self.node_right = np.concatenate(right)
+            self.node_feature = np.concatenate(feature)
+            self.node_threshold = np.concatenate(threshold)
+            self.node_value = np.concatenate(leaf_value)
+    
+    def predict(self, feature_matrix: np.ndarray) -> np.ndarray:
+        """Positive-class probability for every row and domain, shape (rows, domains)"""
+        X = np.asarray(feature_matrix, dtype=np.float64)
+        n_rows = X.shape[0]
+        scores = np.zeros((n_rows, len(self.domains)))
+        if n_rows == 0:
+            return scores
+        
+        # Linear domains: one matrix product for all of them
+        if self.coef is not None:
+            try:
+                logits = X @ self.coef + self.intercept
+                scores[:, self.linear_domains] = expit(logits)
+            except Exception as e:
+                print(f"Error in fused linear prediction, using per-domain models: {e}")
+                self._predict_columns(X, scores, dict(zip(self.linear_domains, self.linear_models)))
+        
+        # Tree domains: walk every (row, tree) pair down the packed forest at once
+        if len(self.tree_roots):
+            tree_models = dict(zip(self.tree_domains, self.tree_models))
+            if n_rows <= self.PACKED_TREE_MAX_ROWS:
+                try:
+                    scores[:, self.tree_domains] = self._predict_trees(X)
+                except Exception as e:
+                    print(f"Error in fused tree prediction, using per-domain models: {e}")
+                    self._predict_columns(X, scores, tree_models)
+            else:
+                self._predict_columns(X, scores, tree_models)
+        
+        self._predict_columns(X, scores, self.fallback_models)
+        return scores
+    
+    def _predict_columns(self, X: np.ndarray, scores: np.ndarray, models: Dict[int, Any]) -> None:
+        """Fill score columns from each model's own predict_proba, leaving 0.0 where it fails"""
+        for column, model in models.items():
+            try:
+                probs = model.predict_proba(X)
+                scores[:, column] = probs[:, 1] if probs.shape[1] > 1 else probs[:, 0]
+            except Exception as e:
+                print(f"Error predicting for {self.domains[column]}: {e}")
+                scores[:, column] = 0.0
+    
+    def _predict_trees(self, X: np.ndarray) -> np.ndarray:
+        """Average tree probabilities per tree-based domain"""
+        # sklearn trees compare float32 inputs against their thresholds
+        X32 = X.astype(np.float32).ravel()
+        row_offsets = (np.arange(X.shape[0]) * X.shape[1])[:, None]
+        nodes = np.broadcast_to(self.tree_roots, (X.shape[0], len(self.tree_roots))).copy()
+        
+        for _ in range(self.max_depth):
+            left = self.node_left[nodes]
+            internal = left >= 0
+            if not internal.any():
+                break
+            go_left = X32.take(row_offsets + self.node_feature.take(nodes)) <= self.node_threshold.take(nodes)
+            nodes = np.where(internal, np.where(go_left, left, self.node_right[nodes]), nodes)
+        
+        leaf_probs = self.node_value[nodes]
+        starts = np.concatenate(([0], np.cumsum(self.trees_per_domain)[:-1]))
+        return np.add.reduceat(leaf_probs, starts, axis=1) / self.trees_per_domain
+
+def _is_binary_linear(model: Any) -> bool:
+    """Binary logistic regression that can be expressed as one weight column"""
+    return (
+        isinstance(model, LogisticRegression)
+        and len(getattr(model, "classes_", [])) == 2
+        and model.coef_.shape[0] == 1
+        and getattr(model, "multi_class", "auto") != "multinomial"
+    )
+
+def _is_binary_tree_model(model: Any) -> bool:
+    """Binary single-output decision tree or tree bagging ensemble"""
+    if not isinstance(model, (DecisionTreeClassifier, RandomForestClassifier, ExtraTreesClassifier)):
+        return False
+    if len(getattr(model, "classes_", [])) != 2 or getattr(model, "n_outputs_", 1) != 1:
+        return False
+    return all(tree.tree_.n_classes[0] == 2 for tree in _estimators(model))
+
+def _estimators(model: Any) -> List[Any]:
+    """Trees making up a tree-based model"""
+    return [model] if isinstance(model, DecisionTreeClassifier) else list(model.estimators_)
\ No newline at end of file
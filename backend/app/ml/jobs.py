@@ -0,0 +1,202 @@
+"""
+Analysis Jobs
+Worker pool for analysis requests. A request submits a job and returns
+immediately; identical requests arriving while a job for the same key is
+still queued or running are attached to that job instead of repeating the
+work. Job state is kept in the analysis_jobs table, so a poll answered by any
+API worker process sees the job, and finished jobs stay pollable for a while.
+A job whose process exits before finishing it (a restart or crash) is
+reported as failed once it has been active for ANALYSIS_JOB_TIMEOUT_SECONDS.
+"""
+
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, Callable, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.analysis_job import AnalysisJob
+
+ACTIVE_STATUSES = ("queued", "running")
+
+class AnalysisJobManager:
+    """Runs analysis jobs on a thread pool, coalescing concurrent requests per key"""
+    
+    def __init__(
+        self,
+        max_workers: int = 4,
+        retention_seconds: float = 600.0,
+        timeout_seconds: float = 900.0,
+        session_factory: sessionmaker = SessionLocal
+    ):
+        self.retention_seconds = retention_seconds
+        self.timeout_seconds = timeout_seconds
+        self._session_factory = session_factory
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis-job")
+        self._queued: Set[str] = set()  # Jobs of this process not yet picked up by a worker thread
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._coalesced = 0
+    
+    def submit(self, key: str, owner_id: int, child_id: int, func: Callable[..., Any], *args: Any) -> Tuple[AnalysisJob, bool]:
+        """Queue func(*args) under key, or join the job already active for that key; returns (job, created)
+        
+        func runs on a worker thread and must return a JSON-serializable result.
+        """
+        db = self._session_factory()
+        try:
+            self._prune(db)
+            
+            # Two processes submitting the same key at once may each start a job; both finish correctly
+            job = db.query(AnalysisJob).filter(
+                AnalysisJob.job_key == key,
+                AnalysisJob.status.in_(ACTIVE_STATUSES),
+                AnalysisJob.created_at >= self._stale_before()
+            ).order_by(AnalysisJob.created_at.desc()).with_for_update().first()
+            if job is not None:
+                job.coalesced_requests = AnalysisJob.coalesced_requests + 1
+                db.commit()
+                db.refresh(job)
+                with self._lock:
+                    self._coalesced += 1
+                return job, False
+            
+            job = AnalysisJob(
+                id=uuid.uuid4().hex,
+                job_key=key,
+                owner_id=owner_id,
+                child_id=child_id,
+                status="queued",
+                coalesced_requests=0,
+                created_at=datetime.now()
+            )
+            db.add(job)
+            db.commit()
+            db.refresh(job)
+        finally:
+            db.close()
+        
+        with self._lock:
+            self._submitted += 1
+            self._queued.add(job.id)
+        try:
+            self._executor.submit(self._run, job.id, func, args)
+        except RuntimeError as e:
+            # Executor already shut down
+            self._finish(job.id, error=str(e))
+            return self.get(job.id), True
+        return job, True
+    
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Look up a job by id, marking it failed if it outlived the timeout"""
+        db = self._session_factory()
+        try:
+            interrupted = db.query(AnalysisJob).filter(
+                AnalysisJob.id == job_id,
+                AnalysisJob.status.in_(ACTIVE_STATUSES),
+                AnalysisJob.created_at < self._stale_before()
+            ).update({
+                "status": "failed",
+                "error": "Job did not finish in time (its worker may have restarted)",
+                "finished_at": datetime.now()
+            }, synchronize_session=False)
+            if interrupted:
+                db.commit()
+            return db.get(AnalysisJob, job_id)
+        finally:
+            db.close()
+    
+    def _run(self, job_id: str, func: Callable[..., Any], args: tuple) -> None:
+        """Execute a job in a worker thread and record its outcome"""
+        with self._lock:
+            self._queued.discard(job_id)
+        self._update(job_id, status="running", started_at=datetime.now())
+        try:
+            self._finish(job_id, result=func(*args))
+        except Exception as e:
+            print(f"Error running analysis job {job_id}: {e}")
+            self._finish(job_id, error=str(e))
+    
+    def _finish(self, job_id: str, result: Any = None, error: Optional[str] = None) -> None:
+        """Record a job outcome, which releases its key for new submissions"""
+        self._update(
+            job_id,
+            status="failed" if error is not None else "completed",
+            result=result,
+            error=error,
+            finished_at=datetime.now()
+        )
+    
+    def _update(self, job_id: str, **values: Any) -> None:
+        """Write job columns in a short transaction of their own"""
+        db = self._session_factory()
+        try:
+            db.query(AnalysisJob).filter(AnalysisJob.id == job_id).update(values, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+    
+    def _stale_before(self) -> datetime:
+        """Creation time before which an active job is considered lost"""
+        return datetime.now() - timedelta(seconds=self.timeout_seconds)
+    
+    def _prune(self, db) -> None:
+        """Forget finished jobs older than the retention period"""
+        db.query(AnalysisJob).filter(
+            AnalysisJob.status.notin_(ACTIVE_STATUSES),
+            AnalysisJob.finished_at < datetime.now() - timedelta(seconds=self.retention_seconds)
+        ).delete(synchronize_session=False)
+    
+    def stats(self) -> Dict[str, int]:
+        """Submission and coalescing counters of this process, job counts of all of them"""
+        db = self._session_factory()
+        try:
+            counts = dict(db.query(
+                AnalysisJob.status.in_(ACTIVE_STATUSES), func.count(AnalysisJob.id)
+            ).group_by(AnalysisJob.status.in_(ACTIVE_STATUSES)).all())
+        finally:
+            db.close()
+        with self._lock:
+            return {
+                "submitted": self._submitted,
+                "coalesced": self._coalesced,
+                "active": counts.get(True, 0),
+                "retained": counts.get(False, 0)
+            }
+    
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work and release the worker threads, failing jobs that never started"""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        with self._lock:
+            cancelled, self._queued = list(self._queued), set()
+        for job_id in cancelled:
+            self._finish(job_id, error="Server shut down before the job ran")
+
+_job_manager: Optional[AnalysisJobManager] = None
+_job_manager_lock = threading.Lock()
+
+def get_job_manager() -> AnalysisJobManager:
+    """Return the process-wide analysis job manager"""
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = AnalysisJobManager(
+                    max_workers=settings.ANALYSIS_JOB_WORKERS,
+                    retention_seconds=settings.ANALYSIS_JOB_RETENTION_SECONDS,
+                    timeout_seconds=settings.ANALYSIS_JOB_TIMEOUT_SECONDS
+                )
+    return _job_manager
+
+def shutdown_job_manager() -> None:
+    """Shut down the process-wide job manager; a new one is created on next use"""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is not None:
+            _job_manager.shutdown()
+            _job_manager = None
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""
+Model Registry
+Process-wide cache of the per-domain ML models. Models are loaded once per
+model version with joblib memory mapping so that uvicorn workers share the
+underlying pages, and are hot-swapped when the model files change.
+"""
+
+import os
+import mmap
+import time
+import threading
+import types
+from typing import Dict, List, Any, Optional, Tuple
+
+import joblib
+import numpy as np
+
+from app.core.config import settings
+from app.ml.fused_models import FusedDomainModel
+
+class ModelEntry:
+    """A loaded model together with the file state it was loaded from"""
+    
+    def __init__(self, domain: str, model: Any, path: str, file_state: Tuple[float, int], load_seconds: float):
+        self.domain = domain
+        self.model = model
+        self.path = path
+        self.file_state = file_state
+        self.load_seconds = load_seconds
+        self.loaded_at = time.time()
+        self.heap_bytes, self.mapped_bytes = _array_bytes(model)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Load and memory statistics for this model"""
+        return {
+            "path": self.path,
+            "file_bytes": self.file_state[1],
+            "load_seconds": round(self.load_seconds, 6),
+            "resident_bytes": self.heap_bytes,
+            "mapped_bytes": self.mapped_bytes,
+            "loaded_at": self.loaded_at
+        }
+
+class ModelRegistry:
+    """Singleton-style registry of domain models keyed by model version"""
+    
+    def __init__(self, model_path: str, check_interval: float = 30.0, mmap_mode: Optional[str] = "r"):
+        self.model_path = model_path
+        self.check_interval = check_interval
+        self.mmap_mode = mmap_mode
+        
+        # version -> domain -> ModelEntry; each inner dict is replaced, never mutated
+        self._entries: Dict[str, Dict[str, ModelEntry]] = {}
+        self._last_checked: Dict[str, float] = {}
+        self._known_domains = set()
+        self._fused: Dict[Tuple[str, Tuple[str, ...]], Tuple[Dict[str, ModelEntry], FusedDomainModel]] = {}
+        self.generation = 0  # Incremented on every model swap
+        self._lock = threading.Lock()
+    
+    def version_path(self, version: str) -> str:
+        """Directory holding the model files for a version (the build its symlink points at)"""
+        versioned = os.path.join(self.model_path, version)
+        return os.path.realpath(versioned) if os.path.isdir(versioned) else self.model_path
+    
+    def get_models(self, domains: List[str], version: Optional[str] = None) -> Dict[str, Any]:
+        """Return a consistent {domain: model} snapshot for the requested domains"""
+        entries = self._snapshot(domains, version or settings.MODEL_VERSION)
+        return {domain: entries[domain].model for domain in domains if domain in entries}
+    
+    def get_fused_model(self, domains: List[str], version: Optional[str] = None) -> FusedDomainModel:
+        """Return the domain models compiled into one multi-output model, recompiled after a swap"""
+        version = version or settings.MODEL_VERSION
+        # One snapshot for both the models and the cache key, so a concurrent
+        # refresh cannot cache a fused model under entries it was not built from
+        entries = self._snapshot(domains, version)
+        
+        key = (version, tuple(domains))
+        cached = self._fused.get(key)
+        if cached is not None and cached[0] is entries:
+            return cached[1]
+        
+        models = {domain: entries[domain].model for domain in domains if domain in entries}
+        fused = FusedDomainModel(domains, models)
+        self._fused = {key: (entries, fused)}
+        return fused
+    
+    def _snapshot(self, domains: List[str], version: str) -> Dict[str, ModelEntry]:
+        """Current entries for a version, refreshed when stale or missing a domain"""
+        entries = self._entries.get(version)
+        
+        now = time.monotonic()
+        if entries is None or now - self._last_checked.get(version, 0) >= self.check_interval or not set(domains) <= self._known_domains:
+            entries = self.refresh(domains, version)
+        
+        return entries
+    
+    def refresh(self, domains: List[str], version: Optional[str] = None, force: bool = False) -> Dict[str, ModelEntry]:
+        """Reload any model whose file changed and atomically swap in the new set"""
+        version = version or settings.MODEL_VERSION
+        
+        with self._lock:
+            self._known_domains |= set(domains)
+            current = self._entries.get(version, {})
+            base_path = self.version_path(version)
+            if base_path == self.model_path and any(os.path.dirname(entry.path) != os.path.normpath(self.model_path) for entry in current.values()):
+                # The version directory is missing (e.g. moved aside while publishing); keep serving the loaded models
+                return current
+            updated = dict(current)
+            changed = False
+            
+            for domain in set(domains) | set(current):
+                model_file = os.path.join(base_path, f"{domain}_model.pkl")
+                file_state = _file_state(model_file)
+                
+                if file_state is None:
+                    if domain in updated:
+                        del updated[domain]
+                        changed = True
+                    continue
+                
+                entry = current.get(domain)
+                if entry is not None and entry.file_state == file_state and entry.path == model_file and not force:
+                    continue
+                
+                try:
+                    start = time.perf_counter()
+                    model = joblib.load(model_file, mmap_mode=self.mmap_mode)
+                    updated[domain] = ModelEntry(domain, model, model_file, file_state, time.perf_counter() - start)
+                    changed = True
+                except Exception as e:
+                    print(f"Error loading model for {domain}: {e}")
+            
+            if changed or version not in self._entries:
+                # Other versions are dropped once a new one is live; in-flight
+                # predictions keep their own reference to the old models
+                self._entries = {version: updated}
+                self.generation += 1
+            
+            self._last_checked = {version: time.monotonic()}
+            return self._entries[version]
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-version, per-domain load time and memory statistics"""
+        return {
+            version: {domain: entry.stats() for domain, entry in entries.items()}
+            for version, entries in self._entries.items()
+        }
+    
+    def clear(self) -> None:
+        """Drop every loaded model"""
+        with self._lock:
+            self._entries = {}
+            self._last_checked = {}
+            self._known_domains = set()
+            self._fused = {}
+            self.generation += 1
+
+def _file_state(path: str) -> Optional[Tuple[float, int]]:
+    """Modification time and size of a model file, or None if missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+def _array_bytes(obj: Any) -> Tuple[int, int]:
+    """Estimate (heap, memory-mapped) bytes held in numpy arrays reachable from a model"""
+    heap_bytes = 0
+    mapped_bytes = 0
+    seen = set()
+    visited = []  # Keeps visited objects alive so their ids are not reused
+    stack = [obj]
+    
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        visited.append(current)
+        
+        if isinstance(current, np.ndarray):
+            base = current
+            while isinstance(base, np.ndarray) and base.base is not None and not isinstance(base, np.memmap):
+                base = base.base
+            if isinstance(base, (np.memmap, mmap.mmap)):
+                mapped_bytes += current.nbytes
+            else:
+                heap_bytes += current.nbytes
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+        elif isinstance(current, (type, types.ModuleType, types.FunctionType)):
+            continue
+        elif hasattr(current, "__dict__"):
+            stack.extend(vars(current).values())
+        elif hasattr(current, "__getstate__") and type(current).__module__.startswith("sklearn"):
+            # Cython objects such as sklearn trees expose their arrays via state
+            state = current.__getstate__()
+            if isinstance(state, dict):
+                stack.extend(state.values())
+    
+    return heap_bytes, mapped_bytes
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry(
+                    settings.MODEL_PATH,
+                    check_interval=settings.MODEL_RELOAD_INTERVAL,
+                    mmap_mode=settings.MODEL_MMAP_MODE
+                )
+    return _registry
\ No newline at end of file
@@ -1,17 +1,38 @@
+import copy
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
-import joblib
-import os
+from itertools import groupby
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
 
 from app.models.session import GameSession
 from app.models.passion import PassionDomain, PassionInsight
 from app.models.game import Game
 from app.models.question import QuestionResponse
 from app.models.child import Child
+from app.models.child_features import ChildFeatures
 from app.core.config import settings
+from app.ml.feature_store import FEATURE_COLUMNS, features_from_store, new_child_features
+from app.ml.model_registry import get_model_registry
+from app.ml.domain_matcher import get_domain_matcher
+from app.ml.result_cache import get_result_cache
+from app.ml.persistence import save_analyses
+from app.ml.recommender import refresh_recommendations
+from app.ml.similarity_index import get_similarity_index, interest_counts
+
+def _copy_row(obj: Any) -> Any:
+    """New transient ORM object with copies of another's column values"""
+    values = {column.key: getattr(obj, column.key) for column in obj.__table__.columns}
+    return type(obj)(**{key: copy.deepcopy(value) for key, value in values.items() if value is not None})
+
+def copy_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an analyze_child result that shares no mutable state with the original"""
+    copied = copy.deepcopy({key: value for key, value in analysis.items() if key not in ("domains", "insights")})
+    copied["domains"] = [_copy_row(domain) for domain in analysis["domains"]]
+    copied["insights"] = [_copy_row(insight) for insight in analysis["insights"]]
+    return copied
 
 # Talent domain definitions with characteristics
 TALENT_DOMAINS = {
@@ -73,6 +94,91 @@ TALENT_DOMAINS = {
     }
 }
 
+# Compiled once: activities and indicators of every talent domain
+TALENT_MATCHER = get_domain_matcher({
+    domain: info.get("activities", []) + info.get("indicators", [])
+    for domain, info in TALENT_DOMAINS.items()
+})
+
+# Column index of each talent domain in columnar response batches
+TALENT_DOMAIN_CODES = {domain: code for code, domain in enumerate(TALENT_DOMAINS)}
+
+class ResponseBatch:
+    """Columnar view of question responses for one or many children"""
+    
+    def __init__(self, child_ids: np.ndarray, domain_codes: np.ndarray, scores: np.ndarray, response_times: np.ndarray, confidence_levels: np.ndarray, created_at: np.ndarray):
+        # Rows of one child are contiguous and keep the order they were given in
+        order = np.argsort(child_ids, kind="stable")
+        self.child_ids = child_ids[order]
+        self.domain_codes = domain_codes[order]
+        self.scores = scores[order]
+        self.response_times = response_times[order]
+        self.confidence_levels = confidence_levels[order]
+        self.created_at = created_at[order]
+    
+    def __len__(self) -> int:
+        return len(self.child_ids)
+    
+    @classmethod
+    def from_rows(cls, rows: List[tuple]) -> "ResponseBatch":
+        """Build from (child_id, talent_indicators, score, response_time, confidence_level, created_at) tuples"""
+        columns = list(zip(*rows)) if rows else [()] * 6
+        child_ids, talent_indicators, scores, response_times, confidence_levels, created_at = columns
+        
+        # Missing values become NaN
+        return cls(
+            np.array(child_ids, dtype=np.int64),
+            np.array([
+                TALENT_DOMAIN_CODES.get(indicators["domain"], -1) if indicators and "domain" in indicators else -1
+                for indicators in talent_indicators
+            ], dtype=np.int64),
+            np.array(scores, dtype=np.float64),
+            np.array(response_times, dtype=np.float64),
+            np.array(confidence_levels, dtype=np.float64),
+            np.array([created.timestamp() if created is not None else np.nan for created in created_at], dtype=np.float64)
+        )
+    
+    @classmethod
+    def from_responses(cls, responses: List[QuestionResponse], child_id: Optional[int] = None) -> "ResponseBatch":
+        """Build from QuestionResponse objects, optionally attributing them all to one child"""
+        return cls.from_rows([
+            (
+                child_id if child_id is not None else r.child_id,
+                r.talent_indicators,
+                r.score,
+                r.response_time,
+                r.confidence_level,
+                r.created_at
+            )
+            for r in responses
+        ])
+
+def load_response_batch(child_ids: List[int], db: Session, limit_per_child: int = 20) -> ResponseBatch:
+    """Load the most recent responses of many children in one query as a columnar batch"""
+    ranked = db.query(
+        QuestionResponse.child_id,
+        QuestionResponse.talent_indicators,
+        QuestionResponse.score,
+        QuestionResponse.response_time,
+        QuestionResponse.confidence_level,
+        QuestionResponse.created_at,
+        func.row_number().over(
+            partition_by=QuestionResponse.child_id,
+            order_by=(QuestionResponse.created_at.desc(), QuestionResponse.id.desc())
+        ).label("position")
+    ).filter(QuestionResponse.child_id.in_(child_ids)).subquery()
+    
+    rows = db.query(
+        ranked.c.child_id,
+        ranked.c.talent_indicators,
+        ranked.c.score,
+        ranked.c.response_time,
+        ranked.c.confidence_level,
+        ranked.c.created_at
+    ).filter(ranked.c.position <= limit_per_child).order_by(ranked.c.child_id, ranked.c.position).all()
+    
+    return ResponseBatch.from_rows(rows)
+
 def analyze_talent_responses(responses: List[QuestionResponse], child: Child) -> Dict[str, Any]:
     """
     Analyze question responses to detect talent domains and generate assessment
@@ -80,166 +186,140 @@ def analyze_talent_responses(responses: List[QuestionResponse], child: Child) ->
     if not responses:
         return _generate_default_assessment(child)
     
-    # Calculate age
-    age = int((datetime.now() - child.date_of_birth).days / 365.25)
-    
-    # Initialize talent domain scores
-    talent_scores = {domain: 0.0 for domain in TALENT_DOMAINS.keys()}
-    response_count = {domain: 0 for domain in TALENT_DOMAINS.keys()}
-    
-    # Analyze each response
-    total_response_time = 0
-    confidence_scores = []
-    
-    for response in responses:
-        if response.talent_indicators and "domain" in response.talent_indicators:
-            domain = response.talent_indicators["domain"]
-            if domain in talent_scores:
-                # Add score (normalize to 0-1 range)
-                score = response.score or 0.5
-                talent_scores[domain] += score
-                response_count[domain] += 1
-        
-        # Track response patterns
-        if response.response_time:
-            total_response_time += response.response_time
-        if response.confidence_level:
-            confidence_scores.append(response.confidence_level)
-    
-    # Calculate average scores for each domain
-    for domain in talent_scores:
-        if response_count[domain] > 0:
-            talent_scores[domain] = talent_scores[domain] / response_count[domain]
-        else:
-            # Use child's initial interests as a hint
-            if child.initial_interests:
-                for interest in child.initial_interests:
-                    if _interest_matches_domain(interest, domain):
-                        talent_scores[domain] = 0.6  # Moderate interest
-    
-    # Determine primary and secondary talents
-    sorted_talents = sorted(talent_scores.items(), key=lambda x: x[1], reverse=True)
-    primary_talent = sorted_talents[0][0] if sorted_talents[0][1] > 0.5 else None
-    secondary_talents = [talent[0] for talent in sorted_talents[1:4] if talent[1] > 0.4]
-    
-    # Calculate confidence score
-    confidence_score = _calculate_confidence_score(responses, talent_scores)
-    
-    # Analyze behavioral patterns
-    behavioral_patterns = _analyze_behavioral_patterns(responses, total_response_time, confidence_scores)
-    
-    # Analyze response patterns
-    response_patterns = _analyze_response_patterns(responses)
-    
-    # Generate interest indicators
-    interest_indicators = _generate_interest_indicators(child, talent_scores)
-    
-    # Generate recommendations
-    recommended_activities = _generate_recommendations(primary_talent, secondary_talents, age)
-    
-    # Generate development path
-    development_path = _generate_development_path(primary_talent, age)
-    
-    return {
-        "talent_domains": talent_scores,
-        "primary_talent": primary_talent,
-        "secondary_talents": secondary_talents,
-        "confidence_score": confidence_score,
-        "behavioral_patterns": behavioral_patterns,
-        "response_patterns": response_patterns,
-        "interest_indicators": interest_indicators,
-        "recommended_activities": recommended_activities,
-        "development_path": development_path
-    }
-
-def _interest_matches_domain(interest: str, domain: str) -> bool:
-    """Check if an interest matches a talent domain"""
-    interest_lower = interest.lower()
-    domain_info = TALENT_DOMAINS.get(domain, {})
-    
-    # Check against domain activities
-    for activity in domain_info.get("activities", []):
-        if activity.lower() in interest_lower:
-            return True
-    
-    # Check against domain indicators
-    for indicator in domain_info.get("indicators", []):
-        if indicator.lower() in interest_lower:
-            return True
-    
-    return False
-
-def _calculate_confidence_score(responses: List[QuestionResponse], talent_scores: Dict[str, float]) -> float:
-    """Calculate confidence in the assessment"""
-    if not responses:
-        return 0.3
-    
-    # Factors affecting confidence:
-    # 1. Number of responses
-    response_factor = min(len(responses) / 10.0, 1.0)
-    
-    # 2. Consistency of scores
-    score_variance = np.var(list(talent_scores.values()))
-    consistency_factor = max(0, 1 - score_variance)
-    
-    # 3. Response quality (confidence levels)
-    avg_confidence = 0.5  # Default
-    if any(r.confidence_level for r in responses):
-        confidences = [r.confidence_level for r in responses if r.confidence_level]
-        avg_confidence = sum(confidences) / len(confidences) / 10.0
-    
-    # Weighted average
-    confidence_score = (response_factor * 0.4 + consistency_factor * 0.4 + avg_confidence * 0.2)
-    return min(confidence_score, 1.0)
+    batch = ResponseBatch.from_responses(responses, child_id=child.id)
+    return analyze_talent_response_batch(batch, {child.id: child})[child.id]
 
-def _analyze_behavioral_patterns(responses: List[QuestionResponse], total_response_time: float, confidence_scores: List[float]) -> Dict[str, Any]:
-    """Analyze behavioral patterns from responses"""
-    patterns = {
-        "response_speed": "normal",
-        "confidence_level": "moderate",
-        "engagement_level": "moderate",
-        "consistency": "moderate"
-    }
-    
-    if responses:
-        avg_response_time = total_response_time / len(responses)
-        if avg_response_time < 10:
-            patterns["response_speed"] = "fast"
-        elif avg_response_time > 30:
-            patterns["response_speed"] = "slow"
-        
-        if confidence_scores:
-            avg_confidence = sum(confidence_scores) / len(confidence_scores)
-            if avg_confidence > 7:
-                patterns["confidence_level"] = "high"
-            elif avg_confidence < 4:
-                patterns["confidence_level"] = "low"
-    
-    return patterns
+def analyze_children_talents(child_ids: List[int], db: Session, limit_per_child: int = 20) -> Dict[int, Dict[str, Any]]:
+    """Assess many children from their most recent responses with one query and one vectorized pass"""
+    children = {child.id: child for child in db.query(Child).filter(Child.id.in_(child_ids)).all()}
+    batch = load_response_batch(list(children), db, limit_per_child)
+    return analyze_talent_response_batch(batch, children)
 
-def _analyze_response_patterns(responses: List[QuestionResponse]) -> Dict[str, Any]:
-    """Analyze response patterns and consistency"""
-    patterns = {
-        "total_responses": len(responses),
-        "response_consistency": "moderate",
-        "learning_curve": "stable"
-    }
-    
-    if len(responses) >= 5:
-        # Check for improvement over time
-        recent_scores = [r.score for r in responses[-5:] if r.score]
-        early_scores = [r.score for r in responses[:5] if r.score]
-        
-        if recent_scores and early_scores:
-            recent_avg = sum(recent_scores) / len(recent_scores)
-            early_avg = sum(early_scores) / len(early_scores)
-            
+def analyze_talent_response_batch(batch: ResponseBatch, children: Dict[int, Child]) -> Dict[int, Dict[str, Any]]:
+    """
+    Vectorized talent assessment for every child in a columnar response batch
+    """
+    results = {}
+    n_domains = len(TALENT_DOMAINS)
+    
+    # Group rows by child: contiguous groups, index of each row within its group
+    group_ids, starts, counts = np.unique(batch.child_ids, return_index=True, return_counts=True)
+    n_groups = len(group_ids)
+    group = np.repeat(np.arange(n_groups), counts)
+    position = np.arange(len(batch)) - starts[group]
+    
+    # Truthiness of nullable columns, as in `if response.score`
+    has_score = ~np.isnan(batch.scores) & (batch.scores != 0)
+    has_time = ~np.isnan(batch.response_times) & (batch.response_times != 0)
+    has_confidence = ~np.isnan(batch.confidence_levels) & (batch.confidence_levels != 0)
+    
+    # Domain means; unscored responses count as 0.5
+    in_domain = batch.domain_codes >= 0
+    cells = group[in_domain] * n_domains + batch.domain_codes[in_domain]
+    domain_scores = np.where(has_score, batch.scores, 0.5)[in_domain]
+    score_sums = np.bincount(cells, weights=domain_scores, minlength=n_groups * n_domains).reshape(n_groups, n_domains)
+    score_counts = np.bincount(cells, minlength=n_groups * n_domains).reshape(n_groups, n_domains)
+    talent_matrix = np.divide(score_sums, score_counts, out=np.zeros((n_groups, n_domains)), where=score_counts > 0)
+    
+    # Response time and confidence totals
+    total_response_time = np.bincount(group, weights=np.where(has_time, batch.response_times, 0.0), minlength=n_groups)
+    confidence_sums = np.bincount(group, weights=np.where(has_confidence, batch.confidence_levels, 0.0), minlength=n_groups)
+    confidence_counts = np.bincount(group, weights=has_confidence, minlength=n_groups)
+    
+    # Learning curve: scored responses among the last five versus the first five
+    early = has_score & (position < 5)
+    recent = has_score & (position >= counts[group] - 5)
+    early_sums = np.bincount(group, weights=np.where(early, batch.scores, 0.0), minlength=n_groups)
+    early_counts = np.bincount(group, weights=early, minlength=n_groups)
+    recent_sums = np.bincount(group, weights=np.where(recent, batch.scores, 0.0), minlength=n_groups)
+    recent_counts = np.bincount(group, weights=recent, minlength=n_groups)
+    
+    # Use each child's initial interests as a hint for domains without responses
+    domain_names = list(TALENT_DOMAINS)
+    for g, child_id in enumerate(group_ids.tolist()):
+        child = children.get(child_id)
+        if child is not None and child.initial_interests:
+            for domain in frozenset().union(*(TALENT_MATCHER.matches(interest) for interest in child.initial_interests)):
+                code = TALENT_DOMAIN_CODES[domain]
+                if score_counts[g, code] == 0:
+                    talent_matrix[g, code] = 0.6  # Moderate interest
+    
+    # Confidence: number of responses, consistency of scores, response confidence levels
+    response_factor = np.minimum(counts / 10.0, 1.0)
+    consistency_factor = np.maximum(0, 1 - np.var(talent_matrix, axis=1))
+    avg_confidence = np.divide(confidence_sums, confidence_counts, out=np.full(n_groups, np.nan), where=confidence_counts > 0)
+    confidence_factor = np.where(confidence_counts > 0, avg_confidence / 10.0, 0.5)
+    confidence_scores = np.minimum(response_factor * 0.4 + consistency_factor * 0.4 + confidence_factor * 0.2, 1.0)
+    avg_response_time = total_response_time / counts
+    
+    for g, child_id in enumerate(group_ids.tolist()):
+        child = children.get(child_id)
+        if child is None:
+            continue
+        
+        # Calculate age
+        age = int((datetime.now() - child.date_of_birth).days / 365.25)
+        talent_scores = dict(zip(domain_names, talent_matrix[g].tolist()))
+        
+        # Determine primary and secondary talents
+        sorted_talents = sorted(talent_scores.items(), key=lambda x: x[1], reverse=True)
+        primary_talent = sorted_talents[0][0] if sorted_talents[0][1] > 0.5 else None
+        secondary_talents = [talent[0] for talent in sorted_talents[1:4] if talent[1] > 0.4]
+        
+        # Behavioral patterns
+        behavioral_patterns = {
+            "response_speed": "normal",
+            "confidence_level": "moderate",
+            "engagement_level": "moderate",
+            "consistency": "moderate"
+        }
+        if avg_response_time[g] < 10:
+            behavioral_patterns["response_speed"] = "fast"
+        elif avg_response_time[g] > 30:
+            behavioral_patterns["response_speed"] = "slow"
+        if confidence_counts[g] > 0:
+            if avg_confidence[g] > 7:
+                behavioral_patterns["confidence_level"] = "high"
+            elif avg_confidence[g] < 4:
+                behavioral_patterns["confidence_level"] = "low"
+        
+        # Response patterns
+        response_patterns = {
+            "total_responses": int(counts[g]),
+            "response_consistency": "moderate",
+            "learning_curve": "stable"
+        }
+        if counts[g] >= 5 and recent_counts[g] and early_counts[g]:
+            recent_avg = recent_sums[g] / recent_counts[g]
+            early_avg = early_sums[g] / early_counts[g]
             if recent_avg > early_avg * 1.2:
-                patterns["learning_curve"] = "improving"
+                response_patterns["learning_curve"] = "improving"
             elif recent_avg < early_avg * 0.8:
-                patterns["learning_curve"] = "declining"
+                response_patterns["learning_curve"] = "declining"
+        
+        results[child_id] = {
+            "talent_domains": talent_scores,
+            "primary_talent": primary_talent,
+            "secondary_talents": secondary_talents,
+            "confidence_score": float(confidence_scores[g]),
+            "behavioral_patterns": behavioral_patterns,
+            "response_patterns": response_patterns,
+            "interest_indicators": _generate_interest_indicators(child, talent_scores),
+            "recommended_activities": _generate_recommendations(primary_talent, secondary_talents, age),
+            "development_path": _generate_development_path(primary_talent, age)
+        }
+    
+    # Children without any responses get the default assessment
+    for child_id, child in children.items():
+        if child_id not in results:
+            results[child_id] = _generate_default_assessment(child)
     
-    return patterns
+    return results
+
+def _interest_matches_domain(interest: str, domain: str) -> bool:
+    """Check if an interest matches a talent domain"""
+    # Check against domain activities and indicators
+    return domain in TALENT_MATCHER.matches(interest)
 
 def _generate_interest_indicators(child: Child, talent_scores: Dict[str, float]) -> Dict[str, Any]:
     """Generate interest indicators based on child data and talent scores"""
@@ -363,19 +443,18 @@ class PassionDetector:
             "logic_mathematics": ["logic", "math", "numbers", "puzzle", "pattern", "problem", "thinking"]
         }
         
-        self.models = {}
+        self.domain_matcher = get_domain_matcher(self.domain_keywords)
+        self.model_registry = get_model_registry()
         self.load_models()
     
+    @property
+    def models(self) -> Dict[str, Any]:
+        """Current domain models, hot-swapped by the registry when model files change"""
+        return self.model_registry.get_models(self.domains)
+    
     def load_models(self):
-        """Load pre-trained ML models"""
-        model_path = settings.MODEL_PATH
-        for domain in self.domains:
-            model_file = os.path.join(model_path, f"{domain}_model.pkl")
-            if os.path.exists(model_file):
-                try:
-                    self.models[domain] = joblib.load(model_file)
-                except Exception as e:
-                    print(f"Error loading model for {domain}: {e}")
+        """Load pre-trained ML models (shared across detectors through the model registry)"""
+        self.model_registry.get_models(self.domains)
     
     def extract_features(self, sessions: List[GameSession], games: List[Game]) -> Dict[str, Any]:
         """Extract features from game sessions for passion detection"""
@@ -434,15 +513,14 @@ class PassionDetector:
     def rule_based_detection(self, features: Dict[str, Any], child_interests: List[str] = None) -> Dict[str, float]:
         """Rule-based passion detection using heuristics"""
         scores = {}
+        category_counts = self.domain_matcher.domain_counts(features.get('category_preferences', {}))
+        interest_matches = self.domain_matcher.count_matches(child_interests) if child_interests else {}
         
         for domain in self.domains:
             score = 0.0
             
             # Category preference scoring
-            category_keywords = self.domain_keywords[domain]
-            for category, count in features.get('category_preferences', {}).items():
-                if any(keyword in category.lower() for keyword in category_keywords):
-                    score += count * 0.1
+            score += category_counts[domain] * 0.1
             
             # Performance scoring
             if features['avg_score'] > 0.7:
@@ -462,9 +540,7 @@ class PassionDetector:
             
             # Initial interests matching
             if child_interests:
-                for interest in child_interests:
-                    if any(keyword in interest.lower() for keyword in category_keywords):
-                        score += 0.2
+                score += interest_matches[domain] * 0.2
             
             # Normalize score to 0-1 range
             scores[domain] = min(score, 1.0)
@@ -473,16 +549,26 @@ class PassionDetector:
     
     def ml_based_detection(self, features: Dict[str, Any]) -> Dict[str, float]:
         """ML-based passion detection using trained models"""
+        if settings.ML_INFERENCE_MODE == "fused":
+            feature_matrix = np.array([self._create_feature_vector(features)], dtype=float)
+            batch_scores = self.ml_based_detection_batch(feature_matrix)
+            return {domain: batch_scores[domain][0] for domain in self.domains}
+        
+        return self.per_domain_detection(features)
+    
+    def per_domain_detection(self, features: Dict[str, Any]) -> Dict[str, float]:
+        """ML-based passion detection with one predict_proba call per domain model"""
         scores = {}
+        models = self.models  # One snapshot for the whole call
         
         # Convert features to feature vector
         feature_vector = self._create_feature_vector(features)
         
         for domain in self.domains:
-            if domain in self.models:
+            if domain in models:
                 try:
                     # Predict probability for this domain
-                    prob = self.models[domain].predict_proba([feature_vector])[0]
+                    prob = models[domain].predict_proba([feature_vector])[0]
                     scores[domain] = prob[1] if len(prob) > 1 else prob[0]  # Probability of positive class
                 except Exception as e:
                     print(f"Error predicting for {domain}: {e}")
@@ -492,6 +578,34 @@ class PassionDetector:
         
         return scores
     
+    def ml_based_detection_batch(self, feature_matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        """ML-based passion detection for a feature matrix with one row per child"""
+        if settings.ML_INFERENCE_MODE == "fused":
+            try:
+                # All domains for all rows from a single vectorized evaluation
+                fused_scores = self.model_registry.get_fused_model(self.domains).predict(feature_matrix)
+                return {domain: fused_scores[:, column] for column, domain in enumerate(self.domains)}
+            except Exception as e:
+                print(f"Error in fused prediction, using per-domain models: {e}")
+        
+        scores = {}
+        models = self.models  # One snapshot for the whole call
+        n_rows = feature_matrix.shape[0]
+        
+        for domain in self.domains:
+            if domain in models and n_rows > 0:
+                try:
+                    # One predict_proba call covers every child in the batch
+                    probs = models[domain].predict_proba(feature_matrix)
+                    scores[domain] = probs[:, 1] if probs.shape[1] > 1 else probs[:, 0]
+                except Exception as e:
+                    print(f"Error predicting for {domain}: {e}")
+                    scores[domain] = np.zeros(n_rows)
+            else:
+                scores[domain] = np.zeros(n_rows)
+        
+        return scores
+    
     def _create_feature_vector(self, features: Dict[str, Any]) -> List[float]:
         """Create a feature vector for ML models"""
         vector = [
@@ -508,12 +622,9 @@ class PassionDetector:
         ]
         
         # Add category preference features
+        category_counts = self.domain_matcher.domain_counts(features.get('category_preferences', {}))
         for domain in self.domains:
-            category_count = 0
-            for category, count in features.get('category_preferences', {}).items():
-                if any(keyword in category.lower() for keyword in self.domain_keywords[domain]):
-                    category_count += count
-            vector.append(category_count)
+            vector.append(category_counts[domain])
         
         return vector
     
@@ -522,6 +633,10 @@ class PassionDetector:
         rule_scores = self.rule_based_detection(features, child_interests)
         ml_scores = self.ml_based_detection(features)
         
+        return self._combine_scores(rule_scores, ml_scores)
+    
+    def _combine_scores(self, rule_scores: Dict[str, float], ml_scores: Dict[str, float]) -> Dict[str, float]:
+        """Weighted combination of rule-based and ML-based scores"""
         # Weighted combination (can be adjusted based on model performance)
         rule_weight = 0.6
         ml_weight = 0.4
@@ -534,6 +649,42 @@ class PassionDetector:
         
         return hybrid_scores
     
+    def _apply_neighbour_priors(self, child_ids: List[int], child_features: List[Dict[str, Any]], child_interests: List[List[str]], session_counts: List[int], scores: List[Dict[str, float]]) -> List[Dict[str, float]]:
+        """Blend the scores of cold-start children with the domain confidences of their most similar children"""
+        index = get_similarity_index()
+        cold_start = settings.COLD_START_SESSIONS
+        rows = [row for row, count in enumerate(session_counts) if count < cold_start]
+        if index is None or not len(index) or not rows:
+            return scores
+        
+        feature_matrix = np.array(
+            [self._create_feature_vector(child_features[row]) for row in rows],
+            dtype=float
+        ).reshape(len(rows), -1)
+        queries = index.encode(feature_matrix, interest_counts(self, [child_interests[row] for row in rows]))
+        priors = index.domain_priors(queries, settings.SIMILAR_CHILDREN_K, [child_ids[row] for row in rows])
+        
+        prior_column = {domain: column for column, domain in enumerate(index.domains)}
+        blended = list(scores)
+        for prior, row in zip(priors, rows):
+            # The fewer sessions observed, the more the neighbours count
+            weight = settings.COLD_START_PRIOR_WEIGHT * (1 - session_counts[row] / cold_start)
+            blended[row] = {
+                domain: (1 - weight) * score + weight * float(prior[prior_column[domain]]) if domain in prior_column else score
+                for domain, score in scores[row].items()
+            }
+        return blended
+    
+    def _has_similarity_index(self) -> bool:
+        """True when a non-empty similarity index is served"""
+        index = get_similarity_index()
+        return index is not None and len(index) > 0
+    
+    def _similarity_index_version(self) -> Optional[str]:
+        """Build time of the served similarity index, part of cached analysis keys"""
+        index = get_similarity_index()
+        return index.built_at if index is not None else None
+    
     def determine_strength_level(self, confidence_score: float) -> str:
         """Determine strength level based on confidence score"""
         if confidence_score >= 0.8:
@@ -585,39 +736,197 @@ class PassionDetector:
         
         return insights
     
-    def analyze_child(self, child_id: int, db: Session) -> Dict[str, Any]:
+    def analyze_child(self, child_id: int, db: Session, use_cache: bool = True) -> Dict[str, Any]:
+        """Complete passion analysis for a child, reused while the child's data is unchanged"""
+        if not use_cache:
+            return self._analyze_child(child_id, db)
+        
+        cached = get_result_cache().get_or_compute(
+            "passion_analysis",
+            child_id,
+            db,
+            lambda: self._analyze_child(child_id, db),
+            model_version=(settings.MODEL_VERSION, self.model_registry.generation, self._similarity_index_version())
+        )
+        # Callers fill in trends and serialize the objects, so each gets its own copy of the shared entry
+        return copy_analysis(cached)
+    
+    def _analyze_child(self, child_id: int, db: Session) -> Dict[str, Any]:
         """Complete passion analysis for a child"""
-        # Get child's sessions and games
-        sessions = db.query(GameSession).filter(
-            GameSession.child_id == child_id,
-            GameSession.status == "completed"
-        ).all()
-        
-        if not sessions:
-            return {
-                "child_id": child_id,
-                "domains": [],
-                "insights": [],
-                "overall_confidence": 0.0,
-                "recommended_next_activities": [],
-                "development_trends": {},
-                "last_updated": datetime.now()
-            }
-        
-        # Get games
-        game_ids = [s.game_id for s in sessions]
-        games = db.query(Game).filter(Game.id.in_(game_ids)).all()
-        
-        # Extract features
-        features = self.extract_features(sessions, games)
+        # Read the child's running aggregates from the feature store
+        feature_row = db.query(ChildFeatures).filter(ChildFeatures.child_id == child_id).first()
+        
+        sessions = []
+        if feature_row is None:
+            # Not in the feature store yet, derive features from the session history
+            sessions = db.query(GameSession).options(load_only(*FEATURE_COLUMNS)).filter(
+                GameSession.child_id == child_id,
+                GameSession.status == "completed"
+            ).all()
+        
+        if feature_row is not None and feature_row.session_count:
+            games = db.query(Game).filter(Game.id.in_(feature_row.game_ids or [])).all()
+            features = features_from_store(feature_row)
+            session_count = feature_row.session_count
+        elif sessions:
+            # Get games
+            game_ids = [s.game_id for s in sessions]
+            games = db.query(Game).filter(Game.id.in_(game_ids)).all()
+            
+            # Extract features
+            features = self.extract_features(sessions, games)
+            session_count = len(sessions)
+        elif self._has_similarity_index():
+            # No completed sessions yet, so the analysis rests on similar children
+            games = []
+            features = features_from_store(new_child_features(child_id))
+            session_count = 0
+        else:
+            return self._empty_analysis(child_id)
         
         # Get child's initial interests
         child = db.query(Child).filter(Child.id == child_id).first()
         child_interests = child.initial_interests if child else []
         
-        # Detect passions
+        # Detect passions, leaning on similar children while the history is short
         passion_scores = self.hybrid_detection(features, child_interests)
+        passion_scores = self._apply_neighbour_priors([child_id], [features], [child_interests], [session_count], [passion_scores])[0]
+        
+        return self._build_analysis(child_id, session_count, games, features, passion_scores)
+    
+    def analyze_and_save(self, child_id: int, db: Session) -> Dict[str, Any]:
+        """Analyze a child, upsert the detected domains and insights and re-rank its games (the caller commits)"""
+        analysis = self.analyze_child(child_id, db)
+        save_analyses(db, {child_id: analysis})
+        refresh_recommendations(db, [child_id])
+        return analysis
+    
+    def analyze_and_save_children(self, child_ids: List[int], db: Session, chunk_size: int = 1000) -> Dict[str, int]:
+        """Analyze and persist many children, committing once per chunk"""
+        totals = {}
+        for start in range(0, len(child_ids), chunk_size):
+            analyses = self._analyze_children_chunk(child_ids[start:start + chunk_size], db)
+            for key, count in save_analyses(db, analyses).items():
+                totals[key] = totals.get(key, 0) + count
+            refresh_recommendations(db, list(analyses))
+            db.commit()
+        return totals
+    
+    def analyze_children(self, child_ids: List[int], db: Session, chunk_size: int = 1000) -> Dict[int, Dict[str, Any]]:
+        """Complete passion analysis for many children, keyed by child id"""
+        results = {}
+        
+        # Chunk the ids so IN lists and feature matrices stay bounded
+        for start in range(0, len(child_ids), chunk_size):
+            results.update(self._analyze_children_chunk(child_ids[start:start + chunk_size], db))
+        
+        return results
+    
+    def _analyze_children_chunk(self, child_ids: List[int], db: Session) -> Dict[int, Dict[str, Any]]:
+        """Batch passion analysis for one chunk of children"""
+        # Read stored aggregates for the whole chunk in a single query
+        feature_rows = {
+            row.child_id: row
+            for row in db.query(ChildFeatures).filter(ChildFeatures.child_id.in_(child_ids)).all()
+        }
+        
+        # Children missing from the store get their completed sessions in one grouped query
+        missing_ids = [child_id for child_id in child_ids if child_id not in feature_rows]
+        sessions = db.query(GameSession).options(load_only(*FEATURE_COLUMNS)).filter(
+            GameSession.child_id.in_(missing_ids),
+            GameSession.status == "completed"
+        ).order_by(GameSession.child_id, GameSession.id).all() if missing_ids else []
+        
+        sessions_by_child = {
+            child_id: list(child_sessions)
+            for child_id, child_sessions in groupby(sessions, key=lambda s: s.child_id)
+        }
+        
+        # Get the games and child profiles for the whole chunk
+        played_ids = {child_id: sorted({s.game_id for s in child_sessions}) for child_id, child_sessions in sessions_by_child.items()}
+        for child_id, row in feature_rows.items():
+            if row.session_count:
+                played_ids[child_id] = sorted(row.game_ids or [])
         
+        game_ids = {game_id for ids in played_ids.values() for game_id in ids}
+        games_by_id = {
+            g.id: g for g in db.query(Game).filter(Game.id.in_(game_ids)).all()
+        } if game_ids else {}
+        
+        children_by_id = {
+            c.id: c for c in db.query(Child).filter(Child.id.in_(child_ids)).all()
+        }
+        
+        # Collect features for every child with completed sessions, and for the rest when similar children can lend a prior
+        if self._has_similarity_index():
+            analyzed_ids = list(child_ids)
+        else:
+            analyzed_ids = [child_id for child_id in child_ids if child_id in played_ids]
+        child_games = {}
+        session_counts = {}
+        child_features = []
+        for child_id in analyzed_ids:
+            child_games[child_id] = [games_by_id[g] for g in played_ids.get(child_id, []) if g in games_by_id]
+            if child_id not in played_ids:
+                session_counts[child_id] = 0
+                child_features.append(features_from_store(new_child_features(child_id)))
+            elif child_id in feature_rows:
+                session_counts[child_id] = feature_rows[child_id].session_count
+                child_features.append(features_from_store(feature_rows[child_id]))
+            else:
+                session_counts[child_id] = len(sessions_by_child[child_id])
+                child_features.append(self.extract_features(sessions_by_child[child_id], child_games[child_id]))
+        
+        # Score the whole chunk with one model call per domain
+        feature_matrix = np.array(
+            [self._create_feature_vector(features) for features in child_features],
+            dtype=float
+        ).reshape(len(child_features), -1)
+        ml_scores = self.ml_based_detection_batch(feature_matrix)
+        
+        child_interests = []
+        scores = []
+        for row, child_id in enumerate(analyzed_ids):
+            child = children_by_id.get(child_id)
+            child_interests.append(child.initial_interests if child else [])
+            
+            rule_scores = self.rule_based_detection(child_features[row], child_interests[row])
+            scores.append(self._combine_scores(
+                rule_scores,
+                {domain: ml_scores[domain][row] for domain in self.domains}
+            ))
+        
+        # Short histories borrow from similar children in one index search for the chunk
+        scores = self._apply_neighbour_priors(
+            analyzed_ids, child_features, child_interests, [session_counts[child_id] for child_id in analyzed_ids], scores
+        )
+        
+        results = {}
+        for row, child_id in enumerate(analyzed_ids):
+            results[child_id] = self._build_analysis(
+                child_id, session_counts[child_id], child_games[child_id], child_features[row], scores[row]
+            )
+        
+        for child_id in child_ids:
+            if child_id not in results:
+                results[child_id] = self._empty_analysis(child_id)
+        
+        return results
+    
+    def _empty_analysis(self, child_id: int) -> Dict[str, Any]:
+        """Analysis result for a child without completed sessions"""
+        return {
+            "child_id": child_id,
+            "domains": [],
+            "insights": [],
+            "overall_confidence": 0.0,
+            "recommended_next_activities": [],
+            "development_trends": {},
+            "last_updated": datetime.now()
+        }
+    
+    def _build_analysis(self, child_id: int, session_count: int, games: List[Game], features: Dict[str, Any], passion_scores: Dict[str, float]) -> Dict[str, Any]:
+        """Turn detected passion scores into domains, insights and recommendations"""
         # Create passion domains
         domains = []
         for domain, score in passion_scores.items():
@@ -631,7 +940,7 @@ class PassionDetector:
                     strength_level=strength_level,
                     detection_method="hybrid",
                     model_version=settings.MODEL_VERSION,
-                    data_points_used=len(sessions),
+                    data_points_used=session_count,
                     supporting_evidence={
                         "total_sessions": features['total_sessions'],
                         "avg_score": features['avg_score'],
@@ -666,4 +975,4 @@ class PassionDetector:
             "recommended_next_activities": recommended_activities[:5],  # Top 5 recommendations
             "development_trends": {d.domain: d.trend for d in domains},
             "last_updated": datetime.now()
-        } 
\ No newline at end of file
+        }
\ No newline at end of file
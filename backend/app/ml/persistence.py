@@ -0,0 +1,181 @@
+"""
+Analysis Persistence
+Write path for passion detector output. Detected domains are upserted so each
+(child, domain) keeps exactly one active PassionDomain row whose trend compares
+the new confidence with the previous one; active domains the analysis no
+longer detects are deactivated as decreasing. The newest insight per
+(child, insight_type, title) is refreshed in place, so re-running an analysis
+does not add copies; older rows from before are kept as history. Every statement covers a whole batch of children,
+so saving N analyses costs one read plus one executemany per statement type
+instead of N ORM flushes. Confidence changes are also applied to the
+age-cohort histograms.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
+
+from app.models.passion import PassionDomain, PassionInsight
+from app.ml.cohort_stats import PASSION, lock_children, record_score_deltas
+
+TREND_THRESHOLD = 0.05  # Confidence change below this counts as stable
+
+# Columns produced by the detector for each domain and insight
+DOMAIN_FIELDS = [
+    "confidence_score",
+    "strength_level",
+    "detection_method",
+    "model_version",
+    "data_points_used",
+    "supporting_evidence",
+    "games_played",
+    "behavioral_patterns"
+]
+INSIGHT_FIELDS = [
+    "insight_type",
+    "title",
+    "description",
+    "data",
+    "related_domains",
+    "importance_score",
+    "is_highlighted",
+    "notify_parent"
+]
+
+def compute_trend(previous: Optional[float], current: float, threshold: float = TREND_THRESHOLD) -> str:
+    """Trend of a domain's confidence; a first detection counts as increasing"""
+    if previous is None:
+        return "increasing"
+    if current > previous + threshold:
+        return "increasing"
+    if current < previous - threshold:
+        return "decreasing"
+    return "stable"
+
+def _column_values(obj: Any, fields: List[str]) -> Dict[str, Any]:
+    """Attribute values of a transient ORM object, with column defaults for unset fields"""
+    columns = obj.__table__.columns
+    values = {}
+    for field in fields:
+        value = getattr(obj, field)
+        default = columns[field].default
+        if value is None and default is not None and default.is_scalar:
+            value = default.arg
+        values[field] = value
+    return values
+
+def save_analysis(db: Session, analysis: Dict[str, Any]) -> Dict[str, int]:
+    """Persist one analyze_child result (the caller commits)"""
+    return save_analyses(db, {analysis["child_id"]: analysis})
+
+def save_analyses(db: Session, analyses: Dict[int, Dict[str, Any]]) -> Dict[str, int]:
+    """Persist many analyze_child results with one statement per operation (the caller commits)"""
+    counts = {"domains_inserted": 0, "domains_updated": 0, "domains_deactivated": 0, "insights_inserted": 0, "insights_updated": 0}
+    if not analyses:
+        return counts
+    
+    # Lock the children first so concurrent saves do not both replace the same confidences
+    ages = lock_children(db, analyses)
+    cohort_deltas = []
+    
+    # Current active rows of every child in the batch
+    existing: Dict[Tuple[int, str], Tuple[int, float]] = {}
+    active_domains: Dict[int, List[str]] = {}
+    duplicates: List[int] = []
+    rows = db.query(
+        PassionDomain.id, PassionDomain.child_id, PassionDomain.domain, PassionDomain.confidence_score
+    ).filter(
+        PassionDomain.child_id.in_(list(analyses)),
+        PassionDomain.is_active == True
+    ).order_by(PassionDomain.id.desc()).all()
+    for domain_id, child_id, domain, confidence in rows:
+        key = (child_id, domain)
+        if key in existing:
+            # Older duplicates are retired so only the newest row stays active
+            duplicates.append(domain_id)
+            cohort_deltas.append((ages.get(child_id), domain, confidence, -1))
+        else:
+            existing[key] = (domain_id, confidence)
+            active_domains.setdefault(child_id, []).append(domain)
+    
+    # Newest stored insight per (child, type, title); older copies are left untouched
+    existing_insights: Dict[Tuple[int, str, str], int] = {
+        (child_id, insight_type, title): insight_id
+        for insight_id, child_id, insight_type, title in db.query(
+            func.max(PassionInsight.id), PassionInsight.child_id, PassionInsight.insight_type, PassionInsight.title
+        ).filter(
+            PassionInsight.child_id.in_(list(analyses))
+        ).group_by(PassionInsight.child_id, PassionInsight.insight_type, PassionInsight.title)
+    }
+    
+    now = datetime.now()
+    inserts = []
+    updates = []
+    dropped = []
+    insights = []
+    insight_updates = []
+    for child_id, analysis in analyses.items():
+        detected = {domain_obj.domain for domain_obj in analysis["domains"]}
+        trends = {}
+        for domain in active_domains.get(child_id, []):
+            if domain not in detected:
+                # No longer detected, so the active row stops describing the child
+                domain_id, confidence = existing[(child_id, domain)]
+                dropped.append({"id": domain_id, "is_active": False, "trend": "decreasing", "last_updated": now})
+                cohort_deltas.append((ages.get(child_id), domain, confidence, -1))
+                trends[domain] = "decreasing"
+        
+        for domain_obj in analysis["domains"]:
+            current = existing.get((child_id, domain_obj.domain))
+            domain_obj.trend = compute_trend(current[1] if current else None, domain_obj.confidence_score)
+            
+            values = _column_values(domain_obj, DOMAIN_FIELDS)
+            values["trend"] = domain_obj.trend
+            values["last_updated"] = now
+            cohort_deltas.append((ages.get(child_id), domain_obj.domain, domain_obj.confidence_score, 1))
+            if current:
+                values["id"] = current[0]
+                updates.append(values)
+                cohort_deltas.append((ages.get(child_id), domain_obj.domain, current[1], -1))
+            else:
+                values["child_id"] = child_id
+                values["domain"] = domain_obj.domain
+                values["is_active"] = True
+                inserts.append(values)
+        
+        trends.update((d.domain, d.trend) for d in analysis["domains"])
+        analysis["development_trends"] = trends
+        
+        for insight in analysis["insights"]:
+            values = _column_values(insight, INSIGHT_FIELDS)
+            insight_id = existing_insights.get((child_id, insight.insight_type, insight.title))
+            if insight_id:
+                # Refreshed in place, keeping created_at and parent_notified
+                values["id"] = insight_id
+                insight_updates.append(values)
+            else:
+                values["child_id"] = child_id
+                insights.append(values)
+    
+    if updates:
+        db.execute(update(PassionDomain), updates)
+    if duplicates:
+        db.execute(update(PassionDomain), [{"id": domain_id, "is_active": False} for domain_id in duplicates])
+    if dropped:
+        db.execute(update(PassionDomain), dropped)
+    if inserts:
+        db.execute(insert(PassionDomain), inserts)
+    if insight_updates:
+        db.execute(update(PassionInsight), insight_updates)
+    if insights:
+        db.execute(insert(PassionInsight), insights)
+    record_score_deltas(db, PASSION, cohort_deltas)
+    
+    counts["domains_inserted"] = len(inserts)
+    counts["domains_updated"] = len(updates)
+    counts["domains_deactivated"] = len(duplicates) + len(dropped)
+    counts["insights_inserted"] = len(insights)
+    counts["insights_updated"] = len(insight_updates)
+    return counts
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""
+Game Recommender
+Ranks the game catalog for each child from their active passion domain scores,
+category preferences from the feature store and the games they already
+played. Rankings are precomputed into child_recommendations, refreshed when a
+child completes a session or is re-analyzed, and recomputed lazily when the
+catalog or the child's age changed, so serving a request only slices a stored
+list against an in-memory catalog snapshot.
+"""
+
+import time
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.game import Game
+from app.models.child import Child
+from app.models.passion import PassionDomain
+from app.models.child_features import ChildFeatures
+from app.models.recommendation import ChildRecommendations
+from app.schemas.game import Game as GameSchema
+
+# Passion domains produced by the detector
+DOMAINS = [
+    "art_creativity",
+    "music_rhythm",
+    "science_discovery",
+    "sports_movement",
+    "leadership_social",
+    "language_communication",
+    "logic_mathematics"
+]
+
+# Ranking weights
+DOMAIN_WEIGHT = 0.6  # Best matching passion domain confidence
+CATEGORY_WEIGHT = 0.3  # Share of the child's completed sessions in the game's category
+RATING_WEIGHT = 0.1  # Average rating, mostly a tie-breaker for new children
+PLAYED_FACTOR = 0.5  # Games already played rank lower to keep exploring
+
+def catalog_version(db: Session) -> str:
+    """Fingerprint of the active game catalog"""
+    count, max_id, max_created, max_updated = db.query(
+        func.count(Game.id), func.max(Game.id), func.max(Game.created_at), func.max(Game.updated_at)
+    ).filter(Game.is_active == True).one()
+    return f"{count}:{max_id}:{max_created}:{max_updated}"
+
+class GameCatalog:
+    """Array view of the active games used to rank them for many children at once"""
+    
+    def __init__(self, games: List[Game], version: str):
+        self.version = version
+        games = sorted(games, key=lambda g: g.id)
+        self.game_ids = np.array([g.id for g in games], dtype=np.int64)
+        self.games = {g.id: GameSchema.model_validate(g) for g in games}
+        
+        # Open age bounds never exclude a child
+        self.age_min = np.array([g.age_min if g.age_min is not None else -np.inf for g in games], dtype=float)
+        self.age_max = np.array([g.age_max if g.age_max is not None else np.inf for g in games], dtype=float)
+        
+        self.categories = sorted({g.category for g in games})
+        category_index = {category: i for i, category in enumerate(self.categories)}
+        self.game_category = np.array([category_index[g.category] for g in games], dtype=np.int64)
+        
+        self.domain_membership = np.zeros((len(games), len(DOMAINS)))
+        for row, game in enumerate(games):
+            for domain in game.passion_domains or []:
+                if domain in DOMAINS:
+                    self.domain_membership[row, DOMAINS.index(domain)] = 1.0
+        
+        self.rating = np.array([(g.average_rating or 0.0) / 5.0 for g in games])
+    
+    def rank(self, ages: np.ndarray, domain_scores: np.ndarray, category_counts: np.ndarray, played: np.ndarray, size: int) -> List[List[tuple]]:
+        """Top (game_id, score) pairs per child, best first; ties keep catalog (id) order"""
+        # Best matching passion domain per (child, game)
+        affinity = (domain_scores[:, None, :] * self.domain_membership[None, :, :]).max(axis=2)
+        
+        totals = category_counts.sum(axis=1, keepdims=True)
+        category_share = np.divide(category_counts, totals, out=np.zeros_like(category_counts), where=totals > 0)
+        
+        scores = DOMAIN_WEIGHT * affinity + CATEGORY_WEIGHT * category_share[:, self.game_category] + RATING_WEIGHT * self.rating
+        scores = np.where(played, scores * PLAYED_FACTOR, scores)
+        
+        # Only age-appropriate games are recommended
+        eligible = (self.age_min[None, :] <= ages[:, None]) & (self.age_max[None, :] >= ages[:, None])
+        scores = np.where(eligible, scores, -np.inf)
+        
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :size]
+        rankings = []
+        for row in range(len(ages)):
+            top = order[row][np.isfinite(scores[row, order[row]])]
+            rankings.append(list(zip(self.game_ids[top].tolist(), np.round(scores[row, top], 6).tolist())))
+        return rankings
+
+class GameCatalogCache:
+    """Process-wide catalog snapshot, reloaded when the catalog version changes"""
+    
+    def __init__(self, check_interval: float = 30.0):
+        self.check_interval = check_interval
+        self._catalog: Optional[GameCatalog] = None
+        self._last_checked = 0.0
+        self._lock = threading.Lock()
+    
+    def get(self, db: Session) -> GameCatalog:
+        """Return the current catalog, checking its version at most every check_interval seconds"""
+        catalog = self._catalog
+        if catalog is not None and time.monotonic() - self._last_checked < self.check_interval:
+            return catalog
+        
+        with self._lock:
+            version = catalog_version(db)
+            if self._catalog is None or self._catalog.version != version:
+                games = db.query(Game).filter(Game.is_active == True).all()
+                self._catalog = GameCatalog(games, version)
+            self._last_checked = time.monotonic()
+            return self._catalog
+    
+    def invalidate(self) -> None:
+        """Force a version check on next use (called after catalog writes)"""
+        self._last_checked = 0.0
+
+_catalog_cache: Optional[GameCatalogCache] = None
+_catalog_cache_lock = threading.Lock()
+
+def get_catalog_cache() -> GameCatalogCache:
+    """Return the process-wide game catalog cache"""
+    global _catalog_cache
+    if _catalog_cache is None:
+        with _catalog_cache_lock:
+            if _catalog_cache is None:
+                _catalog_cache = GameCatalogCache(check_interval=settings.RECOMMENDATION_CATALOG_CHECK_INTERVAL)
+    return _catalog_cache
+
+def get_game_catalog(db: Session) -> GameCatalog:
+    """Return the cached active game catalog"""
+    return get_catalog_cache().get(db)
+
+def invalidate_game_catalog() -> None:
+    """Catalog change hook for the game write endpoints"""
+    get_catalog_cache().invalidate()
+
+def refresh_recommendations(db: Session, child_ids: List[int], catalog: Optional[GameCatalog] = None, chunk_size: int = 1000) -> Dict[int, List[tuple]]:
+    """Recompute and store ranked games for many children (the caller commits)"""
+    catalog = catalog or get_game_catalog(db)
+    size = settings.RECOMMENDATION_LIST_SIZE
+    db.flush()
+    
+    rankings = {}
+    for start in range(0, len(child_ids), chunk_size):
+        chunk = child_ids[start:start + chunk_size]
+        ages = dict(db.query(Child.id, Child.age).filter(Child.id.in_(chunk)).all())
+        ids = [child_id for child_id in chunk if child_id in ages]
+        if not ids:
+            continue
+        row_of = {child_id: row for row, child_id in enumerate(ids)}
+        
+        # Active passion domain scores
+        domain_scores = np.zeros((len(ids), len(DOMAINS)))
+        for child_id, domain, confidence in db.query(
+            PassionDomain.child_id, PassionDomain.domain, PassionDomain.confidence_score
+        ).filter(PassionDomain.child_id.in_(ids), PassionDomain.is_active == True).all():
+            if domain in DOMAINS:
+                column = DOMAINS.index(domain)
+                domain_scores[row_of[child_id], column] = max(domain_scores[row_of[child_id], column], confidence)
+        
+        # Category preferences and played games from the feature store
+        category_counts = np.zeros((len(ids), len(catalog.categories)))
+        played = np.zeros((len(ids), len(catalog.game_ids)), dtype=bool)
+        category_index = {category: i for i, category in enumerate(catalog.categories)}
+        for child_id, counts, game_ids in db.query(
+            ChildFeatures.child_id, ChildFeatures.category_counts, ChildFeatures.game_ids
+        ).filter(ChildFeatures.child_id.in_(ids)).all():
+            for category, count in (counts or {}).items():
+                if category in category_index:
+                    category_counts[row_of[child_id], category_index[category]] = count
+            played[row_of[child_id]] = np.isin(catalog.game_ids, game_ids or [])
+        
+        ages_array = np.array([ages[child_id] for child_id in ids], dtype=np.float64)
+        chunk_rankings = catalog.rank(ages_array, domain_scores, category_counts, played, size)
+        rankings.update(zip(ids, chunk_rankings))
+        _store_rankings(db, {child_id: rankings[child_id] for child_id in ids}, ages, catalog.version)
+    
+    return rankings
+
+def _store_rankings(db: Session, rankings: Dict[int, List[tuple]], ages: Dict[int, int], version: str) -> None:
+    """Upsert ranking rows with one read and one executemany per statement type"""
+    existing = dict(db.query(ChildRecommendations.child_id, ChildRecommendations.id).filter(
+        ChildRecommendations.child_id.in_(list(rankings))
+    ).all())
+    
+    now = datetime.now()
+    updates = []
+    inserts = []
+    for child_id, ranking in rankings.items():
+        values = {
+            "game_ids": [game_id for game_id, _ in ranking],
+            "scores": [score for _, score in ranking],
+            "catalog_version": version,
+            "child_age": ages.get(child_id),
+            "computed_at": now
+        }
+        if child_id in existing:
+            values["id"] = existing[child_id]
+            updates.append(values)
+        else:
+            values["child_id"] = child_id
+            inserts.append(values)
+    
+    if updates:
+        db.execute(update(ChildRecommendations), updates)
+    if inserts:
+        db.execute(insert(ChildRecommendations), inserts)
+
+def recommend_games(db: Session, child: Child, limit: int) -> List[GameSchema]:
+    """Serve a child's top games from the stored ranking, recomputing it only if stale"""
+    catalog = get_game_catalog(db)
+    row = db.query(ChildRecommendations.game_ids, ChildRecommendations.catalog_version, ChildRecommendations.child_age).filter(
+        ChildRecommendations.child_id == child.id
+    ).first()
+    
+    if row is None or row.catalog_version != catalog.version or row.child_age != child.age:
+        ranking = refresh_recommendations(db, [child.id], catalog).get(child.id, [])
+        db.commit()
+        game_ids = [game_id for game_id, _ in ranking]
+    else:
+        game_ids = row.game_ids
+    
+    return [catalog.games[game_id] for game_id in game_ids[:limit] if game_id in catalog.games]
\ No newline at end of file
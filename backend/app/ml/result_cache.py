@@ -0,0 +1,157 @@
+"""
+Analysis Result Cache
+Caches passion and talent analysis results per child. Entries are keyed by the
+child's data watermark (latest session and response ids, update times and row
+counts, profile update time) plus the model version, so any new or changed
+data misses the cache without explicit coordination between workers. Write
+endpoints also invalidate a child's entries directly, and entries expire after
+a TTL as a last resort.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable, Optional, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.session import GameSession
+from app.models.question import QuestionResponse
+from app.models.child import Child
+
+def data_watermark(db: Session, child_id: int) -> Tuple:
+    """Single-query fingerprint of everything a child's analysis depends on"""
+    def child_sessions(column):
+        return select(column).where(GameSession.child_id == child_id).scalar_subquery()
+    
+    def child_responses(column):
+        return select(column).where(QuestionResponse.child_id == child_id).scalar_subquery()
+    
+    row = db.execute(select(
+        child_sessions(func.max(GameSession.id)),
+        child_sessions(func.max(GameSession.updated_at)),
+        child_sessions(func.count(GameSession.id)),
+        child_responses(func.max(QuestionResponse.id)),
+        child_responses(func.count(QuestionResponse.id)),
+        select(Child.updated_at).where(Child.id == child_id).scalar_subquery()
+    )).first()
+    return tuple(row) if row is not None else ()
+
+class AnalysisResultCache:
+    """Thread-safe LRU cache with TTL for per-child analysis results"""
+    
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._keys_by_child: Dict[int, set] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def make_key(self, kind: Hashable, child_id: int, db: Session, model_version: Optional[Hashable] = None) -> Tuple:
+        """Cache key for an analysis kind of a child at its current data watermark"""
+        return (kind, child_id, data_watermark(db, child_id), model_version or settings.MODEL_VERSION)
+    
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Return (found, value) for a key, counting the hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.monotonic() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+    
+    def put(self, key: Tuple, value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond max_size"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (time.monotonic(), value)
+            self._keys_by_child.setdefault(key[1], set()).add(key)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+    
+    def get_or_compute(self, kind: Hashable, child_id: int, db: Session, compute: Callable[[], Any], model_version: Optional[Hashable] = None) -> Any:
+        """Return the cached result for the child's current data, computing and storing it on a miss"""
+        key = self.make_key(kind, child_id, db, model_version)
+        found, value = self.get(key)
+        if found:
+            return value
+        value = compute()
+        self.put(key, value)
+        return value
+    
+    def invalidate(self, child_id: int) -> int:
+        """Drop every cached result of a child; returns the number of entries removed"""
+        with self._lock:
+            keys = list(self._keys_by_child.get(child_id, ()))
+            for key in keys:
+                self._remove(key)
+            if keys:
+                self.invalidations += len(keys)
+            return len(keys)
+    
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_child.clear()
+            self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy for sizing the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+    
+    def _remove(self, key: Tuple) -> None:
+        """Remove an entry and its child index reference (caller holds the lock)"""
+        self._entries.pop(key, None)
+        child_keys = self._keys_by_child.get(key[1])
+        if child_keys is not None:
+            child_keys.discard(key)
+            if not child_keys:
+                del self._keys_by_child[key[1]]
+
+_result_cache: Optional[AnalysisResultCache] = None
+_result_cache_lock = threading.Lock()
+
+def get_result_cache() -> AnalysisResultCache:
+    """Return the process-wide analysis result cache"""
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = AnalysisResultCache(
+                    max_size=settings.ANALYSIS_CACHE_SIZE,
+                    ttl_seconds=settings.ANALYSIS_CACHE_TTL_SECONDS
+                )
+    return _result_cache
+
+def invalidate_child_results(child_id: int) -> None:
+    """Invalidation hook for endpoints that write a child's sessions, responses or profile"""
+    get_result_cache().invalidate(child_id)
\ No newline at end of file
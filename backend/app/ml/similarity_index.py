@@ -0,0 +1,275 @@
+"""
+Similar Children Index
+Nearest-neighbour index over child feature vectors (the detector's feature
+vector plus an encoding of the parent-reported initial interests). The index
+is built offline from the feature store and the active passion domains, saved
+as plain .npy arrays and memory-mapped at serve time. Cold-start analyses use
+the domain confidences of the most similar well-observed children as a prior.
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.child import Child
+from app.models.passion import PassionDomain
+from app.models.child_features import ChildFeatures
+from app.ml.feature_store import features_from_store
+from app.ml.artifacts import new_build_directory, publish_directory, discard_build
+
+INTEREST_WEIGHT = 1.0  # Weight of the interest encoding relative to the standardized behaviour features
+SEARCH_BLOCK_ELEMENTS = 1 << 24  # Similarities computed per matrix product, bounds query memory
+
+def index_path() -> str:
+    """Directory of the served similarity index"""
+    return os.path.join(settings.MODEL_PATH, "similarity_index")
+
+class SimilarityIndex:
+    """Brute-force cosine similarity search over unit-length child vectors"""
+    
+    def __init__(self, vectors: np.ndarray, child_ids: np.ndarray, priors: np.ndarray, mean: np.ndarray, scale: np.ndarray, domains: List[str], built_at: Optional[str] = None):
+        self.vectors = vectors
+        self.child_ids = child_ids
+        self.priors = priors
+        self.mean = mean
+        self.scale = scale
+        self.domains = domains
+        self.built_at = built_at
+    
+    def __len__(self) -> int:
+        return len(self.child_ids)
+    
+    def encode(self, feature_vectors: np.ndarray, interest_counts: np.ndarray) -> np.ndarray:
+        """Query vectors from raw detector feature vectors and interest match counts"""
+        behaviour = (np.log1p(np.maximum(feature_vectors, 0.0)) - self.mean) / self.scale
+        interest_totals = interest_counts.sum(axis=1, keepdims=True)
+        interests = np.divide(interest_counts, interest_totals, out=np.zeros_like(interest_counts, dtype=np.float64), where=interest_totals > 0)
+        vectors = np.hstack([behaviour, INTEREST_WEIGHT * interests])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return (vectors / np.where(norms > 0, norms, 1.0)).astype(np.float32)
+    
+    def search(self, queries: np.ndarray, k: int, exclude_ids: Optional[List[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k index rows and cosine similarities per query, best first"""
+        n_queries = queries.shape[0]
+        k = min(k, len(self))
+        best_rows = np.zeros((n_queries, 0), dtype=np.int64)
+        best_sims = np.zeros((n_queries, 0), dtype=np.float32)
+        if k == 0:
+            return best_rows, best_sims
+        
+        # A child never counts as its own neighbour; ids are sorted so its row is found by bisection
+        exclude_rows = np.full(n_queries, -1, dtype=np.int64)
+        if exclude_ids is not None:
+            ids = np.array([-1 if child_id is None else child_id for child_id in exclude_ids], dtype=np.int64)
+            positions = np.minimum(np.searchsorted(self.child_ids, ids), len(self) - 1)
+            exclude_rows = np.where(np.asarray(self.child_ids[positions]) == ids, positions, -1)
+        
+        # Larger batches of queries scan the index in smaller blocks to bound memory
+        block_size = max(1024, SEARCH_BLOCK_ELEMENTS // max(n_queries, 1))
+        for start in range(0, len(self), block_size):
+            block = np.asarray(self.vectors[start:start + block_size])
+            sims = queries @ block.T
+            
+            in_block = (exclude_rows >= start) & (exclude_rows < start + block.shape[0])
+            sims[in_block, exclude_rows[in_block] - start] = -np.inf
+            
+            # Top-k of the block, then merged with the running top-k
+            block_k = min(k, block.shape[0])
+            top = np.argpartition(-sims, block_k - 1, axis=1)[:, :block_k]
+            candidate_sims = np.hstack([best_sims, np.take_along_axis(sims, top, axis=1)])
+            candidate_rows = np.hstack([best_rows, top + start])
+            keep = min(k, candidate_sims.shape[1])
+            top = np.argpartition(-candidate_sims, keep - 1, axis=1)[:, :keep]
+            best_sims = np.take_along_axis(candidate_sims, top, axis=1)
+            best_rows = np.take_along_axis(candidate_rows, top, axis=1)
+        
+        order = np.argsort(-best_sims, axis=1, kind="stable")
+        return np.take_along_axis(best_rows, order, axis=1), np.take_along_axis(best_sims, order, axis=1)
+    
+    def neighbours(self, query: np.ndarray, k: int, exclude_id: Optional[int] = None) -> List[Tuple[int, float]]:
+        """(child_id, similarity) of the children most like one query vector"""
+        rows, sims = self.search(query.reshape(1, -1), k, [exclude_id] if exclude_id is not None else None)
+        return [
+            (int(self.child_ids[row]), float(sim))
+            for row, sim in zip(rows[0], sims[0]) if np.isfinite(sim)
+        ]
+    
+    def domain_priors(self, queries: np.ndarray, k: int, exclude_ids: Optional[List[int]] = None) -> np.ndarray:
+        """Similarity-weighted mean domain confidences of each query's neighbours"""
+        rows, sims = self.search(queries, k, exclude_ids)
+        weights = np.where(np.isfinite(sims), np.maximum(sims, 0.0), 0.0)
+        totals = weights.sum(axis=1, keepdims=True)
+        weighted = (weights[:, :, None] * np.asarray(self.priors)[rows]).sum(axis=1)
+        return np.divide(weighted, totals, out=np.zeros_like(weighted), where=totals > 0)
+    
+    def save(self, path: str) -> None:
+        """Write the index arrays and metadata into a directory"""
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "vectors.npy"), self.vectors)
+        np.save(os.path.join(path, "child_ids.npy"), self.child_ids)
+        np.save(os.path.join(path, "priors.npy"), self.priors)
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({
+                "mean": self.mean.tolist(),
+                "scale": self.scale.tolist(),
+                "domains": self.domains,
+                "children": len(self),
+                "dimensions": int(self.vectors.shape[1]) if self.vectors.ndim == 2 else 0,
+                "built_at": self.built_at
+            }, f, indent=2)
+    
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = "r") -> "SimilarityIndex":
+        """Load an index directory, memory-mapping the arrays"""
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        return cls(
+            vectors=np.load(os.path.join(path, "vectors.npy"), mmap_mode=mmap_mode),
+            child_ids=np.load(os.path.join(path, "child_ids.npy"), mmap_mode=mmap_mode),
+            priors=np.load(os.path.join(path, "priors.npy"), mmap_mode=mmap_mode),
+            mean=np.array(meta["mean"]),
+            scale=np.array(meta["scale"]),
+            domains=meta["domains"],
+            built_at=meta.get("built_at")
+        )
+
+def interest_counts(detector: Any, interests_list: List[Optional[List[str]]]) -> np.ndarray:
+    """Per-domain keyword matches of each child's initial interests"""
+    counts = np.zeros((len(interests_list), len(detector.domains)))
+    for row, interests in enumerate(interests_list):
+        matched = detector.domain_matcher.count_matches(interests or [])
+        counts[row] = [matched.get(domain, 0) for domain in detector.domains]
+    return counts
+
+def build_similarity_index(db: Session, detector: Any, path: Optional[str] = None, min_sessions: int = 5, batch_size: int = 1000) -> Dict[str, Any]:
+    """Build the index from well-observed children in the feature store and publish it with one symlink swap"""
+    path = path or index_path()
+    start = time.perf_counter()
+    
+    feature_vectors = []
+    interests = []
+    priors = []
+    child_ids = []
+    query = db.query(ChildFeatures).filter(ChildFeatures.session_count >= min_sessions).order_by(ChildFeatures.child_id)
+    batch = []
+    for row in query.yield_per(batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            _collect_batch(db, detector, batch, feature_vectors, interests, priors, child_ids)
+            batch = []
+    if batch:
+        _collect_batch(db, detector, batch, feature_vectors, interests, priors, child_ids)
+    
+    n_features = len(detector._create_feature_vector({}))
+    X = np.array(feature_vectors, dtype=np.float64).reshape(len(feature_vectors), n_features)
+    behaviour = np.log1p(np.maximum(X, 0.0))
+    mean = behaviour.mean(axis=0) if len(X) else np.zeros(n_features)
+    std = behaviour.std(axis=0) if len(X) else np.ones(n_features)
+    scale = np.where(std > 0, std, 1.0)
+    
+    index = SimilarityIndex(
+        vectors=np.zeros((0, n_features + len(detector.domains)), dtype=np.float32),
+        child_ids=np.array(child_ids, dtype=np.int64),
+        priors=np.array(priors, dtype=np.float32).reshape(len(priors), len(detector.domains)),
+        mean=mean,
+        scale=scale,
+        domains=list(detector.domains),
+        built_at=datetime.now().isoformat()
+    )
+    index.vectors = index.encode(X, interest_counts(detector, interests))
+    
+    # Write a new build and publish it in one step so readers never see a partial or missing index
+    staging_dir = new_build_directory(path)
+    try:
+        index.save(staging_dir)
+        publish_directory(staging_dir, path)
+    except Exception:
+        discard_build(staging_dir)
+        raise
+    
+    return {"children": len(index), "dimensions": int(index.vectors.shape[1]), "build_seconds": time.perf_counter() - start, "path": path}
+
+def _collect_batch(db: Session, detector: Any, batch: List[ChildFeatures], feature_vectors: list, interests: list, priors: list, child_ids: list) -> None:
+    """Append index rows for one batch of feature rows that have active passion domains"""
+    ids = [row.child_id for row in batch]
+    domain_column = {domain: column for column, domain in enumerate(detector.domains)}
+    
+    confidences: Dict[int, np.ndarray] = {}
+    for child_id, domain, confidence in db.query(
+        PassionDomain.child_id, PassionDomain.domain, PassionDomain.confidence_score
+    ).filter(PassionDomain.child_id.in_(ids), PassionDomain.is_active == True).all():
+        if domain in domain_column:
+            prior = confidences.setdefault(child_id, np.zeros(len(detector.domains)))
+            prior[domain_column[domain]] = max(prior[domain_column[domain]], confidence)
+    
+    child_interests = dict(db.query(Child.id, Child.initial_interests).filter(Child.id.in_(ids)).all())
+    
+    for row in batch:
+        # Children without detected domains have nothing to lend as a prior
+        if row.child_id not in confidences:
+            continue
+        feature_vectors.append(detector._create_feature_vector(features_from_store(row)))
+        interests.append(child_interests.get(row.child_id))
+        priors.append(confidences[row.child_id])
+        child_ids.append(row.child_id)
+
+class SimilarityIndexCache:
+    """Process-wide handle on the served index, reloaded when it is rebuilt"""
+    
+    def __init__(self, check_interval: float = 30.0, mmap_mode: Optional[str] = "r"):
+        self.check_interval = check_interval
+        self.mmap_mode = mmap_mode
+        self._index: Optional[SimilarityIndex] = None
+        self._file_state: Optional[Tuple[str, float, int]] = None
+        self._last_checked = 0.0
+        self._lock = threading.Lock()
+    
+    def get(self) -> Optional[SimilarityIndex]:
+        """Return the current index, or None if none has been built"""
+        if time.monotonic() - self._last_checked < self.check_interval:
+            return self._index
+        
+        with self._lock:
+            meta_path = os.path.join(index_path(), "meta.json")
+            try:
+                stat = os.stat(meta_path)
+                file_state = (os.path.realpath(meta_path), stat.st_mtime, stat.st_size)
+            except OSError:
+                file_state = None
+            
+            if file_state is None and self._index is not None:
+                # Missing only while a directory is moved aside; keep the loaded index
+                self._last_checked = time.monotonic()
+                return self._index
+            
+            if file_state != self._file_state:
+                try:
+                    self._index = SimilarityIndex.load(index_path(), self.mmap_mode) if file_state else None
+                except Exception as e:
+                    print(f"Error loading similarity index: {e}")
+                    self._index = None
+                self._file_state = file_state
+            self._last_checked = time.monotonic()
+            return self._index
+
+_index_cache: Optional[SimilarityIndexCache] = None
+_index_cache_lock = threading.Lock()
+
+def get_similarity_index() -> Optional[SimilarityIndex]:
+    """Return the process-wide similarity index, or None if none has been built"""
+    global _index_cache
+    if _index_cache is None:
+        with _index_cache_lock:
+            if _index_cache is None:
+                _index_cache = SimilarityIndexCache(
+                    check_interval=settings.MODEL_RELOAD_INTERVAL,
+                    mmap_mode=settings.MODEL_MMAP_MODE
+                )
+    return _index_cache.get()
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""
+Model Training
+Offline pipeline producing the {domain}_model.pkl files loaded by the model
+registry. Sessions are streamed with server-side cursors and folded into one
+feature row per child, so memory grows with labelled children, not sessions.
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+import joblib
+from joblib import Parallel, delayed
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sklearn.linear_model import LogisticRegression
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import roc_auc_score, accuracy_score
+
+from app.models.passion import PassionDomain
+from app.ml.feature_store import stream_feature_rows, features_from_store
+from app.ml.artifacts import new_build_directory, publish_directory
+
+def load_verified_labels(db: Session) -> Dict[int, set]:
+    """Map child id to the set of parent-verified passion domains"""
+    labels = {}
+    rows = db.query(PassionDomain.child_id, PassionDomain.domain).filter(
+        PassionDomain.is_verified == True
+    ).yield_per(10000)
+    for child_id, domain in rows:
+        labels.setdefault(child_id, set()).add(domain)
+    return labels
+
+def build_training_matrix(db: Session, detector: Any, labels: Dict[int, set], batch_size: int = 1000) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+    """Stream sessions of labelled children into a feature matrix and a label matrix"""
+    labelled_children = select(PassionDomain.child_id).where(PassionDomain.is_verified == True).distinct()
+    
+    vectors = []
+    targets = []
+    child_ids = []
+    for row in stream_feature_rows(db, labelled_children, batch_size):
+        domains = labels.get(row.child_id)
+        if not domains:
+            continue
+        # Same feature construction as inference
+        vectors.append(detector._create_feature_vector(features_from_store(row)))
+        targets.append([1 if domain in domains else 0 for domain in detector.domains])
+        child_ids.append(row.child_id)
+    
+    X = np.array(vectors, dtype=np.float64).reshape(len(vectors), -1)
+    Y = np.array(targets, dtype=np.int8).reshape(len(targets), len(detector.domains))
+    return X, Y, child_ids
+
+def make_model(model_type: str, random_state: int) -> Any:
+    """Create an untrained domain classifier (both kinds compile to the fused representation)"""
+    if model_type == "forest":
+        return RandomForestClassifier(n_estimators=100, max_depth=8, class_weight="balanced", random_state=random_state, n_jobs=1)
+    return LogisticRegression(max_iter=2000, class_weight="balanced")
+
+def train_domain_model(domain: str, X: np.ndarray, y: np.ndarray, model_type: str, random_state: int = 42) -> Dict[str, Any]:
+    """Train and evaluate one domain model (runs in a worker process)"""
+    positives = int(y.sum())
+    if positives == 0 or positives == len(y):
+        return {"domain": domain, "model": None, "metrics": {"skipped": "needs both positive and negative examples", "positives": positives, "samples": len(y)}}
+    
+    stratify = y if min(positives, len(y) - positives) >= 2 else None
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=random_state, stratify=stratify)
+    
+    # Evaluate on the holdout split, then refit on everything for the shipped artifact
+    start = time.perf_counter()
+    model = make_model(model_type, random_state).fit(X_train, y_train)
+    metrics = {"positives": positives, "samples": len(y)}
+    if len(set(y_test)) > 1:
+        metrics["holdout_auc"] = float(roc_auc_score(y_test, model.predict_proba(X_test)[:, 1]))
+    if len(y_test):
+        metrics["holdout_accuracy"] = float(accuracy_score(y_test, model.predict(X_test)))
+    
+    model = make_model(model_type, random_state).fit(X, y)
+    metrics["train_seconds"] = time.perf_counter() - start
+    
+    return {"domain": domain, "model": model, "metrics": metrics}
+
+def measure_inference(model: Any, X: np.ndarray, repeats: int = 50) -> Dict[str, float]:
+    """Single-row and batch predict_proba latency"""
+    single = X[:1]
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict_proba(single)
+        timings.append(time.perf_counter() - start)
+    
+    batch = X[:1000]
+    start = time.perf_counter()
+    model.predict_proba(batch)
+    batch_seconds = time.perf_counter() - start
+    
+    return {
+        "single_row_p50_ms": float(np.percentile(timings, 50) * 1000),
+        "single_row_p95_ms": float(np.percentile(timings, 95) * 1000),
+        "batch_rows": int(len(batch)),
+        "batch_ms": batch_seconds * 1000
+    }
+
+def train_models(db: Session, detector: Any, model_path: str, version: str, model_type: str = "logistic", n_jobs: int = -1, batch_size: int = 1000) -> Dict[str, Any]:
+    """Train every domain model in parallel and write a versioned artifact directory"""
+    start = time.perf_counter()
+    labels = load_verified_labels(db)
+    X, Y, child_ids = build_training_matrix(db, detector, labels, batch_size)
+    feature_seconds = time.perf_counter() - start
+    
+    if len(child_ids) == 0:
+        raise ValueError("No children with parent-verified passion domains to train on")
+    
+    # One job per domain across all cores
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(train_domain_model)(domain, X, Y[:, column], model_type)
+        for column, domain in enumerate(detector.domains)
+    )
+    
+    # Write a new build and publish it in one step so the registry never sees a partial or missing version
+    target_dir = os.path.join(model_path, version)
+    staging_dir = new_build_directory(target_dir)
+    
+    domain_metrics = {}
+    for result in results:
+        domain = result["domain"]
+        metrics = result["metrics"]
+        if result["model"] is not None:
+            model_file = os.path.join(staging_dir, f"{domain}_model.pkl")
+            # Uncompressed so the registry can memory-map the arrays
+            joblib.dump(result["model"], model_file)
+            metrics["file_bytes"] = os.path.getsize(model_file)
+            metrics["inference"] = measure_inference(result["model"], X)
+        domain_metrics[domain] = metrics
+    
+    summary = {
+        "version": version,
+        "model_type": model_type,
+        "trained_at": datetime.now().isoformat(),
+        "children": len(child_ids),
+        "features": int(X.shape[1]),
+        "feature_seconds": feature_seconds,
+        "total_seconds": time.perf_counter() - start,
+        "domains": domain_metrics
+    }
+    with open(os.path.join(staging_dir, "metrics.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    
+    publish_directory(staging_dir, target_dir)
+    
+    return summary
\ No newline at end of file
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Index
+from app.core.database import Base
+
+class AnalysisJob(Base):
+    __tablename__ = "analysis_jobs"
+    __table_args__ = (
+        Index("ix_analysis_jobs_key_status", "job_key", "status"),
+    )
+    
+    id = Column(String, primary_key=True)  # uuid4 hex, handed to the client for polling
+    job_key = Column(String, nullable=False)  # Requests with the same key share one active job
+    owner_id = Column(Integer, nullable=False)
+    child_id = Column(Integer, nullable=False)
+    
+    # Job state
+    status = Column(String, nullable=False, default="queued")  # queued, running, completed, failed
+    coalesced_requests = Column(Integer, nullable=False, default=0)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    def __repr__(self):
+        return f"<AnalysisJob(id='{self.id}', key='{self.job_key}', status='{self.status}')>"
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -6,6 +6,9 @@ from datetime import datetime
 
 class Child(Base):
     __tablename__ = "children"
+    __table_args__ = (
+        Index("ix_children_parent_id", "parent_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)  # Reference to User table
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, DateTime, JSON, Float
+from sqlalchemy.sql import func
+from app.core.database import Base
+from datetime import datetime
+
+class ChildFeatures(Base):
+    __tablename__ = "child_features"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    child_id = Column(Integer, unique=True, index=True, nullable=False)
+    
+    # Completed session totals
+    session_count = Column(Integer, default=0)
+    duration_sum = Column(Float, default=0.0)  # in seconds
+    duration_sum_sq = Column(Float, default=0.0)
+    
+    # Score statistics (sessions with a score only)
+    score_count = Column(Integer, default=0)
+    score_sum = Column(Float, default=0.0)
+    score_sum_sq = Column(Float, default=0.0)
+    max_score = Column(Float, nullable=True)
+    
+    # Accuracy statistics (sessions with an accuracy only)
+    accuracy_count = Column(Integer, default=0)
+    accuracy_sum = Column(Float, default=0.0)
+    accuracy_sum_sq = Column(Float, default=0.0)
+    
+    # Behavioral statistics
+    response_time_count = Column(Integer, default=0)  # Individual response times from speed_metrics
+    response_time_sum = Column(Float, default=0.0)
+    emotional_count = Column(Integer, default=0)  # Sessions with emotional reactions
+    emotional_sum = Column(Float, default=0.0)  # Sum of positive emotion scores
+    
+    # Per-category counters and played games
+    category_counts = Column(JSON, nullable=True)  # {"art": 3, "music": 1}
+    game_ids = Column(JSON, nullable=True)  # Distinct game ids played
+    
+    # Watermark
+    last_session_id = Column(Integer, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ChildFeatures(child_id={self.child_id}, sessions={self.session_count})>"
\ No newline at end of file
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class CohortScoreBin(Base):
+    __tablename__ = "cohort_score_bins"
+    __table_args__ = (
+        UniqueConstraint("source", "age", "domain", "bin", name="uq_cohort_score_bin"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    
+    # Cohort and histogram cell
+    source = Column(String, nullable=False)  # passion (PassionDomain confidence) or talent (TalentAssessment score)
+    age = Column(Integer, nullable=False)
+    domain = Column(String, nullable=False)
+    bin = Column(Integer, nullable=False)  # score bucket, 0 to COHORT_BINS - 1
+    
+    # Number of children whose current score falls in the bucket; counts from any worker simply add up
+    count = Column(Integer, nullable=False, default=0)
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<CohortScoreBin(source='{self.source}', age={self.age}, domain='{self.domain}', bin={self.bin}, count={self.count})>"
\ No newline at end of file
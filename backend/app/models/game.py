@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float, ForeignKey, Index
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from app.core.database import Base
 from datetime import datetime
@@ -16,6 +17,10 @@ class Game(Base):
     difficulty_levels = Column(JSON, nullable=True)  # Available difficulty levels
     age_range = Column(JSON, nullable=False)  # {"min": 3, "max": 8}
     
+    # Indexed copies of age_range for filtering, kept in sync by _sync_age_bounds
+    age_min = Column(Integer, nullable=True, index=True)
+    age_max = Column(Integer, nullable=True, index=True)
+    
     # Game mechanics
     estimated_duration = Column(Integer, nullable=True)  # in minutes
     max_players = Column(Integer, default=1)
@@ -25,6 +30,8 @@ class Game(Base):
     
     # Passion domains this game can detect
     passion_domains = Column(JSON, nullable=False)  # List of domains this game targets
+    # One row per domain for filtering, kept in sync by _sync_domain_links
+    domain_links = relationship("GamePassionDomain", cascade="all, delete-orphan")
     
     # Game state
     is_active = Column(Boolean, default=True)
@@ -40,5 +47,34 @@ class Game(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    @validates("age_range")
+    def _sync_age_bounds(self, key, age_range):
+        """Mirror the age range into age_min and age_max"""
+        self.age_min = (age_range or {}).get("min")
+        self.age_max = (age_range or {}).get("max")
+        return age_range
+    
+    @validates("passion_domains")
+    def _sync_domain_links(self, key, passion_domains):
+        """Mirror the domain list into game_passion_domains rows"""
+        domains = set(passion_domains or [])
+        # Unchanged rows are kept: re-adding them would collide with their pending delete
+        kept = [link for link in self.domain_links if link.domain in domains]
+        added = sorted(domains - {link.domain for link in kept})
+        self.domain_links = kept + [GamePassionDomain(domain=domain) for domain in added]
+        return passion_domains
+    
+    def __repr__(self):
+        return f"<Game(id={self.id}, name='{self.name}', category='{self.category}')>"
+
+class GamePassionDomain(Base):
+    __tablename__ = "game_passion_domains"
+    __table_args__ = (
+        Index("ix_game_passion_domains_domain_game", "domain", "game_id"),
+    )
+    
+    game_id = Column(Integer, ForeignKey("games.id", ondelete="CASCADE"), primary_key=True)
+    domain = Column(String, primary_key=True)
+    
     def __repr__(self):
-        return f"<Game(id={self.id}, name='{self.name}', category='{self.category}')>" 
\ No newline at end of file
+        return f"<GamePassionDomain(game_id={self.game_id}, domain='{self.domain}')>" 
\ No newline at end of file
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float, Index, text
 from sqlalchemy.sql import func
 from app.core.database import Base
 from datetime import datetime
 
 class PassionDomain(Base):
     __tablename__ = "passion_domains"
+    __table_args__ = (
+        Index(
+            "ix_passion_domains_child_active", "child_id", "domain",
+            postgresql_where=text("is_active = true"), sqlite_where=text("is_active = 1")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     child_id = Column(Integer, nullable=False)
@@ -46,6 +52,9 @@ class PassionDomain(Base):
 
 class PassionInsight(Base):
     __tablename__ = "passion_insights"
+    __table_args__ = (
+        Index("ix_passion_insights_child_created", "child_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     child_id = Column(Integer, nullable=False)
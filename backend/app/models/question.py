@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -37,6 +37,9 @@ class Question(Base):
 
 class QuestionResponse(Base):
     __tablename__ = "question_responses"
+    __table_args__ = (
+        Index("ix_question_responses_child_created", "child_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -62,6 +65,9 @@ class QuestionResponse(Base):
 
 class TalentAssessment(Base):
     __tablename__ = "talent_assessments"
+    __table_args__ = (
+        Index("ix_talent_assessments_child_date", "child_id", "assessment_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.sql import func
+from app.core.database import Base
+from datetime import datetime
+
+class ChildRecommendations(Base):
+    __tablename__ = "child_recommendations"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    child_id = Column(Integer, unique=True, index=True, nullable=False)
+    
+    # Ranked games, best first
+    game_ids = Column(JSON, nullable=False)  # [12, 3, 7, ...]
+    scores = Column(JSON, nullable=False)  # Ranking score per game id, same order
+    
+    # Inputs the ranking was computed against
+    catalog_version = Column(String, nullable=False)
+    child_age = Column(Integer, nullable=True)
+    
+    # Timestamps
+    computed_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ChildRecommendations(child_id={self.child_id}, games={len(self.game_ids or [])})>"
\ No newline at end of file
@@ -1,11 +1,24 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Float, Index
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from app.core.database import Base
 from datetime import datetime
 
+# Deferred group of the telemetry blobs, loaded with undefer_group(TELEMETRY) or
+# by naming the columns in load_only(); list and analytics queries skip them
+TELEMETRY = "telemetry"
+
 class GameSession(Base):
     __tablename__ = "game_sessions"
+    __table_args__ = (
+        Index("ix_game_sessions_child_created", "child_id", "created_at"),
+        Index("ix_game_sessions_child_status_game", "child_id", "status", "game_id"),
+    )
     
+    # On PostgreSQL the table is partitioned by month (migration 0002) and the
+    # constraints differ from what is declared here: the primary key is
+    # (id, created_at) and session_id is only unique together with created_at
+    # (game_sessions_session_id_key); session ids are random uuid4 values.
     id = Column(Integer, primary_key=True, index=True)
     child_id = Column(Integer, nullable=False)
     game_id = Column(Integer, nullable=False)
@@ -25,22 +38,22 @@ class GameSession(Base):
     completion_percentage = Column(Float, default=0.0)
     
     # Behavioral data
-    interactions = Column(JSON, nullable=True)  # Detailed interaction data
-    responses = Column(JSON, nullable=True)  # Game responses and choices
-    emotional_reactions = Column(JSON, nullable=True)  # Detected emotions
-    attention_metrics = Column(JSON, nullable=True)  # Focus and attention data
+    interactions = deferred(Column(JSON, nullable=True), group=TELEMETRY)  # Detailed interaction data
+    responses = deferred(Column(JSON, nullable=True), group=TELEMETRY)  # Game responses and choices
+    emotional_reactions = deferred(Column(JSON, nullable=True), group=TELEMETRY)  # Detected emotions
+    attention_metrics = deferred(Column(JSON, nullable=True), group=TELEMETRY)  # Focus and attention data
     
     # Performance metrics
     score = Column(Float, nullable=True)
     accuracy = Column(Float, nullable=True)
-    speed_metrics = Column(JSON, nullable=True)  # Response times, etc.
+    speed_metrics = deferred(Column(JSON, nullable=True), group=TELEMETRY)  # Response times, etc.
     
     # Technical data
-    device_info = Column(JSON, nullable=True)  # Browser, OS, screen size
-    network_conditions = Column(JSON, nullable=True)  # Connection quality
+    device_info = deferred(Column(JSON, nullable=True), group=TELEMETRY)  # Browser, OS, screen size
+    network_conditions = deferred(Column(JSON, nullable=True), group=TELEMETRY)  # Connection quality
     
     # Error tracking
-    errors_encountered = Column(JSON, nullable=True)
+    errors_encountered = deferred(Column(JSON, nullable=True), group=TELEMETRY)
     technical_issues = Column(Text, nullable=True)
     
     # Timestamps
@@ -48,4 +61,7 @@ class GameSession(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     def __repr__(self):
-        return f"<GameSession(id={self.id}, child_id={self.child_id}, game_id={self.game_id}, status='{self.status}')>" 
\ No newline at end of file
+        return f"<GameSession(id={self.id}, child_id={self.child_id}, game_id={self.game_id}, status='{self.status}')>"
+
+# Attribute names of the whole row; refresh() skips the deferred telemetry otherwise
+FULL_ROW = [column.key for column in GameSession.__table__.columns]
\ No newline at end of file
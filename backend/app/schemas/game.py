@@ -73,7 +73,8 @@ class GameSessionUpdate(BaseModel):
     errors_encountered: Optional[List[str]] = None
     technical_issues: Optional[str] = None
 
-class GameSessionInDB(BaseModel):
+class GameSessionSummary(BaseModel):
+    """Session without the telemetry blobs, as listed"""
     id: int
     child_id: int
     game_id: int
@@ -85,16 +86,8 @@ class GameSessionInDB(BaseModel):
     duration_seconds: Optional[float] = None
     status: str
     completion_percentage: float
-    interactions: Optional[Dict[str, Any]] = None
-    responses: Optional[Dict[str, Any]] = None
-    emotional_reactions: Optional[Dict[str, Any]] = None
-    attention_metrics: Optional[Dict[str, Any]] = None
     score: Optional[float] = None
     accuracy: Optional[float] = None
-    speed_metrics: Optional[Dict[str, Any]] = None
-    device_info: Optional[Dict[str, Any]] = None
-    network_conditions: Optional[Dict[str, Any]] = None
-    errors_encountered: Optional[List[str]] = None
     technical_issues: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -102,5 +95,15 @@ class GameSessionInDB(BaseModel):
     class Config:
         from_attributes = True
 
+class GameSessionInDB(GameSessionSummary):
+    interactions: Optional[Dict[str, Any]] = None
+    responses: Optional[Dict[str, Any]] = None
+    emotional_reactions: Optional[Dict[str, Any]] = None
+    attention_metrics: Optional[Dict[str, Any]] = None
+    speed_metrics: Optional[Dict[str, Any]] = None
+    device_info: Optional[Dict[str, Any]] = None
+    network_conditions: Optional[Dict[str, Any]] = None
+    errors_encountered: Optional[List[str]] = None
+
 class GameSession(GameSessionInDB):
     pass 
\ No newline at end of file
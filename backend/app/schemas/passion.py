@@ -99,4 +99,16 @@ class PassionRecommendation(BaseModel):
     difficulty_level: str
     estimated_duration: int
     description: str
-    why_recommended: str 
\ No newline at end of file
+    why_recommended: str 
+
+class DomainPercentile(BaseModel):
+    domain: str
+    score: float
+    percentile: Optional[float] = None  # None until the age cohort has any scores
+    cohort_size: int
+
+class CohortComparison(BaseModel):
+    child_id: int
+    age: int
+    source: str  # passion or talent
+    domains: List[DomainPercentile]
\ No newline at end of file
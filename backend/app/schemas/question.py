@@ -83,6 +83,18 @@ class TalentAssessment(TalentAssessmentBase):
     class Config:
         from_attributes = True
 
+class AnalysisJob(BaseModel):
+    """Status of a background talent analysis"""
+    job_id: str
+    child_id: int
+    status: str  # queued, running, completed, failed
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    coalesced_requests: int = 0
+    result: Optional[TalentAssessment] = None
+    error: Optional[str] = None
+
 class QuestionSet(BaseModel):
     """A set of questions for a specific assessment"""
     id: int
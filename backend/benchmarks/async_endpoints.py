@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Benchmark sync vs async endpoint throughput at increasing concurrency
+Serves the same dashboard-style queries (child, its sessions, its active
+passion domains) from a sync def route on get_db, which runs in Starlette's
+threadpool, and from an async def route on get_async_db. Clients hammer each
+route at several concurrency levels and the throughput and latency
+percentiles are compared. On PostgreSQL --db-latency-ms adds a pg_sleep to
+every request to mimic a remote database round trip.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "async_endpoints.json"
+
+def dashboard_statements(child_id: int, db_latency_ms: float, dialect: str) -> list:
+    """The queries both routes run, mirroring the analytics dashboard"""
+    from sqlalchemy import select, text
+    from app.models.child import Child
+    from app.models.session import GameSession
+    from app.models.passion import PassionDomain
+    
+    statements = [
+        select(Child.id, Child.first_name, Child.age).where(Child.id == child_id),
+        select(GameSession.game_id, GameSession.status, GameSession.duration_seconds, GameSession.score).where(GameSession.child_id == child_id),
+        select(PassionDomain.domain, PassionDomain.confidence_score).where(PassionDomain.child_id == child_id, PassionDomain.is_active == True)
+    ]
+    if db_latency_ms and dialect == "postgresql":
+        statements.append(text("SELECT pg_sleep(:seconds)").bindparams(seconds=db_latency_ms / 1000))
+    return statements
+
+def summarize(child_rows: list, session_rows: list, domain_rows: list) -> dict:
+    """Small response computed from the query results"""
+    completed = [row for row in session_rows if row.status == "completed"]
+    return {
+        "child_id": child_rows[0].id if child_rows else None,
+        "total_sessions": len(session_rows),
+        "completed_sessions": len(completed),
+        "total_play_time_minutes": round(sum(row.duration_seconds or 0 for row in completed) / 60, 2),
+        "top_domains": sorted(((row.domain, row.confidence_score) for row in domain_rows), key=lambda item: -item[1])[:3]
+    }
+
+def create_app(db_latency_ms: float):
+    """FastAPI app exposing the sync and async variants of the same route"""
+    from fastapi import FastAPI, Depends
+    from sqlalchemy.orm import Session
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from app.core.database import engine, get_db, get_async_db
+    
+    app = FastAPI()
+    dialect = engine.dialect.name
+    
+    @app.get("/sync/dashboard/{child_id}")
+    def sync_dashboard(child_id: int, db: Session = Depends(get_db)):
+        results = [db.execute(statement).all() for statement in dashboard_statements(child_id, db_latency_ms, dialect)]
+        return summarize(*results[:3])
+    
+    @app.get("/async/dashboard/{child_id}")
+    async def async_dashboard(child_id: int, db: AsyncSession = Depends(get_async_db)):
+        results = [(await db.execute(statement)).all() for statement in dashboard_statements(child_id, db_latency_ms, dialect)]
+        return summarize(*results[:3])
+    
+    return app
+
+def serve(port: int, db_latency_ms: float) -> None:
+    """Run the benchmark app (server subprocess mode)"""
+    import uvicorn
+    uvicorn.run(create_app(db_latency_ms), host="127.0.0.1", port=port, log_level="warning")
+
+def child_ids(limit: int) -> list:
+    """Children to spread the requests over"""
+    from app.core.database import SessionLocal
+    from app.models.child import Child
+    
+    db = SessionLocal()
+    try:
+        return [child_id for (child_id,) in db.query(Child.id).order_by(Child.id).limit(limit).all()]
+    finally:
+        db.close()
+
+async def drive(base_url: str, route: str, ids: list, concurrency: int, seconds: float, timeout: float) -> dict:
+    """Keep concurrency requests in flight against one route for a fixed time"""
+    latencies = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        deadline = time.perf_counter() + seconds
+        
+        async def worker(seed: int):
+            nonlocal errors
+            rng = random.Random(seed)
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(f"/{route}/dashboard/{rng.choice(ids)}")
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append(time.perf_counter() - start)
+                errors += not ok
+        
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    
+    values = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+        "p99_ms": float(np.percentile(values, 99))
+    }
+
+def wait_healthy(process: subprocess.Popen, base_url: str, ids: list) -> None:
+    """Wait until the server answers both routes"""
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            if all(httpx.get(f"{base_url}/{route}/dashboard/{ids[0]}", timeout=5).status_code == 200 for route in ("sync", "async")):
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("Server did not become ready within 60s")
+
+def main():
+    """Compare sync and async route throughput and write the results"""
+    parser = argparse.ArgumentParser(description="Sync vs async endpoint benchmark")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200], help="In-flight requests per level")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Duration of each (route, level) run")
+    parser.add_argument("--children", type=int, default=500, help="Distinct children requested")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="Extra database wait per request (PostgreSQL only)")
+    parser.add_argument("--port", type=int, default=8790, help="Port of the benchmark server")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Request timeout in seconds")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.serve:
+        serve(args.port, args.db_latency_ms)
+        return
+    
+    ids = child_ids(args.children)
+    if not ids:
+        print("❌ No children in the database; run generate_data.py first")
+        sys.exit(1)
+    
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", "--port", str(args.port), "--db-latency-ms", str(args.db_latency_ms)],
+        cwd=backend_dir, env=dict(os.environ)
+    )
+    try:
+        wait_healthy(server, base_url, ids)
+        print(f"Benchmarking sync vs async routes over {len(ids)} children...")
+        print(f"{'route':<6} {'conc':>5} {'reqs':>7} {'err':>5} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        results = {}
+        for concurrency in args.concurrency:
+            for route in ("sync", "async"):
+                result = asyncio.run(drive(base_url, route, ids, concurrency, args.seconds, args.timeout))
+                results[f"{route}[c={concurrency}]"] = result
+                print(f"{route:<6} {concurrency:>5} {result['requests']:>7} {result['errors']:>5} {result['rps']:>9.1f} {result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} {result['p99_ms']:>9.1f}")
+            ratio = results[f"async[c={concurrency}]"]["rps"] / max(results[f"sync[c={concurrency}]"]["rps"], 1e-9)
+            print(f"       async/sync throughput at c={concurrency}: x{ratio:.2f}")
+        
+        from app.core.database import engine
+        document = {
+            "meta": {
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "database": engine.dialect.name,
+                "db_latency_ms": args.db_latency_ms,
+                "seconds": args.seconds,
+                "python": platform.python_version(),
+                "machine": platform.platform()
+            },
+            "results": results
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(document, indent=2))
+        print(f"📁 Results written to {args.output}")
+    
+    except Exception as e:
+        print(f"❌ Error running benchmark: {e}")
+        sys.exit(1)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Parity check and benchmark for the compiled category-to-domain matcher
+Compares DomainMatcher against the per-call any(keyword in text) scans it replaced.
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.ml.domain_matcher import DomainMatcher
+from app.ml.passion_detector import PassionDetector, TALENT_DOMAINS
+
+def make_texts(rng: random.Random, vocabulary: list, n_texts: int, n_distinct: int) -> list:
+    """Category or interest strings drawn from a pool of distinct values"""
+    filler = ["fun", "kids", "Advanced", "junior", "quest", "lab", "club", "world", "time"]
+    pool = []
+    for _ in range(n_distinct):
+        words = rng.sample(filler, 2) + [rng.choice(vocabulary).title() if rng.random() < 0.7 else rng.choice(filler)]
+        rng.shuffle(words)
+        pool.append(" ".join(words))
+    return [rng.choice(pool) for _ in range(n_texts)]
+
+def scan_counts(keyword_map: dict, counts: dict) -> dict:
+    """Reference path: any(keyword in text.lower()) for every domain and text"""
+    totals = {}
+    for domain, keywords in keyword_map.items():
+        total = 0
+        for text, count in counts.items():
+            if any(keyword.lower() in text.lower() for keyword in keywords):
+                total += count
+        totals[domain] = total
+    return totals
+
+def scan_interests(keyword_map: dict, texts: list) -> dict:
+    """Reference path for interest lists"""
+    return {
+        domain: sum(1 for text in texts if any(keyword.lower() in text.lower() for keyword in keywords))
+        for domain, keywords in keyword_map.items()
+    }
+
+def best_of(func, repeats: int) -> float:
+    """Best wall-clock time over a few repeats"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    """Run parity checks and timings"""
+    parser = argparse.ArgumentParser(description="Domain matcher parity check and benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000], help="List sizes to time")
+    parser.add_argument("--distinct", type=int, default=200, help="Distinct strings in each list")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing repeats per measurement")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    catalogs = {
+        "domain_keywords": PassionDetector().domain_keywords,
+        "talent_domains": {
+            domain: info["activities"] + info["indicators"]
+            for domain, info in TALENT_DOMAINS.items()
+        }
+    }
+    failed = False
+    
+    for name, keyword_map in catalogs.items():
+        vocabulary = sorted({keyword for keywords in keyword_map.values() for keyword in keywords})
+        
+        for size in args.sizes:
+            texts = make_texts(rng, vocabulary, size, args.distinct)
+            counts = {}
+            for text in texts:
+                counts[text] = counts.get(text, 0) + 1
+            
+            # A fresh matcher per size so the timings include cache warm-up
+            matcher = DomainMatcher(keyword_map)
+            ok = matcher.domain_counts(counts) == scan_counts(keyword_map, counts)
+            ok = ok and matcher.count_matches(texts) == scan_interests(keyword_map, texts)
+            failed = failed or not ok
+            
+            scan_time = best_of(lambda: scan_interests(keyword_map, texts), args.repeats)
+            cold_time = best_of(lambda: DomainMatcher(keyword_map).count_matches(texts), args.repeats)
+            warm_time = best_of(lambda: matcher.count_matches(texts), args.repeats)
+            print(
+                f"{'✅' if ok else '❌'} {name:<16} texts={size:<7} scan {scan_time * 1000:10.3f} ms  "
+                f"compiled {cold_time * 1000:9.3f} ms  warm {warm_time * 1000:9.3f} ms  "
+                f"speedup x{scan_time / warm_time:6.1f}"
+            )
+    
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Parity check and benchmark for fused multi-domain inference
+Compares FusedDomainModel against one predict_proba call per domain model.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.ensemble import RandomForestClassifier, ExtraTreesClassifier, GradientBoostingClassifier
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.ml.fused_models import FusedDomainModel
+
+DOMAINS = [
+    "art_creativity",
+    "music_rhythm",
+    "science_discovery",
+    "sports_movement",
+    "leadership_social",
+    "language_communication",
+    "logic_mathematics"
+]
+
+N_FEATURES = 17  # Length of PassionDetector._create_feature_vector
+
+def synthetic_features(rng: np.random.Generator, n_rows: int) -> np.ndarray:
+    """Feature rows shaped like _create_feature_vector output"""
+    X = np.empty((n_rows, N_FEATURES))
+    X[:, 0] = rng.integers(1, 200, n_rows)  # total_sessions
+    X[:, 1] = X[:, 0]  # completed_sessions
+    X[:, 2] = 1.0  # completion_rate
+    X[:, 3] = rng.gamma(2.0, 60.0, n_rows)  # total_play_time
+    X[:, 4] = rng.gamma(2.0, 150.0, n_rows)  # avg_session_duration
+    X[:, 5:7] = rng.random((n_rows, 2))  # avg_score, max_score
+    X[:, 7] = rng.gamma(2.0, 1.5, n_rows)  # avg_response_time
+    X[:, 8:10] = rng.random((n_rows, 2))  # avg_accuracy, emotional_engagement
+    X[:, 10:] = rng.integers(0, 30, (n_rows, len(DOMAINS)))  # category counts per domain
+    return X
+
+def train_models(rng: np.random.Generator, model_kind: str) -> dict:
+    """Train one binary classifier per domain"""
+    X = synthetic_features(rng, 2000)
+    models = {}
+    for i, domain in enumerate(DOMAINS):
+        y = (X[:, 10 + i] + rng.normal(0, 5, len(X)) > 15).astype(int)
+        kind = model_kind if model_kind != "mixed" else ["linear", "forest", "tree", "extra", "boosting"][i % 5]
+        if kind == "linear":
+            model = LogisticRegression(max_iter=5000)
+        elif kind == "forest":
+            model = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=i)
+        elif kind == "tree":
+            model = DecisionTreeClassifier(max_depth=12, random_state=i)
+        elif kind == "extra":
+            model = ExtraTreesClassifier(n_estimators=50, max_depth=10, random_state=i)
+        else:
+            model = GradientBoostingClassifier(n_estimators=50, random_state=i)
+        models[domain] = model.fit(X, y)
+    return models
+
+def per_domain_scores(models: dict, X: np.ndarray) -> np.ndarray:
+    """Reference path: one predict_proba call per domain"""
+    scores = np.zeros((X.shape[0], len(DOMAINS)))
+    for column, domain in enumerate(DOMAINS):
+        probs = models[domain].predict_proba(X)
+        scores[:, column] = probs[:, 1] if probs.shape[1] > 1 else probs[:, 0]
+    return scores
+
+def per_row_scores(models: dict, X: np.ndarray) -> np.ndarray:
+    """Current ml_based_detection path: one single-row predict_proba call per domain per child"""
+    scores = np.zeros((X.shape[0], len(DOMAINS)))
+    for row in range(X.shape[0]):
+        vector = list(X[row])
+        for column, domain in enumerate(DOMAINS):
+            prob = models[domain].predict_proba([vector])[0]
+            scores[row, column] = prob[1] if len(prob) > 1 else prob[0]
+    return scores
+
+def best_of(func, repeats: int) -> float:
+    """Best wall-clock time over a few repeats"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    """Run parity checks and timings"""
+    parser = argparse.ArgumentParser(description="Fused inference parity check and benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 100, 1000, 10000], help="Batch sizes to time")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing repeats per measurement")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    failed = False
+    
+    for kind in ["linear", "forest", "tree", "extra", "mixed"]:
+        models = train_models(rng, kind)
+        fused = FusedDomainModel(DOMAINS, models)
+        
+        # Parity on random rows plus rows sitting exactly on split thresholds
+        X = synthetic_features(rng, 5000)
+        X[:500, 10:] = np.round(X[:500, 10:])
+        expected = per_domain_scores(models, X)
+        actual = fused.predict(X)
+        max_diff = float(np.max(np.abs(expected - actual)))
+        single_diff = float(np.max(np.abs(per_row_scores(models, X[:50]) - fused.predict(X[:50]))))
+        ok = max_diff < 1e-9 and single_diff < 1e-9
+        failed = failed or not ok
+        print(f"{'✅' if ok else '❌'} {kind:<8} parity max |diff| = {max(max_diff, single_diff):.2e}")
+        
+        for n_rows in args.rows:
+            X = synthetic_features(rng, n_rows)
+            per_row = best_of(lambda: per_row_scores(models, X), 1) if n_rows <= 1000 else None
+            per_domain = best_of(lambda: per_domain_scores(models, X), args.repeats)
+            fused_time = best_of(lambda: fused.predict(X), args.repeats)
+            per_row_text = f"per-row {per_row * 1000:9.3f} ms  " if per_row is not None else " " * 24
+            print(
+                f"   rows={n_rows:<6} {per_row_text}per-domain {per_domain * 1000:9.3f} ms  "
+                f"fused {fused_time * 1000:9.3f} ms  speedup x{per_domain / fused_time:6.1f}"
+            )
+    
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
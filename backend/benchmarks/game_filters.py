@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Exactness check and benchmark for the game catalog filters
+Fills a scratch database with a synthetic catalog, runs get_games for a grid
+of domain and age filters and checks every result against the same filters
+applied in Python to the age_range / passion_domains JSON. Each filter is
+timed against a scan with JSON predicates (json_extract / json_each on
+SQLite, ->> / @> on PostgreSQL), both as an id-only query, which isolates the
+filter, and as the full endpoint returning Game rows. The JSON predicates the
+endpoint used before are only checked for correctness.
+"""
+
+import sys
+import json
+import time
+import random
+import tempfile
+import argparse
+import platform
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import Integer, cast, create_engine, exists, func, literal_column, select
+from sqlalchemy.dialects.postgresql import JSONB
+from fastapi import Response
+from sqlalchemy.orm import sessionmaker
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import settings
+from app.core.database import Base
+from app.core.pagination import NEXT_CURSOR_HEADER, PageParams
+from app.models.game import Game, GamePassionDomain
+from app.api.v1.endpoints.games import get_games
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "game_filters.json"
+
+DOMAINS = [
+    "art_creativity",
+    "music_rhythm",
+    "science_discovery",
+    "sports_movement",
+    "leadership_social",
+    "language_communication",
+    "logic_mathematics"
+]
+
+CATEGORIES = ["art", "music", "science", "sports", "leadership", "language", "logic", "puzzle"]
+
+# (passion_domain, age_min, age_max) combinations checked and timed
+FILTERS = [
+    (None, None, None),
+    ("science_discovery", None, None),
+    (None, 7, None),
+    (None, None, 8),
+    (None, 5, 9),
+    ("music_rhythm", 4, 10),
+    ("logic_mathematics", 9, None)
+]
+
+def fill_catalog(session_factory, rng: random.Random, n_games: int) -> None:
+    """Synthetic active and inactive games, written through the model (which fills the filter columns)"""
+    db = session_factory()
+    try:
+        for game_id in range(1, n_games + 1):
+            age_min = rng.randint(3, 9)
+            db.add(Game(
+                id=game_id,
+                name=f"Game {game_id}",
+                category=rng.choice(CATEGORIES),
+                config={},
+                age_range={"min": age_min, "max": age_min + rng.randint(2, 6)},
+                passion_domains=rng.sample(DOMAINS, rng.randint(1, 3)),
+                is_active=rng.random() < 0.9
+            ))
+            if game_id % 2000 == 0:
+                db.flush()
+        db.commit()
+    finally:
+        db.close()
+
+def reference_ids(games: list, passion_domain, age_min, age_max) -> list:
+    """The filters applied in Python to the JSON columns"""
+    return [
+        game.id for game in games
+        if game.is_active
+        and (passion_domain is None or passion_domain in (game.passion_domains or []))
+        and (age_min is None or (game.age_range.get("min") is not None and game.age_range["min"] >= age_min))
+        and (age_max is None or (game.age_range.get("max") is not None and game.age_range["max"] <= age_max))
+    ]
+
+def legacy_query(db, passion_domain, age_min, age_max):
+    """The JSON predicates get_games used before the indexed columns"""
+    query = db.query(Game).filter(Game.is_active == True)
+    if passion_domain:
+        query = query.filter(Game.passion_domains.contains([passion_domain]))
+    if age_min is not None:
+        query = query.filter(Game.age_range['min'] >= age_min)
+    if age_max is not None:
+        query = query.filter(Game.age_range['max'] <= age_max)
+    return query
+
+def json_bound(dialect: str, key: str):
+    """Integer age bound read from the age_range JSON"""
+    if dialect == "postgresql":
+        return cast(Game.age_range.op("->>")(key), Integer)
+    return func.json_extract(Game.age_range, f"$.{key}")
+
+def json_scan_query(db, passion_domain, age_min, age_max):
+    """The same filters as correct JSON predicates, which no index serves"""
+    dialect = db.get_bind().dialect.name
+    query = db.query(Game).filter(Game.is_active == True)
+    if passion_domain:
+        if dialect == "postgresql":
+            query = query.filter(cast(Game.passion_domains, JSONB).contains([passion_domain]))
+        else:
+            domains = func.json_each(Game.passion_domains).table_valued("value")
+            query = query.filter(exists(select(literal_column("1")).select_from(domains).where(domains.c.value == passion_domain)))
+    if age_min is not None:
+        query = query.filter(json_bound(dialect, "min") >= age_min)
+    if age_max is not None:
+        query = query.filter(json_bound(dialect, "max") <= age_max)
+    return query.order_by(Game.id)
+
+def indexed_ids_query(db, passion_domain, age_min, age_max):
+    """The endpoint's filters on the indexed columns, selecting ids only"""
+    query = db.query(Game.id).filter(Game.is_active == True)
+    if passion_domain:
+        query = query.join(GamePassionDomain).filter(GamePassionDomain.domain == passion_domain)
+    if age_min is not None:
+        query = query.filter(Game.age_min >= age_min)
+    if age_max is not None:
+        query = query.filter(Game.age_max <= age_max)
+    return query.order_by(Game.id)
+
+def endpoint(db, passion_domain, age_min, age_max) -> list:
+    """Every page of get_games as served by the API, at the largest page size"""
+    games, cursor = [], None
+    while True:
+        response = Response()
+        page = PageParams(cursor=cursor, limit=settings.PAGE_SIZE_MAX)
+        games.extend(get_games(response=response, category=None, age_min=age_min, age_max=age_max, difficulty=None, passion_domain=passion_domain, page=page, current_user=None, db=db))
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return games
+
+def time_query(func, repeats: int) -> float:
+    """Median seconds per call"""
+    func()  # Warm-up
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples))
+
+def run_size(database_url: str, n_games: int, seed: int, repeats: int) -> dict:
+    """Check and time every filter over one catalog size"""
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(bind=engine, tables=[GamePassionDomain.__table__, Game.__table__])
+    Base.metadata.create_all(bind=engine, tables=[Game.__table__, GamePassionDomain.__table__])
+    session_factory = sessionmaker(bind=engine)
+    fill_catalog(session_factory, random.Random(seed), n_games)
+    
+    db = session_factory()
+    try:
+        games = db.query(Game).order_by(Game.id).all()
+        results = {}
+        mismatches = 0
+        for passion_domain, age_min, age_max in FILTERS:
+            name = f"domain={passion_domain or '*'} age_min={age_min if age_min is not None else '*'} age_max={age_max if age_max is not None else '*'}"
+            expected = reference_ids(games, passion_domain, age_min, age_max)
+            served = [game.id for game in endpoint(db, passion_domain, age_min, age_max)]
+            exact = served == expected and [row.id for row in indexed_ids_query(db, passion_domain, age_min, age_max)] == expected
+            exact = exact and [game.id for game in json_scan_query(db, passion_domain, age_min, age_max)] == expected
+            mismatches += not exact
+            
+            try:
+                legacy_exact = sorted(game.id for game in legacy_query(db, passion_domain, age_min, age_max)) == expected
+            except Exception:
+                # Comparing json values with integers fails outright on PostgreSQL
+                db.rollback()
+                legacy_exact = False
+            
+            timings = {
+                "indexed_ids_ms": time_query(lambda: indexed_ids_query(db, passion_domain, age_min, age_max).all(), repeats) * 1000,
+                "json_scan_ids_ms": time_query(lambda: json_scan_query(db, passion_domain, age_min, age_max).with_entities(Game.id).all(), repeats) * 1000,
+                "endpoint_ms": time_query(lambda: endpoint(db, passion_domain, age_min, age_max), repeats) * 1000,
+                "json_scan_rows_ms": time_query(lambda: json_scan_query(db, passion_domain, age_min, age_max).all(), repeats) * 1000
+            }
+            results[name] = {"matches": len(expected), "exact": exact, "previous_query_exact": legacy_exact, **timings}
+            print(
+                f"   {'✅' if exact else '❌'} {name:<56} {len(expected):>6}"
+                f" {timings['indexed_ids_ms']:8.2f} {timings['json_scan_ids_ms']:8.2f} x{timings['json_scan_ids_ms'] / timings['indexed_ids_ms']:5.1f}"
+                f" {timings['endpoint_ms']:8.2f} {timings['json_scan_rows_ms']:8.2f} x{timings['json_scan_rows_ms'] / timings['endpoint_ms']:5.1f}"
+                f"  {'' if legacy_exact else 'previous query wrong'}"
+            )
+        return {"games": n_games, "mismatches": mismatches, "filters": results}
+    finally:
+        db.close()
+        engine.dispose()
+
+def main():
+    """Verify the catalog filters and compare them with the JSON predicates"""
+    parser = argparse.ArgumentParser(description="Game catalog filter benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000], help="Catalog sizes")
+    parser.add_argument("--repeats", type=int, default=7, help="Timing repeats per query")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--database-url", default=None, help="Scratch database (tables games and game_passion_domains are dropped!); default: a temporary SQLite file")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as scratch:
+        database_url = args.database_url or f"sqlite:///{scratch}/game_filters.db"
+        runs = []
+        for n_games in args.sizes:
+            print(f"Catalog of {n_games} games ({database_url.split(':')[0]}):")
+            print(f"      {'filter':<56} {'rows':>6} {'idx ids':>8} {'json ids':>8} {'':>6} {'endpoint':>8} {'json rows':>8} {'':>6}  (ms)")
+            runs.append(run_size(database_url, n_games, args.seed, args.repeats))
+    
+    document = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "repeats": args.repeats,
+            "python": platform.python_version(),
+            "machine": platform.platform()
+        },
+        "runs": runs
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(document, indent=2))
+    print(f"📁 Results written to {args.output}")
+    
+    mismatches = sum(run["mismatches"] for run in runs)
+    if mismatches:
+        print(f"❌ {mismatches} filter(s) returned different games than the JSON reference")
+        sys.exit(1)
+    print("✅ All filters match the JSON reference")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
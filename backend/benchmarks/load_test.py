@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Concurrent end-to-end load test replaying the parent and child user flows
+Boots the API with uvicorn against a local SQLite or PostgreSQL database (or
+targets a running server with --base-url) and drives the flows from the
+test_*.py scripts: register, login, create child, consent, recommended games,
+play sessions, answer questions, analyze and dashboard. Async virtual users
+follow a ramp profile; latency percentiles and throughput are reported per
+endpoint and written as JSON.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import argparse
+import platform
+import subprocess
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+BENCHMARK_DIR = Path(__file__).parent
+BACKEND_DIR = BENCHMARK_DIR.parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "load_test.json"
+
+# Ramp profiles as (target virtual users as a fraction of --users, seconds to reach it)
+PROFILES = {
+    "smoke": [(0.1, 1), (0.1, 10)],
+    "ramp": [(1.0, 30), (1.0, 60), (0.0, 10)],
+    "step": [(0.25, 1), (0.25, 20), (0.5, 1), (0.5, 20), (0.75, 1), (0.75, 20), (1.0, 1), (1.0, 20)],
+    "spike": [(0.1, 10), (1.0, 2), (1.0, 20), (0.1, 2), (0.1, 20)],
+    "soak": [(1.0, 60), (1.0, 600), (0.0, 30)]
+}
+
+def parse_stages(text: str) -> list:
+    """Stages from "users:seconds,users:seconds" (absolute virtual user counts)"""
+    stages = []
+    for stage in text.split(","):
+        users, seconds = stage.split(":")
+        stages.append((int(users), float(seconds)))
+    return stages
+
+def profile_stages(profile: str, users: int) -> list:
+    """Absolute stages of a named profile scaled to the peak user count"""
+    return [(max(int(round(fraction * users)), 0 if fraction == 0 else 1), seconds) for fraction, seconds in PROFILES[profile]]
+
+def target_users(stages: list, elapsed: float) -> int:
+    """Virtual users wanted at a point in the run, ramping linearly within each stage"""
+    previous = 0
+    for users, seconds in stages:
+        if elapsed < seconds:
+            return int(round(previous + (users - previous) * elapsed / seconds))
+        elapsed -= seconds
+        previous = users
+    return previous
+
+class Stats:
+    """Latencies and failures per endpoint"""
+    
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.flows_completed = 0
+    
+    def record(self, name: str, seconds: float, status_code: int, ok: bool) -> None:
+        self.latencies[name].append(seconds)
+        self.statuses[name][status_code] += 1
+        if not ok:
+            self.errors[name] += 1
+    
+    def report(self, duration: float) -> dict:
+        """Per-endpoint percentiles (ms) and throughput (requests/s)"""
+        endpoints = {}
+        for name, samples in sorted(self.latencies.items()):
+            values = np.array(samples) * 1000
+            endpoints[name] = {
+                "requests": len(values),
+                "errors": self.errors[name],
+                "rps": len(values) / duration if duration else 0.0,
+                "mean_ms": float(values.mean()),
+                "p50_ms": float(np.percentile(values, 50)),
+                "p95_ms": float(np.percentile(values, 95)),
+                "p99_ms": float(np.percentile(values, 99)),
+                "max_ms": float(values.max()),
+                "statuses": {str(code): count for code, count in sorted(self.statuses[name].items())}
+            }
+        
+        total = sum(len(samples) for samples in self.latencies.values())
+        all_values = np.concatenate([np.array(samples) for samples in self.latencies.values()]) * 1000 if total else np.zeros(1)
+        return {
+            "endpoints": endpoints,
+            "total": {
+                "requests": total,
+                "errors": sum(self.errors.values()),
+                "rps": total / duration if duration else 0.0,
+                "flows_completed": self.flows_completed,
+                "p50_ms": float(np.percentile(all_values, 50)),
+                "p95_ms": float(np.percentile(all_values, 95)),
+                "p99_ms": float(np.percentile(all_values, 99))
+            }
+        }
+
+class FlowError(Exception):
+    """A step failed, so the rest of the flow cannot continue"""
+
+class VirtualUser:
+    """One simulated parent looping through the full user flow"""
+    
+    def __init__(self, client: httpx.AsyncClient, stats: Stats, args, run_id: str, index: int):
+        self.client = client
+        self.stats = stats
+        self.args = args
+        self.run_id = run_id
+        self.index = index
+        self.rng = random.Random(f"{args.seed}-{index}")
+        self.stopping = False
+        self.headers = {}
+    
+    async def request(self, name: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Timed request recorded under a templated endpoint name"""
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError:
+            self.stats.record(name, time.perf_counter() - start, 0, False)
+            raise FlowError(name)
+        ok = response.status_code < 400
+        self.stats.record(name, time.perf_counter() - start, response.status_code, ok)
+        if not ok:
+            raise FlowError(name)
+        return response
+    
+    async def think(self) -> None:
+        if self.args.think_time:
+            await asyncio.sleep(self.rng.uniform(0, 2 * self.args.think_time))
+    
+    async def run(self) -> None:
+        """Repeat the flow until the ramp scheduler stops this user"""
+        iteration = 0
+        while not self.stopping:
+            try:
+                await self.flow(iteration)
+                self.stats.flows_completed += 1
+            except FlowError:
+                await asyncio.sleep(0.5)  # Back off instead of hammering a failing endpoint
+            iteration += 1
+    
+    async def flow(self, iteration: int) -> None:
+        """Register, set up a child, play, answer questions and read the results"""
+        self.headers = {}
+        email = f"load-{self.run_id}-{self.index}-{iteration}@example.com"
+        password = "LoadTest123"
+        await self.request("POST /auth/register", "POST", "/auth/register", json={
+            "email": email, "password": password, "full_name": f"Load User {self.index}", "is_parent": True
+        })
+        await self.think()
+        
+        token = (await self.request("POST /auth/login", "POST", "/auth/login", data={"username": email, "password": password})).json()["access_token"]
+        self.headers = {"Authorization": f"Bearer {token}"}
+        await self.request("GET /auth/me", "GET", "/auth/me")
+        await self.think()
+        
+        age = self.rng.randint(4, 11)
+        child = (await self.request("POST /children", "POST", "/children/", json={
+            "first_name": f"Child {self.index}",
+            "date_of_birth": f"{datetime.now().year - age}-01-01T00:00:00",
+            "initial_interests": self.rng.sample(["drawing", "music", "experiments", "football", "reading", "puzzles"], 2),
+            "learning_style": self.rng.choice(["visual", "auditory", "kinesthetic"])
+        })).json()
+        child_id = child["id"]
+        await self.request("POST /children/{id}/consent", "POST", f"/children/{child_id}/consent")
+        await self.think()
+        
+        # Play a few sessions of recommended games
+        games = (await self.request("GET /games/recommended", "GET", "/games/recommended", params={"child_id": child_id, "limit": 5})).json()
+        if not games:
+            games = (await self.request("GET /games", "GET", "/games/", params={"limit": 20})).json()
+        for _ in range(self.args.sessions_per_flow if games else 0):
+            game = self.rng.choice(games)
+            session = (await self.request("POST /sessions", "POST", "/sessions/", json={"child_id": child_id, "game_id": game["id"]})).json()
+            await self.think()
+            await self.request("PUT /sessions/{id}", "PUT", f"/sessions/{session['session_id']}", json={
+                "score": round(self.rng.random(), 3),
+                "accuracy": round(self.rng.random(), 3),
+                "completion_percentage": 100.0,
+                "emotional_reactions": {"positive": round(self.rng.random(), 3)},
+                "speed_metrics": {"response_times": [round(self.rng.uniform(0.5, 6.0), 2) for _ in range(self.rng.randint(1, 8))]},
+                "interactions": {"clicks": self.rng.randint(5, 80)}
+            })
+            await self.request("POST /sessions/{id}/complete", "POST", f"/sessions/{session['session_id']}/complete")
+            await self.think()
+        
+        # Talent questions
+        assessment = (await self.request("GET /questions/assessment/{id}", "GET", f"/questions/assessment/{child_id}")).json()
+        for question in assessment["questions"][:self.args.answers_per_flow]:
+            options = question.get("options") or ["4"]
+            await self.request("POST /questions/response", "POST", "/questions/response", json={
+                "child_id": child_id,
+                "question_id": question["id"],
+                "answer": str(self.rng.choice(options)),
+                "response_time": round(self.rng.uniform(2, 30), 1),
+                "confidence_level": float(self.rng.randint(1, 10))
+            })
+        if assessment["questions"]:
+            await self.request("POST /questions/assessment/{id}/analyze", "POST", f"/questions/assessment/{child_id}/analyze")
+        await self.think()
+        
+        # Results pages
+        await self.request("POST /passions/analyze/{id}", "POST", f"/passions/analyze/{child_id}")
+        await self.request("GET /analytics/dashboard/{id}", "GET", f"/analytics/dashboard/{child_id}")
+        await self.request("GET /passions/domains/{id}", "GET", f"/passions/domains/{child_id}")
+
+async def run_load(base_url: str, stages: list, args) -> dict:
+    """Drive virtual users along the stages and collect statistics"""
+    stats = Stats()
+    run_id = datetime.now().strftime("%Y%m%d%H%M%S")
+    duration = sum(seconds for _, seconds in stages)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        users = []
+        tasks = []
+        start = time.perf_counter()
+        last_print = 0.0
+        while True:
+            elapsed = time.perf_counter() - start
+            if elapsed >= duration:
+                break
+            
+            # Grow or shrink the active population towards the stage target
+            target = target_users(stages, elapsed)
+            active = [user for user in users if not user.stopping]
+            for index in range(len(users), len(users) + target - len(active)):
+                user = VirtualUser(client, stats, args, run_id, index)
+                users.append(user)
+                tasks.append(asyncio.create_task(user.run()))
+            for user in active[target:]:
+                user.stopping = True
+            
+            if elapsed - last_print >= args.print_interval:
+                last_print = elapsed
+                requests = sum(len(samples) for samples in stats.latencies.values())
+                print(f"   t={elapsed:6.1f}s  users {min(target, len(active)):4d}  requests {requests:7d}  errors {sum(stats.errors.values()):5d}")
+            await asyncio.sleep(0.1)
+        
+        measured = time.perf_counter() - start
+        for user in users:
+            user.stopping = True
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return stats.report(measured)
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def boot_server(database_url: str, port: int, workers: int, log_path: Path) -> subprocess.Popen:
+    """Start the API with uvicorn against the given database and wait for /health"""
+    env = dict(os.environ, DATABASE_URL=database_url)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=log_path.open("w"), stderr=subprocess.STDOUT
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}, see {log_path}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"Server did not become healthy within 60s, see {log_path}")
+
+def prepare_database(database_url: str, args) -> None:
+    """Fill the game catalog, question bank and background data with generate_data.py"""
+    subprocess.run(
+        [sys.executable, "generate_data.py", "--parents", str(args.background_parents), "--games", str(args.games), "--seed", str(args.seed)],
+        cwd=BACKEND_DIR, env=dict(os.environ, DATABASE_URL=database_url), check=True
+    )
+
+def main():
+    """Run the load test and print per-endpoint latency and throughput"""
+    parser = argparse.ArgumentParser(description="Concurrent end-to-end load test")
+    parser.add_argument("--base-url", help="Target a running API (e.g. http://localhost:8001/api/v1) instead of booting one")
+    parser.add_argument("--database-url", default="sqlite:///./load_test.db", help="Database for the booted server (SQLite or PostgreSQL URL)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes for the booted server")
+    parser.add_argument("--skip-prepare", action="store_true", help="Do not generate the catalog and background data before booting")
+    parser.add_argument("--background-parents", type=int, default=0, help="Synthetic parents generated before the run")
+    parser.add_argument("--games", type=int, default=50, help="Synthetic games generated before the run")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="ramp", help="Named ramp profile")
+    parser.add_argument("--users", type=int, default=20, help="Peak virtual users for the named profile")
+    parser.add_argument("--stages", help="Explicit stages as users:seconds,users:seconds (overrides --profile)")
+    parser.add_argument("--think-time", type=float, default=0.5, help="Mean pause between flow steps in seconds")
+    parser.add_argument("--sessions-per-flow", type=int, default=3, help="Game sessions played per flow")
+    parser.add_argument("--answers-per-flow", type=int, default=5, help="Questions answered per flow")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout in seconds")
+    parser.add_argument("--print-interval", type=float, default=5.0, help="Seconds between progress lines")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    args = parser.parse_args()
+    
+    stages = parse_stages(args.stages) if args.stages else profile_stages(args.profile, args.users)
+    server = None
+    try:
+        base_url = args.base_url
+        if base_url is None:
+            if not args.skip_prepare:
+                print(f"Preparing {args.database_url}...")
+                prepare_database(args.database_url, args)
+            port = free_port()
+            print(f"Booting API on port {port} with {args.workers} worker(s)...")
+            server = boot_server(args.database_url, port, args.workers, args.output.parent / "load_test_server.log")
+            base_url = f"http://127.0.0.1:{port}/api/v1"
+        
+        print(f"Running load test against {base_url} with stages {stages}...")
+        report = asyncio.run(run_load(base_url, stages, args))
+        
+        print(f"\n{'endpoint':<38} {'reqs':>7} {'err':>5} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for name, result in report["endpoints"].items():
+            print(f"{name:<38} {result['requests']:>7} {result['errors']:>5} {result['rps']:>8.2f} {result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} {result['p99_ms']:>9.1f}")
+        total = report["total"]
+        print(f"{'total':<38} {total['requests']:>7} {total['errors']:>5} {total['rps']:>8.2f} {total['p50_ms']:>9.1f} {total['p95_ms']:>9.1f} {total['p99_ms']:>9.1f}")
+        print(f"Completed flows: {total['flows_completed']}")
+        
+        report["meta"] = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "base_url": base_url,
+            "database": None if args.base_url else args.database_url.split("@")[-1],
+            "workers": None if args.base_url else args.workers,
+            "stages": stages,
+            "think_time": args.think_time,
+            "python": platform.python_version(),
+            "machine": platform.platform()
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"📁 Results written to {args.output}")
+        
+        if total["errors"]:
+            print(f"⚠️  {total['errors']} request(s) failed")
+    
+    except Exception as e:
+        print(f"❌ Error running load test: {e}")
+        sys.exit(1)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark keyset pagination of the session list against history length
+Fills a scratch SQLite database with children whose histories range from a
+few dozen to many thousands of sessions, then times get_sessions for the
+first page, for a page deep into the history (reached with a cursor) and the
+same deep page fetched with OFFSET, next to loading the unbounded list as the
+endpoint did before. Walking every page is checked against the full list.
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from fastapi import Response
+from sqlalchemy import String, create_engine, insert, type_coerce
+from sqlalchemy.orm import sessionmaker
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import Base
+from app.core.pagination import NEXT_CURSOR_HEADER, PageParams, encode_cursor
+from app.models.child import Child
+from app.models.session import GameSession
+from app.api.v1.endpoints.sessions import get_sessions
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "pagination.json"
+
+PARENT_ID = 1
+
+def fill_database(path: str, histories: list, seed: int) -> dict:
+    """One child per history length; returns child id -> session count"""
+    rng = np.random.default_rng(seed)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine, tables=[Child.__table__, GameSession.__table__])
+    now = datetime.now()
+    
+    children = {}
+    with engine.begin() as connection:
+        for child_id, n_sessions in enumerate(histories, 1):
+            connection.execute(insert(Child.__table__), [{"id": child_id, "user_id": PARENT_ID, "parent_id": PARENT_ID, "first_name": f"Child {child_id}", "date_of_birth": datetime(2017, 1, 1), "age": 9}])
+            minutes = np.sort(rng.uniform(0, 3 * 365 * 24 * 60, n_sessions))
+            connection.execute(insert(GameSession.__table__), [
+                {
+                    "child_id": child_id,
+                    "game_id": int(rng.integers(1, 40)),
+                    "parent_id": PARENT_ID,
+                    "session_id": f"{child_id}-{i}",
+                    "status": "completed",
+                    "completion_percentage": 100.0,
+                    "score": float(rng.random()),
+                    "created_at": now - timedelta(minutes=float(offset))
+                }
+                for i, offset in enumerate(minutes)
+            ])
+            children[child_id] = n_sessions
+    engine.dispose()
+    return children
+
+def median_ms(func, repeats: int) -> float:
+    """Median milliseconds per call after a warm-up call"""
+    func()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples)) * 1000
+
+def fetch_page(db, child_id: int, cursor, limit: int):
+    """One get_sessions page and the next page's cursor"""
+    response = Response()
+    user = SimpleNamespace(id=PARENT_ID)
+    sessions = get_sessions(response=response, child_id=child_id, game_id=None, status=None, page=PageParams(cursor=cursor, limit=limit), current_user=user, db=db)
+    return sessions, response.headers.get(NEXT_CURSOR_HEADER)
+
+def walk_pages(db, child_id: int, limit: int) -> list:
+    """Ids of every page in order"""
+    ids, cursor = [], None
+    while True:
+        sessions, cursor = fetch_page(db, child_id, cursor, limit)
+        ids.extend(session.id for session in sessions)
+        if not cursor:
+            return ids
+
+def run(path: str, children: dict, limit: int, repeats: int) -> list:
+    """Time the page fetches for every child"""
+    engine = create_engine(f"sqlite:///{path}")
+    db = sessionmaker(bind=engine)()
+    newest_first = (GameSession.created_at.desc(), GameSession.id.desc())
+    results = []
+    try:
+        for child_id, n_sessions in children.items():
+            child_sessions = db.query(GameSession).filter(GameSession.child_id == child_id)
+            full_ids = [session.id for session in child_sessions.order_by(*newest_first).all()]
+            exact = walk_pages(db, child_id, limit) == full_ids
+            
+            # The cursor a client holds after paging through half the history
+            depth = (n_sessions // 2) // limit * limit
+            deep_cursor = None
+            if depth:
+                keys = db.query(type_coerce(GameSession.created_at, String), GameSession.id).filter(
+                    GameSession.child_id == child_id
+                ).order_by(*newest_first).offset(depth - 1).first()
+                deep_cursor = encode_cursor(list(keys))
+            
+            timings = {
+                "first_page_ms": median_ms(lambda: fetch_page(db, child_id, None, limit), repeats),
+                "deep_page_ms": median_ms(lambda: fetch_page(db, child_id, deep_cursor, limit), repeats),
+                "offset_page_ms": median_ms(lambda: child_sessions.order_by(*newest_first).offset(depth).limit(limit).all(), repeats),
+                "unbounded_ms": median_ms(lambda: child_sessions.order_by(GameSession.created_at.desc()).all(), repeats)
+            }
+            results.append({"sessions": n_sessions, "exact": exact, "deep_page_offset": depth, **timings})
+            print(
+                f"   {'✅' if exact else '❌'} {n_sessions:>7} {timings['first_page_ms']:10.2f} {timings['deep_page_ms']:10.2f}"
+                f" {timings['offset_page_ms']:10.2f} {timings['unbounded_ms']:10.2f}"
+            )
+    finally:
+        db.close()
+        engine.dispose()
+    return results
+
+def main():
+    """Show that a session page costs the same for short and long histories"""
+    parser = argparse.ArgumentParser(description="Session list pagination benchmark")
+    parser.add_argument("--histories", type=int, nargs="+", default=[50, 1000, 10000, 50000], help="Sessions per benchmarked child")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    parser.add_argument("--repeats", type=int, default=7, help="Timing repeats per query")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as scratch:
+        path = f"{scratch}/pagination.db"
+        children = fill_database(path, args.histories, args.seed)
+        print(f"Session list pages of {args.limit} (ms):")
+        print(f"      {'history':>7} {'first':>10} {'cursor':>10} {'offset':>10} {'unbounded':>10}")
+        results = run(path, children, args.limit, args.repeats)
+    
+    document = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "limit": args.limit,
+            "repeats": args.repeats,
+            "python": platform.python_version(),
+            "machine": platform.platform()
+        },
+        "children": results
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(document, indent=2))
+    print(f"📁 Results written to {args.output}")
+    
+    if not all(result["exact"] for result in results):
+        print("❌ Walking the pages did not return the full session list")
+        sys.exit(1)
+    print("✅ Walking the pages returns the full session list")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
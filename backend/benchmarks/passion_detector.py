@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the passion detector hot paths
+Generates synthetic games, sessions and question responses in memory, times
+feature extraction, rule/hybrid detection, feature vectors and talent
+assessment at several sizes, writes the results as JSON and compares them
+with a stored baseline. Timings are also expressed relative to a fixed
+calibration workload so a baseline recorded on one machine stays usable on
+another.
+"""
+
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.models.game import Game
+from app.models.child import Child
+from app.models.session import GameSession
+from app.models.question import QuestionResponse
+from app.ml.passion_detector import PassionDetector, TALENT_DOMAINS, analyze_talent_responses
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baselines" / "passion_detector.json"
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "passion_detector.json"
+
+CATEGORIES = ["art", "music", "science", "sports", "leadership", "language", "logic", "puzzle", "story"]
+INTERESTS = ["drawing", "music", "experiments", "football", "reading", "puzzles", "building", "dancing"]
+
+def make_games(rng: random.Random, n_games: int) -> list:
+    """Transient Game rows spread over the categories"""
+    return [
+        Game(
+            id=game_id,
+            name=f"Game {game_id}",
+            category=rng.choice(CATEGORIES),
+            config={},
+            age_range={"min": 3, "max": 12},
+            passion_domains=[]
+        )
+        for game_id in range(1, n_games + 1)
+    ]
+
+def make_sessions(rng: random.Random, games: list, n_sessions: int) -> list:
+    """Transient GameSession rows with the fields feature extraction reads"""
+    sessions = []
+    for session_id in range(1, n_sessions + 1):
+        completed = rng.random() < 0.85
+        sessions.append(GameSession(
+            id=session_id,
+            child_id=1,
+            game_id=rng.choice(games).id,
+            parent_id=1,
+            session_id=f"bench-{session_id}",
+            status="completed" if completed else "abandoned",
+            duration_seconds=rng.uniform(60, 900) if completed else None,
+            score=rng.random() if rng.random() < 0.9 else None,
+            accuracy=rng.random() if rng.random() < 0.8 else None,
+            speed_metrics={"response_times": [rng.uniform(0.5, 6.0) for _ in range(rng.randint(0, 8))]},
+            emotional_reactions={"positive": rng.random()} if rng.random() < 0.6 else None
+        ))
+    return sessions
+
+def make_responses(rng: random.Random, n_responses: int) -> list:
+    """Transient QuestionResponse rows, newest first like the endpoint query"""
+    domains = list(TALENT_DOMAINS) + ["unknown"]
+    start = datetime(2024, 1, 1)
+    return [
+        QuestionResponse(
+            id=response_id,
+            child_id=1,
+            question_id=response_id,
+            answer="answer",
+            response_time=rng.uniform(1, 30) if rng.random() < 0.9 else None,
+            confidence_level=rng.uniform(1, 10) if rng.random() < 0.7 else None,
+            score=rng.random() if rng.random() < 0.9 else None,
+            talent_indicators={"domain": rng.choice(domains)} if rng.random() < 0.95 else None,
+            created_at=start - timedelta(minutes=response_id)
+        )
+        for response_id in range(1, n_responses + 1)
+    ]
+
+def make_child(rng: random.Random) -> Child:
+    """Transient Child row"""
+    return Child(
+        id=1,
+        user_id=1,
+        parent_id=1,
+        first_name="Bench",
+        date_of_birth=datetime(2017, 6, 1),
+        age=7,
+        initial_interests=rng.sample(INTERESTS, 3)
+    )
+
+def calibration() -> None:
+    """Fixed mixed Python/NumPy workload used to normalize timings across machines"""
+    total = 0
+    for i in range(20000):
+        total += i % 7
+    values = {str(i): i for i in range(2000)}
+    total += sum(values.values())
+    np.sort(np.arange(20000)[::-1] % 1013)
+
+def time_case(func, repeats: int, min_seconds: float) -> dict:
+    """Per-call timings: calls are looped until each repeat lasts at least min_seconds"""
+    func()  # Warm-up
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds or loops >= 1 << 20:
+            break
+        loops *= 2
+    
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    
+    return {
+        "median_ms": float(np.median(samples) * 1000),
+        "min_ms": float(np.min(samples) * 1000),
+        "max_ms": float(np.max(samples) * 1000),
+        "loops": loops,
+        "repeats": repeats
+    }
+
+def build_cases(sizes: list, seed: int) -> list:
+    """(name, callable) for every hot path at every size"""
+    detector = PassionDetector()
+    cases = []
+    for size in sizes:
+        rng = random.Random(seed + size)
+        games = make_games(rng, max(10, size // 10))
+        sessions = make_sessions(rng, games, size)
+        responses = make_responses(rng, size)
+        child = make_child(rng)
+        features = detector.extract_features(sessions, games)
+        interests = child.initial_interests
+        
+        cases.extend([
+            (f"extract_features[n={size}]", lambda s=sessions, g=games: detector.extract_features(s, g)),
+            (f"rule_based_detection[n={size}]", lambda f=features, i=interests: detector.rule_based_detection(f, i)),
+            (f"hybrid_detection[n={size}]", lambda f=features, i=interests: detector.hybrid_detection(f, i)),
+            (f"_create_feature_vector[n={size}]", lambda f=features: detector._create_feature_vector(f)),
+            (f"analyze_talent_responses[n={size}]", lambda r=responses, c=child: analyze_talent_responses(r, c))
+        ])
+    return cases
+
+def git_commit() -> str:
+    """Current commit hash, if the suite runs inside a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARK_DIR, capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+def run_suite(sizes: list, seed: int, repeats: int, min_seconds: float) -> dict:
+    """Time every case and return the JSON document"""
+    calibration_timing = time_case(calibration, repeats, min_seconds)
+    results = {}
+    for name, func in build_cases(sizes, seed):
+        timing = time_case(func, repeats, min_seconds)
+        timing["relative"] = timing["median_ms"] / calibration_timing["median_ms"]
+        results[name] = timing
+        print(f"   {name:<40} median {timing['median_ms']:10.4f} ms  min {timing['min_ms']:10.4f} ms  relative {timing['relative']:9.4f}")
+    
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+            "seed": seed,
+            "sizes": sizes,
+            "calibration_ms": calibration_timing["median_ms"]
+        },
+        "results": results
+    }
+
+def compare(current: dict, baseline: dict, tolerance: float, metric: str) -> list:
+    """Names of cases slower than the baseline by more than the tolerance"""
+    regressions = []
+    print(f"Comparing {metric} against baseline from {baseline['meta'].get('created_at')} ({baseline['meta'].get('commit') or 'unknown commit'})")
+    for name, timing in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"   ⚠️  {name:<40} not in baseline")
+            continue
+        ratio = timing[metric] / reference[metric] if reference[metric] else float("inf")
+        regressed = ratio > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"   {'❌' if regressed else '✅'} {name:<40} x{ratio:6.2f}")
+    for name in baseline["results"]:
+        if name not in current["results"]:
+            print(f"   ⚠️  {name:<40} missing from this run")
+    return regressions
+
+def main():
+    """Run the suite, write results and fail on regressions"""
+    parser = argparse.ArgumentParser(description="Passion detector benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Sessions and responses per synthetic child")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing repeats per case")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Minimum duration of one timing repeat")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Stored baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a case counts as a regression")
+    parser.add_argument(
+        "--metric",
+        choices=["relative", "median_ms"],
+        default="relative",
+        help="relative (calibration-normalized, portable across machines) or median_ms (same machine only)"
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args()
+    
+    print(f"Running passion detector benchmarks for sizes {args.sizes}...")
+    current = run_suite(args.sizes, args.seed, args.repeats, args.min_seconds)
+    
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(current, indent=2))
+    print(f"📁 Results written to {args.output}")
+    
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2))
+        print(f"✅ Baseline updated at {args.baseline}")
+        return
+    
+    if not args.baseline.exists():
+        print(f"⚠️  No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+    
+    regressions = compare(current, json.loads(args.baseline.read_text()), args.tolerance, args.metric)
+    if regressions:
+        print(f"❌ {len(regressions)} case(s) regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print("✅ No regressions")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Benchmark the bytes and memory the session read paths spend on telemetry
+Fills a scratch SQLite database with one child's game sessions carrying
+generate_data.py's telemetry payloads, then runs the session list, the
+progress and dashboard analytics and the detector's session-history analysis
+twice: as shipped, with the telemetry columns deferred, and with every
+telemetry column loaded as before. For each request it reports the result
+bytes the queries read from the database, the peak Python memory and the
+median time; the list (its first page) also reports its response size.
+"""
+
+import gc
+import sys
+import json
+import time
+import random
+import asyncio
+import sqlite3
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+import numpy as np
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, undefer_group
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import Base
+from app.core.pagination import PageParams
+from app.models.child import Child
+from app.models.game import Game
+from app.models.session import TELEMETRY, GameSession
+from app.schemas.game import GameSession as GameSessionSchema, GameSessionSummary
+from app.api.v1.endpoints.sessions import get_sessions
+from app.api.v1.endpoints.analytics import get_child_progress, get_dashboard_data
+from app.ml.passion_detector import PassionDetector
+from generate_data import telemetry_pools
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "session_telemetry.json"
+
+CATEGORIES = ["art", "music", "science", "sports", "leadership", "language", "logic", "puzzle"]
+
+PARENT_ID = 1
+
+# Set while measuring the full-row baseline
+FULL_ROWS = {"enabled": False}
+
+@event.listens_for(Session, "do_orm_execute")
+def load_full_rows(orm_execute_state) -> None:
+    """Undefer the telemetry of every GameSession select, as the model loaded it before"""
+    if FULL_ROWS["enabled"] and orm_execute_state.is_select:
+        orm_execute_state.statement = orm_execute_state.statement.options(undefer_group(TELEMETRY))
+
+class StatementLog:
+    """SELECT statements an engine ran, replayed later to count the result bytes"""
+    
+    def __init__(self):
+        self.statements = []
+    
+    def listen(self, sync_engine) -> None:
+        event.listen(sync_engine, "after_cursor_execute", self.record)
+    
+    def record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+    
+    def result_bytes(self, path: str) -> int:
+        """Size of the values the logged statements return (text and blobs by length, numbers as 8 bytes)"""
+        total = 0
+        with sqlite3.connect(path) as connection:
+            for statement, parameters in self.statements:
+                for row in connection.execute(statement, parameters):
+                    total += sum(len(value) if isinstance(value, (str, bytes)) else 8 for value in row if value is not None)
+        return total
+
+def fill_database(path: str, n_sessions: int, seed: int) -> int:
+    """One child with n_sessions telemetry-carrying sessions over the past year; returns the child id"""
+    rng = random.Random(seed)
+    pools = telemetry_pools(np.random.default_rng(seed))
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    
+    now = datetime.now()
+    with sessionmaker(bind=engine)() as db:
+        child = Child(user_id=PARENT_ID, parent_id=PARENT_ID, first_name="Bench", date_of_birth=datetime(2017, 5, 1), age=9, initial_interests=["drawing", "music"], parental_consent_given=True)
+        db.add(child)
+        db.add_all([Game(id=game_id, name=f"Game {game_id}", category=category, config={}, age_range={"min": 3, "max": 12}, passion_domains=[]) for game_id, category in enumerate(CATEGORIES, 1)])
+        db.flush()
+        
+        for i in range(n_sessions):
+            started = now - timedelta(minutes=rng.uniform(10, 365 * 24 * 60))
+            completed = rng.random() < 0.8
+            pick = rng.randrange(len(pools["speed_metrics"]))
+            db.add(GameSession(
+                child_id=child.id,
+                game_id=rng.randint(1, len(CATEGORIES)),
+                parent_id=PARENT_ID,
+                session_id=f"bench-{i}",
+                started_at=started,
+                completed_at=started + timedelta(minutes=5) if completed else None,
+                duration_seconds=rng.uniform(60, 900) if completed else None,
+                status="completed" if completed else "abandoned",
+                completion_percentage=100.0 if completed else rng.uniform(0, 90),
+                score=rng.random(),
+                accuracy=rng.random(),
+                **{name: json.loads(pools[name][pick]) for name in pools},
+                created_at=started
+            ))
+        db.commit()
+        child_id = child.id
+    engine.dispose()
+    return child_id
+
+def measure(run, repeats: int, log: StatementLog, path: str) -> dict:
+    """Median seconds, peak traced memory and result bytes of one request"""
+    run()  # Warm-up (model loading, statement caches)
+    samples = []
+    peak = 0
+    for _ in range(repeats):
+        log.statements.clear()
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        size = run()
+        samples.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {
+        "median_ms": float(np.median(samples)) * 1000,
+        "peak_memory_kb": peak / 1024,
+        "bytes_read": log.result_bytes(path),
+        "statements": len(log.statements),
+        "response_bytes": size
+    }
+
+def build_requests(path: str, child_id: int, log: StatementLog) -> dict:
+    """The read paths under test, each a callable returning its response size (or None)"""
+    sync_engine = create_engine(f"sqlite:///{path}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    log.listen(sync_engine)
+    log.listen(async_engine.sync_engine)
+    sync_sessions = sessionmaker(bind=sync_engine)
+    async_sessions = sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False)
+    user = SimpleNamespace(id=PARENT_ID)
+    detector = PassionDetector()
+    loop = asyncio.new_event_loop()
+    
+    def session_list() -> int:
+        schema = GameSessionSchema if FULL_ROWS["enabled"] else GameSessionSummary
+        with sync_sessions() as db:
+            page = PageParams(cursor=None, limit=None)
+            sessions = get_sessions(response=Response(), child_id=child_id, game_id=None, status=None, page=page, current_user=user, db=db)
+            return len(TypeAdapter(List[schema]).dump_json(sessions))
+    
+    async def call_async(endpoint, **kwargs):
+        async with async_sessions() as db:
+            return await endpoint(current_user=user, db=db, **kwargs)
+    
+    def analyze() -> None:
+        # No feature store row, so the detector reads the session history
+        with sync_sessions() as db:
+            detector._analyze_child(child_id, db)
+    
+    requests = {
+        "GET /sessions": session_list,
+        "GET /analytics/child/{id}/progress": lambda: loop.run_until_complete(call_async(get_child_progress, child_id=child_id, days=365)) and None,
+        "GET /analytics/dashboard/{id}": lambda: loop.run_until_complete(call_async(get_dashboard_data, child_id=child_id)) and None,
+        "PassionDetector.analyze_child": analyze
+    }
+    return requests, sync_engine, async_engine, loop
+
+def run_size(n_sessions: int, seed: int, repeats: int) -> dict:
+    """Measure every request with deferred and with fully loaded telemetry"""
+    with tempfile.TemporaryDirectory() as scratch:
+        path = f"{scratch}/session_telemetry.db"
+        child_id = fill_database(path, n_sessions, seed)
+        log = StatementLog()
+        requests, sync_engine, async_engine, loop = build_requests(path, child_id, log)
+        
+        results = {}
+        try:
+            for name, run in requests.items():
+                FULL_ROWS["enabled"] = True
+                before = measure(run, repeats, log, path)
+                FULL_ROWS["enabled"] = False
+                after = measure(run, repeats, log, path)
+                results[name] = {"full_rows": before, "deferred": after}
+                response = f"  response {before['response_bytes'] / 1024:8.1f} -> {after['response_bytes'] / 1024:8.1f} KB" if after["response_bytes"] else ""
+                print(
+                    f"   {name:<36} read {before['bytes_read'] / 1024:8.1f} -> {after['bytes_read'] / 1024:8.1f} KB"
+                    f"  memory {before['peak_memory_kb']:8.1f} -> {after['peak_memory_kb']:8.1f} KB"
+                    f"  time {before['median_ms']:7.2f} -> {after['median_ms']:7.2f} ms{response}"
+                )
+        finally:
+            FULL_ROWS["enabled"] = False
+            loop.run_until_complete(async_engine.dispose())
+            loop.close()
+            sync_engine.dispose()
+        return {"sessions": n_sessions, "requests": results}
+
+def main():
+    """Compare the session read paths with deferred and with loaded telemetry"""
+    parser = argparse.ArgumentParser(description="Session telemetry loading benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 2000], help="Sessions of the benchmarked child")
+    parser.add_argument("--repeats", type=int, default=5, help="Measured runs per request")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    args = parser.parse_args()
+    
+    runs = []
+    for n_sessions in args.sizes:
+        print(f"Child with {n_sessions} sessions (full rows -> deferred telemetry):")
+        runs.append(run_size(n_sessions, args.seed, args.repeats))
+    
+    document = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "repeats": args.repeats,
+            "python": platform.python_version(),
+            "machine": platform.platform()
+        },
+        "runs": runs
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(document, indent=2))
+    print(f"📁 Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
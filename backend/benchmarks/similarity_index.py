@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Exactness check and benchmark for the similar-children index
+Times encoding, saving, memory-mapped loading and top-k search at 10^5 to
+10^6 synthetic children, and compares against scikit-learn's BallTree.
+"""
+
+import sys
+import time
+import tempfile
+import argparse
+from pathlib import Path
+
+import numpy as np
+from sklearn.neighbors import BallTree
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.ml.similarity_index import SimilarityIndex
+
+DOMAINS = [
+    "art_creativity",
+    "music_rhythm",
+    "science_discovery",
+    "sports_movement",
+    "leadership_social",
+    "language_communication",
+    "logic_mathematics"
+]
+
+N_FEATURES = 17  # Length of PassionDetector._create_feature_vector
+
+def synthetic_features(rng: np.random.Generator, n_rows: int) -> np.ndarray:
+    """Feature rows shaped like _create_feature_vector output"""
+    X = np.empty((n_rows, N_FEATURES))
+    X[:, 0] = rng.integers(1, 200, n_rows)  # total_sessions
+    X[:, 1] = X[:, 0]  # completed_sessions
+    X[:, 2] = 1.0  # completion_rate
+    X[:, 3] = rng.gamma(2.0, 60.0, n_rows)  # total_play_time
+    X[:, 4] = rng.gamma(2.0, 150.0, n_rows)  # avg_session_duration
+    X[:, 5:7] = rng.random((n_rows, 2))  # avg_score, max_score
+    X[:, 7] = rng.gamma(2.0, 1.5, n_rows)  # avg_response_time
+    X[:, 8:10] = rng.random((n_rows, 2))  # avg_accuracy, emotional_engagement
+    X[:, 10:] = rng.integers(0, 30, (n_rows, len(DOMAINS)))  # category counts per domain
+    return X
+
+def build_index(rng: np.random.Generator, n_children: int) -> SimilarityIndex:
+    """Index over synthetic children, standardized the same way as build_similarity_index"""
+    X = synthetic_features(rng, n_children)
+    interests = rng.integers(0, 3, (n_children, len(DOMAINS))).astype(float)
+    behaviour = np.log1p(X)
+    std = behaviour.std(axis=0)
+    index = SimilarityIndex(
+        vectors=np.zeros((0, N_FEATURES + len(DOMAINS)), dtype=np.float32),
+        child_ids=np.arange(1, n_children + 1, dtype=np.int64),
+        priors=rng.random((n_children, len(DOMAINS))).astype(np.float32),
+        mean=behaviour.mean(axis=0),
+        scale=np.where(std > 0, std, 1.0),
+        domains=DOMAINS
+    )
+    index.vectors = index.encode(X, interests)
+    return index
+
+def percentiles(timings: list) -> str:
+    """p50/p95 of a list of seconds, in milliseconds"""
+    values = np.array(timings) * 1000
+    return f"p50 {np.percentile(values, 50):8.3f} ms  p95 {np.percentile(values, 95):8.3f} ms"
+
+def main():
+    """Run exactness checks and timings"""
+    parser = argparse.ArgumentParser(description="Similar-children index benchmark")
+    parser.add_argument("--children", type=int, nargs="+", default=[100000, 1000000], help="Index sizes to time")
+    parser.add_argument("--k", type=int, default=20, help="Neighbours per query")
+    parser.add_argument("--queries", type=int, default=200, help="Single-child queries to time")
+    parser.add_argument("--batch", type=int, default=1000, help="Children per batched query (one analysis chunk)")
+    parser.add_argument("--ball-tree-max", type=int, default=200000, help="Largest index size also timed with BallTree")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    failed = False
+    
+    for n_children in args.children:
+        start = time.perf_counter()
+        index = build_index(rng, n_children)
+        encode_time = time.perf_counter() - start
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            index.save(tmp)
+            save_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            served = SimilarityIndex.load(tmp, mmap_mode="r")
+            load_time = time.perf_counter() - start
+            
+            query_rows = rng.integers(0, n_children, args.queries)
+            queries = np.asarray(served.vectors[query_rows])
+            
+            # Exactness against a full sort of every similarity
+            rows, sims = served.search(queries[:20], args.k, (query_rows[:20] + 1).tolist())
+            expected = np.asarray(served.vectors) @ queries[:20].T
+            expected[query_rows[:20], np.arange(20)] = -np.inf
+            expected_sims = -np.sort(-expected, axis=0)[:args.k].T
+            max_diff = float(np.max(np.abs(sims - expected_sims)))
+            ok = max_diff < 1e-5 and not np.any(served.child_ids[rows] == (query_rows[:20, None] + 1))
+            failed = failed or not ok
+            
+            print(f"{'✅' if ok else '❌'} children={n_children:<8} exact top-{args.k} max |diff| = {max_diff:.2e}")
+            print(f"   encode {encode_time:7.2f} s  save {save_time:7.2f} s  mmap load {load_time * 1000:8.3f} ms")
+            
+            timings = []
+            for row, child_row in enumerate(query_rows):
+                start = time.perf_counter()
+                served.neighbours(queries[row], args.k, exclude_id=int(child_row) + 1)
+                timings.append(time.perf_counter() - start)
+            print(f"   single query  {percentiles(timings)}")
+            
+            batch = np.asarray(served.vectors[rng.integers(0, n_children, args.batch)])
+            start = time.perf_counter()
+            served.domain_priors(batch, args.k)
+            batch_time = time.perf_counter() - start
+            print(f"   batch of {args.batch} priors {batch_time * 1000:9.3f} ms ({batch_time / args.batch * 1000:.3f} ms per child)")
+            
+            if n_children <= args.ball_tree_max:
+                # Unit vectors: euclidean order equals cosine order
+                start = time.perf_counter()
+                tree = BallTree(np.asarray(served.vectors))
+                tree_build = time.perf_counter() - start
+                timings = []
+                for row in range(len(query_rows)):
+                    start = time.perf_counter()
+                    tree.query(queries[row:row + 1], k=args.k + 1)
+                    timings.append(time.perf_counter() - start)
+                print(f"   BallTree build {tree_build:7.2f} s  single query  {percentiles(timings)}")
+            
+            del served
+    
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Build the similar-children index used as a cold-start prior
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.ml.passion_detector import PassionDetector
+from app.ml.similarity_index import build_similarity_index, index_path
+
+def main():
+    """Encode well-observed children and write the memory-mappable index"""
+    parser = argparse.ArgumentParser(description="Build the similar-children vector index")
+    parser.add_argument(
+        "--path",
+        default=index_path(),
+        help="Index directory (served from MODEL_PATH/similarity_index)"
+    )
+    parser.add_argument(
+        "--min-sessions",
+        type=int,
+        default=settings.COLD_START_SESSIONS,
+        help="Completed sessions a child needs to be used as a neighbour"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Feature rows read per round trip"
+    )
+    
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        print(f"Building similarity index from children with at least {args.min_sessions} sessions...")
+        summary = build_similarity_index(
+            db,
+            PassionDetector(),
+            args.path,
+            min_sessions=args.min_sessions,
+            batch_size=args.batch_size
+        )
+        
+        print(f"✅ Indexed {summary['children']} children ({summary['dimensions']} dimensions) in {summary['build_seconds']:.2f}s")
+        if not summary["children"]:
+            print("   ⚠️  No children have both enough sessions and detected passion domains yet")
+        print(f"📁 Index written to {summary['path']}")
+    
+    except Exception as e:
+        print(f"❌ Error building similarity index: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Check the query plans of the read endpoints for sequential scans
+Calls every read endpoint for a data-heavy child in-process, captures the SQL
+they send, runs EXPLAIN on each statement and fails when a table above
+--min-rows is scanned without an index. Point DATABASE_URL at a disposable
+database filled by generate_data.py (some endpoints write caches).
+"""
+
+import re
+import sys
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, inspect, text
+
+from main import app
+from app.core.auth import create_access_token
+from app.core.database import engine, get_async_engine, SessionLocal
+from app.models.child import Child
+from app.models.session import GameSession
+
+# Read endpoints checked, formatted with the chosen child, game and session
+ENDPOINTS = [
+    "/api/v1/auth/me",
+    "/api/v1/children/",
+    "/api/v1/children/{child_id}",
+    "/api/v1/games/",
+    "/api/v1/games/{game_id}",
+    "/api/v1/games/recommended?child_id={child_id}",
+    "/api/v1/sessions/?child_id={child_id}",
+    "/api/v1/sessions/{session_id}",
+    "/api/v1/passions/domains/{child_id}",
+    "/api/v1/passions/domains/{child_id}/percentiles",
+    "/api/v1/passions/insights/{child_id}",
+    "/api/v1/passions/recommendations/{child_id}",
+    "/api/v1/passions/summary/{child_id}",
+    "/api/v1/analytics/child/{child_id}/progress",
+    "/api/v1/analytics/child/{child_id}/activity-timeline",
+    "/api/v1/analytics/child/{child_id}/game-performance",
+    "/api/v1/analytics/child/{child_id}/passion-evolution",
+    "/api/v1/analytics/dashboard/{child_id}",
+    "/api/v1/questions/",
+    "/api/v1/questions/assessment/{child_id}",
+    "/api/v1/questions/assessment/{child_id}/history",
+    "/api/v1/questions/assessment/{child_id}/percentiles"
+]
+
+class StatementRecorder:
+    """Collects (statement, parameters) per endpoint from both engines"""
+    
+    def __init__(self):
+        self.endpoint = None
+        self.statements = defaultdict(list)
+    
+    def listen(self, sync_engine) -> None:
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def capture(connection, cursor, statement, parameters, context, executemany):
+            if self.endpoint and not executemany and statement.lstrip().upper().startswith("SELECT"):
+                self.statements[self.endpoint].append((statement, parameters, connection.dialect.name))
+
+def pick_child(db) -> tuple:
+    """Child with the most sessions, its parent, one of its games and sessions"""
+    child_id, _ = db.query(GameSession.child_id, func.count(GameSession.id)).group_by(
+        GameSession.child_id
+    ).order_by(func.count(GameSession.id).desc()).first()
+    child = db.query(Child).filter(Child.id == child_id).first()
+    session = db.query(GameSession).filter(GameSession.child_id == child_id).first()
+    return child, session
+
+def table_rows(db) -> dict:
+    """Approximate row count per table"""
+    counts = {}
+    for table in inspect(engine).get_table_names():
+        counts[table] = db.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+    return counts
+
+def as_psycopg2(statement: str, parameters) -> tuple:
+    """Rewrite an asyncpg ($1) statement for the sync psycopg2 connection"""
+    if not isinstance(parameters, (tuple, list)) or not re.search(r"\$\d+", statement):
+        return statement, parameters
+    positions = [int(number) - 1 for number in re.findall(r"\$(\d+)", statement)]
+    statement = re.sub(r"\$\d+", "%s", statement.replace("%", "%%"))
+    return statement, tuple(parameters[position] for position in positions)
+
+def explain(statement: str, parameters, dialect: str) -> list:
+    """(table, plan line) pairs of full table scans in the statement's plan"""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        if dialect == "postgresql":
+            statement, parameters = as_psycopg2(statement, parameters)
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = cursor.fetchone()[0][0]["Plan"]
+            scans = []
+            nodes = [plan]
+            while nodes:
+                node = nodes.pop()
+                if node.get("Node Type") == "Seq Scan":
+                    scans.append((node["Relation Name"], f"Seq Scan on {node['Relation Name']}"))
+                nodes.extend(node.get("Plans", []))
+            return scans
+        
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        scans = []
+        for row in cursor.fetchall():
+            detail = row[-1]
+            match = re.match(r"SCAN (?:TABLE )?(\w+)", detail)
+            if match and "USING" not in detail:
+                scans.append((match.group(1), detail))
+        return scans
+    finally:
+        connection.close()
+
+def main():
+    """Call the read endpoints, explain their queries and report full scans"""
+    parser = argparse.ArgumentParser(description="Fail on sequential scans in endpoint queries")
+    parser.add_argument("--min-rows", type=int, default=10000, help="Only scans of tables at least this large fail the check")
+    parser.add_argument("--verbose", action="store_true", help="Print every statement and its scans")
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        # Fresh planner statistics for the synthetic data
+        db.execute(text("ANALYZE"))
+        db.commit()
+        rows = table_rows(db)
+        if rows.get("game_sessions", 0) < args.min_rows:
+            print(f"⚠️  game_sessions has {rows.get('game_sessions', 0)} rows; generate a larger dataset with generate_data.py for meaningful plans")
+        child, session = pick_child(db)
+    except Exception as e:
+        print(f"❌ Error preparing the check: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+    
+    recorder = StatementRecorder()
+    recorder.listen(engine)
+    recorder.listen(get_async_engine().sync_engine)
+    
+    token = create_access_token(data={"sub": str(child.parent_id)})
+    headers = {"Authorization": f"Bearer {token}"}
+    print(f"Checking query plans for child {child.id} on {engine.dialect.name}...")
+    with TestClient(app, raise_server_exceptions=False) as client:
+        for template in ENDPOINTS:
+            path = template.format(child_id=child.id, game_id=session.game_id, session_id=session.session_id)
+            recorder.endpoint = template
+            status_code = client.get(path, headers=headers).status_code
+            recorder.endpoint = None
+            if status_code != 200:
+                print(f"   ⚠️  {template} returned {status_code}")
+    
+    failures = 0
+    for template in ENDPOINTS:
+        statements = recorder.statements.get(template, [])
+        endpoint_failures = []
+        for statement, parameters, dialect in statements:
+            scans = explain(statement, parameters, dialect)
+            large = [(table, detail) for table, detail in scans if rows.get(table, 0) >= args.min_rows]
+            endpoint_failures.extend((statement, table, detail) for table, detail in large)
+            if args.verbose:
+                print(f"      {' '.join(statement.split())[:160]}")
+                for table, detail in scans:
+                    print(f"         {detail} ({rows.get(table, 0)} rows)")
+        
+        failures += len(endpoint_failures)
+        print(f"   {'❌' if endpoint_failures else '✅'} {template:<55} {len(statements):>3} queries")
+        for statement, table, detail in endpoint_failures:
+            print(f"      {detail} ({rows[table]} rows): {' '.join(statement.split())[:160]}")
+    
+    if failures:
+        print(f"❌ {failures} sequential scan(s) over tables with at least {args.min_rows} rows")
+        sys.exit(1)
+    print("✅ No sequential scans over large tables")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
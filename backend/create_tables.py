@@ -10,31 +10,29 @@ from pathlib import Path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-from app.core.database import engine, SessionLocal
+from app.core.database import SessionLocal
+from app.core.migrations import upgrade_database, head_revision
 from app.models.user import User
 from app.models.child import Child
 from app.models.game import Game
 from app.models.question import Question, QuestionResponse, TalentAssessment
 from app.models.session import GameSession
 from app.models.passion import PassionDomain, PassionInsight
+from app.models.child_features import ChildFeatures
+from app.models.recommendation import ChildRecommendations
+from app.models.cohort_stats import CohortScoreBin
+from app.models.analysis_job import AnalysisJob
 from passlib.context import CryptContext
 
 def create_tables():
-    """Create all database tables"""
-    print("Creating database tables...")
+    """Create or migrate the database tables"""
+    print("Migrating database schema...")
     
     try:
-        # Import all models to ensure they're registered
-        from app.models.user import Base
-        from app.models.child import Base
-        from app.models.game import Base
-        from app.models.question import Base
-        from app.models.session import Base
-        from app.models.passion import Base
-        
-        # Create tables
-        Base.metadata.create_all(bind=engine)
-        print("✅ All tables created successfully!")
+        if upgrade_database():
+            print(f"✅ Schema migrated to revision {head_revision()}")
+        else:
+            print("✅ Schema is already up to date")
         return True
         
     except Exception as e:
@@ -19,12 +19,17 @@ backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
 from app.core.config import settings
-from app.core.database import Base, engine, SessionLocal
+from app.core.database import engine, SessionLocal
+from app.core.migrations import upgrade_database, head_revision
 from app.models.user import User
 from app.models.child import Child
 from app.models.game import Game
 from app.models.session import GameSession
 from app.models.passion import PassionDomain, PassionInsight
+from app.models.child_features import ChildFeatures
+from app.models.recommendation import ChildRecommendations
+from app.models.cohort_stats import CohortScoreBin
+from app.models.analysis_job import AnalysisJob
 
 # Configure logging
 logging.basicConfig(
@@ -133,11 +138,13 @@ class DatabaseSetup:
             return False
     
     def create_tables(self):
-        """Create all database tables"""
+        """Create or migrate the database tables"""
         try:
-            logger.info("Creating database tables...")
-            Base.metadata.create_all(bind=engine)
-            logger.info("All tables created successfully!")
+            logger.info("Migrating database schema...")
+            if upgrade_database():
+                logger.info(f"Schema migrated to revision {head_revision()}")
+            else:
+                logger.info("Schema is already up to date")
             return True
         except Exception as e:
             logger.error(f"Error creating tables: {e}")
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Generate a large synthetic dataset for load and performance testing
+Creates parents, children, games, questions, game sessions with JSON telemetry,
+question responses and talent assessments. Output is deterministic for a given
+seed, size arguments and --until date. Rows are written in chunks with COPY on
+PostgreSQL and executemany on SQLite.
+"""
+
+import io
+import csv
+import sys
+import json
+import time
+import uuid
+import argparse
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import func
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import engine, SessionLocal
+from app.core.migrations import upgrade_database
+from app.core.partitions import ensure_partitions
+from app.core.auth import get_password_hash
+from app.models.user import User
+from app.models.child import Child
+from app.models.game import Game, GamePassionDomain
+from app.models.session import GameSession
+from app.models.question import Question, QuestionResponse, TalentAssessment
+from app.ml.passion_detector import TALENT_DOMAINS
+
+# Game categories with the passion domain and question talent domain they exercise
+CATEGORIES = {
+    "art": ("art_creativity", "artistic_creativity"),
+    "music": ("music_rhythm", "musical_rhythm"),
+    "science": ("science_discovery", "scientific_discovery"),
+    "sports": ("sports_movement", "sports_movement"),
+    "leadership": ("leadership_social", "social_leadership"),
+    "language": ("language_communication", "language_communication"),
+    "logic": ("logic_mathematics", "logical_mathematics"),
+    "puzzle": ("logic_mathematics", "technology_innovation")
+}
+
+FIRST_NAMES = ["Amani", "Brian", "Chloe", "Daniel", "Esther", "Felix", "Grace", "Hugo", "Imani", "Jonas", "Keza", "Liam", "Maya", "Noah", "Olive", "Pacifique"]
+LAST_NAMES = ["Mugisha", "Smith", "Uwase", "Garcia", "Niyonzima", "Chen", "Ishimwe", "Martin", "Keza", "Brown"]
+INTERESTS = ["drawing", "painting", "music", "singing", "dancing", "experiments", "nature", "football", "running", "reading", "stories", "puzzles", "building", "numbers", "leading games"]
+COLORS = ["red", "blue", "green", "yellow", "purple", "orange", "pink"]
+LEARNING_STYLES = ["visual", "auditory", "kinesthetic"]
+DIFFICULTIES = ["beginner", "intermediate", "advanced"]
+DEVICES = [
+    {"browser": "Chrome", "os": "Android", "screen": "1080x2400"},
+    {"browser": "Safari", "os": "iOS", "screen": "1170x2532"},
+    {"browser": "Chrome", "os": "Windows", "screen": "1920x1080"},
+    {"browser": "Firefox", "os": "Linux", "screen": "1366x768"}
+]
+
+TELEMETRY_POOL_SIZE = 4096  # Distinct JSON payloads per telemetry column, sampled per session
+
+class BulkWriter:
+    """Writes row tuples through the fastest bulk path of the connected database"""
+    
+    def __init__(self, engine):
+        self.dialect = engine.dialect.name
+        self.paramstyle = engine.dialect.paramstyle
+        self.connection = engine.raw_connection()
+        self.rows = Counter()
+        self.seconds = Counter()
+        if self.dialect == "sqlite":
+            # Bulk load only: a crash mid-run loses the current chunk at worst
+            self.connection.cursor().execute("PRAGMA synchronous = OFF")
+    
+    def write(self, table, columns: list, rows: list) -> None:
+        """Append rows (tuples in column order, JSON already encoded) to a table"""
+        if not rows:
+            return
+        start = time.perf_counter()
+        cursor = self.connection.cursor()
+        if self.dialect == "postgresql":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        else:
+            placeholder = "?" if self.paramstyle == "qmark" else "%s"
+            cursor.executemany(
+                f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})",
+                rows
+            )
+        self.rows[table.name] += len(rows)
+        self.seconds[table.name] += time.perf_counter() - start
+    
+    def commit(self) -> None:
+        self.connection.commit()
+    
+    def reset_sequences(self, tables: list) -> None:
+        """Move PostgreSQL id sequences past the explicitly assigned ids"""
+        if self.dialect != "postgresql":
+            return
+        cursor = self.connection.cursor()
+        for table in tables:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), COALESCE((SELECT MAX(id) FROM {table.name}), 1))"
+            )
+        self.connection.commit()
+    
+    def close(self) -> None:
+        self.connection.close()
+
+def next_id(db, model) -> int:
+    """First id after the rows already in a table"""
+    return (db.query(func.max(model.id)).scalar() or 0) + 1
+
+def timestamps(base: np.datetime64, offsets_seconds: np.ndarray) -> list:
+    """Datetime strings (accepted by both SQLite and PostgreSQL) at offsets from base"""
+    values = base + (offsets_seconds * 1e6).astype("timedelta64[us]")
+    return [text.replace("T", " ") for text in np.datetime_as_string(values, unit="us").tolist()]
+
+def optional(values: np.ndarray, present: np.ndarray, digits: int = 4) -> list:
+    """Rounded floats with None where a value is missing"""
+    return [round(value, digits) if keep else None for value, keep in zip(values.tolist(), present.tolist())]
+
+def telemetry_pools(rng: np.random.Generator) -> dict:
+    """Realistic JSON payloads for the session telemetry columns"""
+    pools = {"speed_metrics": [], "emotional_reactions": [], "attention_metrics": [], "interactions": [], "device_info": []}
+    for _ in range(TELEMETRY_POOL_SIZE):
+        response_times = np.round(rng.gamma(2.0, 1.2, rng.integers(0, 12)) + 0.3, 2).tolist()
+        pools["speed_metrics"].append(json.dumps({"response_times": response_times, "avg_response_time": round(float(np.mean(response_times)), 2) if response_times else None}))
+        positive = round(float(rng.beta(4, 2)), 3)
+        pools["emotional_reactions"].append(json.dumps({"positive": positive, "negative": round(float(rng.beta(1, 6)), 3), "neutral": round(1 - positive, 3), "dominant": "joy" if positive > 0.6 else "calm"}))
+        pools["attention_metrics"].append(json.dumps({"focus_score": round(float(rng.beta(5, 2)), 3), "distractions": int(rng.poisson(1.5)), "idle_seconds": round(float(rng.exponential(20)), 1)}))
+        clicks = int(rng.poisson(40))
+        pools["interactions"].append(json.dumps({"clicks": clicks, "drags": int(rng.poisson(8)), "hints_used": int(rng.poisson(0.7)), "retries": int(rng.poisson(0.5)), "events": [{"type": "click", "t": round(float(t), 1)} for t in np.sort(rng.uniform(0, 300, min(clicks, 5)))]}))
+        pools["device_info"].append(json.dumps(DEVICES[int(rng.integers(len(DEVICES)))]))
+    return {name: np.array(values, dtype=object) for name, values in pools.items()}
+
+def generate_games(writer: BulkWriter, rng: np.random.Generator, first_id: int, n_games: int, now: np.datetime64) -> list:
+    """Write the game catalog and return (id, category) pairs"""
+    categories = list(CATEGORIES)
+    columns = ["id", "name", "description", "category", "config", "difficulty_levels", "age_range", "age_min", "age_max", "estimated_duration", "max_players", "requires_audio", "requires_video", "requires_microphone", "passion_domains", "is_active", "is_beta", "version", "total_plays", "average_rating", "created_at"]
+    created = timestamps(now, -rng.uniform(30, 720, n_games) * 86400)
+    rows = []
+    domain_rows = []
+    games = []
+    for offset in range(n_games):
+        game_id = first_id + offset
+        category = categories[offset % len(categories)]
+        age_min = int(rng.integers(3, 9))
+        levels = int(rng.integers(3, 12))
+        age_max = age_min + int(rng.integers(3, 7))
+        rows.append((
+            game_id, f"{category.title()} Game {game_id}", f"Synthetic {category} game", category,
+            json.dumps({"levels": levels, "theme": category}), json.dumps(DIFFICULTIES),
+            json.dumps({"min": age_min, "max": age_max}), age_min, age_max, int(rng.integers(5, 30)), 1,
+            category == "music", False, False, json.dumps([CATEGORIES[category][0]]), True, False, "1.0.0",
+            0, round(float(rng.uniform(3.0, 5.0)), 2), created[offset]
+        ))
+        domain_rows.append((game_id, CATEGORIES[category][0]))
+        games.append((game_id, category))
+    writer.write(Game.__table__, columns, rows)
+    writer.write(GamePassionDomain.__table__, ["game_id", "domain"], domain_rows)
+    return games
+
+def generate_questions(writer: BulkWriter, rng: np.random.Generator, first_id: int, n_questions: int, now: np.datetime64) -> list:
+    """Write a question bank and return (id, talent_domain) pairs"""
+    columns = ["id", "question_text", "question_type", "category", "talent_domain", "options", "min_age", "max_age", "difficulty_level", "scoring_weights", "expected_duration", "is_active", "created_at"]
+    categories = list(CATEGORIES)
+    created = timestamps(now, -rng.uniform(30, 720, n_questions) * 86400)
+    rows = []
+    questions = []
+    for offset in range(n_questions):
+        question_id = first_id + offset
+        category = categories[offset % len(categories)]
+        talent_domain = CATEGORIES[category][1]
+        options = [f"Option {letter}" for letter in "ABCD"]
+        rows.append((
+            question_id, f"Synthetic {category} question {question_id}?", "multiple_choice", category, talent_domain,
+            json.dumps(options), 3, 12, ["easy", "medium", "hard"][offset % 3],
+            json.dumps({option: round(float(weight), 2) for option, weight in zip(options, rng.uniform(0.1, 1.0, 4))}),
+            int(rng.integers(15, 60)), True, created[offset]
+        ))
+        questions.append((question_id, talent_domain))
+    writer.write(Question.__table__, columns, rows)
+    return questions
+
+def generate_chunk(writer: BulkWriter, args, chunk: int, ids: dict, games: list, questions: list, pools: dict, password_hash: str, now: np.datetime64) -> None:
+    """Generate one chunk of parents with their children, sessions, responses and assessments"""
+    rng = np.random.default_rng([args.seed, chunk])
+    n_parents = min(args.chunk_parents, args.parents - chunk * args.chunk_parents)
+    
+    # Parents
+    parent_ids = np.arange(ids["users"], ids["users"] + n_parents)
+    ids["users"] += n_parents
+    parent_created = timestamps(now, -rng.uniform(30, 730, n_parents) * 86400)
+    first_names = rng.integers(len(FIRST_NAMES), size=n_parents).tolist()
+    last_names = rng.integers(len(LAST_NAMES), size=n_parents).tolist()
+    writer.write(User.__table__, ["id", "email", "hashed_password", "full_name", "is_active", "is_parent", "is_admin", "created_at"], [
+        (parent_id, f"parent{parent_id}@example.com", password_hash, f"{FIRST_NAMES[first]} {LAST_NAMES[last]}", True, True, False, created)
+        for parent_id, first, last, created in zip(parent_ids.tolist(), first_names, last_names, parent_created)
+    ])
+    
+    # Children, 1 + Poisson(children_per_parent - 1) per parent
+    children_per_parent = 1 + rng.poisson(max(args.children_per_parent - 1, 0), n_parents)
+    child_parent = np.repeat(parent_ids, children_per_parent)
+    n_children = len(child_parent)
+    child_ids = np.arange(ids["children"], ids["children"] + n_children)
+    ids["children"] += n_children
+    ages = rng.integers(3, 13, n_children)
+    birth_offsets = -(ages * 365.25 + rng.uniform(0, 365, n_children)) * 86400
+    favourite = rng.integers(len(CATEGORIES), size=n_children)
+    
+    # Sessions, biased towards each child's favourite category
+    sessions_per_child = rng.poisson(args.sessions_per_child, n_children)
+    session_child = np.repeat(np.arange(n_children), sessions_per_child)
+    n_sessions = len(session_child)
+    game_ids = np.array([game_id for game_id, _ in games])
+    game_category = np.array([list(CATEGORIES).index(category) for _, category in games])
+    session_games = game_ids[rng.integers(len(game_ids), size=n_sessions)]
+    prefer = rng.random(n_sessions) < 0.6
+    for code in range(len(CATEGORIES)):
+        category_games = game_ids[game_category == code]
+        mask = prefer & (favourite[session_child] == code)
+        if len(category_games) and mask.any():
+            session_games[mask] = category_games[rng.integers(len(category_games), size=int(mask.sum()))]
+    
+    status_draw = rng.random(n_sessions)
+    completed = status_draw < 0.8
+    status = np.where(completed, "completed", np.where(status_draw < 0.93, "abandoned", "active"))
+    duration = np.round(rng.gamma(2.5, 120.0, n_sessions), 1)
+    started_offsets = -rng.uniform(0, 365, n_sessions) * 86400
+    started = timestamps(now, started_offsets)
+    completed_at = timestamps(now, started_offsets + duration)
+    completion = np.where(completed, 100.0, np.round(rng.uniform(5, 95, n_sessions), 1))
+    scores = rng.beta(5, 2, n_sessions) * np.where(favourite[session_child] == game_category[np.searchsorted(game_ids, session_games)], 1.0, 0.8)
+    accuracy = rng.beta(6, 2, n_sessions)
+    telemetry = {name: pool[rng.integers(len(pool), size=n_sessions)].tolist() for name, pool in pools.items()}
+    has_telemetry = (rng.random(n_sessions) < 0.9).tolist()
+    
+    session_ids = np.arange(ids["sessions"], ids["sessions"] + n_sessions)
+    ids["sessions"] += n_sessions
+    session_columns = ["id", "child_id", "game_id", "parent_id", "session_id", "difficulty_level", "started_at", "completed_at", "duration_seconds", "status", "completion_percentage", "interactions", "emotional_reactions", "attention_metrics", "score", "accuracy", "speed_metrics", "device_info", "created_at"]
+    difficulty = rng.integers(3, size=n_sessions).tolist()
+    session_rows = []
+    for i, (session_id, child_row, game_id, done, state) in enumerate(zip(
+        session_ids.tolist(), session_child.tolist(), session_games.tolist(), completed.tolist(), status.tolist()
+    )):
+        telemetry_ok = has_telemetry[i]
+        session_rows.append((
+            session_id, int(child_ids[child_row]), game_id, int(child_parent[child_row]),
+            str(uuid.UUID(int=(args.seed << 64) | session_id)), DIFFICULTIES[difficulty[i]],
+            started[i], completed_at[i] if done else None, float(duration[i]) if done else None, state, float(completion[i]),
+            telemetry["interactions"][i] if telemetry_ok else None,
+            telemetry["emotional_reactions"][i] if telemetry_ok else None,
+            telemetry["attention_metrics"][i] if telemetry_ok else None,
+            round(float(scores[i]), 4) if done else None, round(float(accuracy[i]), 4) if done else None,
+            telemetry["speed_metrics"][i] if telemetry_ok else None, telemetry["device_info"][i], started[i]
+        ))
+    
+    # Child aggregates consistent with the generated sessions
+    play_minutes = np.bincount(session_child, weights=np.where(completed, duration, 0.0), minlength=n_children) / 60
+    sessions_completed = np.bincount(session_child, weights=completed, minlength=n_children).astype(int)
+    last_activity = np.full(n_children, -400 * 86400.0)
+    np.maximum.at(last_activity, session_child, started_offsets)
+    last_activity_text = timestamps(now, last_activity)
+    birth_dates = timestamps(now, birth_offsets)
+    created_children = timestamps(now, -rng.uniform(1, 400, n_children) * 86400)
+    interest_picks = rng.integers(len(INTERESTS), size=(n_children, 3)).tolist()
+    color_picks = rng.integers(len(COLORS), size=(n_children, 2)).tolist()
+    names = rng.integers(len(FIRST_NAMES), size=n_children).tolist()
+    styles = rng.integers(len(LEARNING_STYLES), size=n_children).tolist()
+    genders = rng.integers(2, size=n_children).tolist()
+    categories = list(CATEGORIES)
+    writer.write(Child.__table__, ["id", "user_id", "parent_id", "first_name", "last_name", "date_of_birth", "age", "gender", "initial_interests", "favorite_colors", "favorite_activities", "learning_style", "current_level", "total_play_time", "sessions_completed", "parental_consent_given", "consent_date", "created_at", "last_activity"], [
+        (
+            int(child_ids[row]), int(child_parent[row]), int(child_parent[row]), FIRST_NAMES[names[row]], LAST_NAMES[row % len(LAST_NAMES)],
+            birth_dates[row], int(ages[row]), "female" if genders[row] else "male",
+            json.dumps(sorted({INTERESTS[i] for i in interest_picks[row]})), json.dumps(sorted({COLORS[i] for i in color_picks[row]})),
+            json.dumps([categories[favourite[row]]]), LEARNING_STYLES[styles[row]], DIFFICULTIES[min(sessions_completed[row] // 25, 2)],
+            round(float(play_minutes[row]), 2), int(sessions_completed[row]), True, created_children[row], created_children[row],
+            last_activity_text[row] if sessions_per_child[row] else None
+        )
+        for row in range(n_children)
+    ])
+    writer.write(GameSession.__table__, session_columns, session_rows)
+    
+    # Question responses
+    responses_per_child = rng.poisson(args.responses_per_child, n_children)
+    response_child = np.repeat(np.arange(n_children), responses_per_child)
+    n_responses = len(response_child)
+    question_ids = np.array([question_id for question_id, _ in questions])
+    question_picks = rng.integers(len(questions), size=n_responses)
+    response_times = rng.gamma(2.0, 6.0, n_responses)
+    confidence = rng.uniform(1, 10, n_responses)
+    response_scores = rng.beta(4, 3, n_responses)
+    present = rng.random((3, n_responses)) < np.array([[0.95], [0.7], [0.9]])
+    answers = rng.integers(4, size=n_responses).tolist()
+    response_created = timestamps(now, -rng.uniform(0, 365, n_responses) * 86400)
+    response_ids = np.arange(ids["responses"], ids["responses"] + n_responses)
+    ids["responses"] += n_responses
+    response_time_values = optional(response_times, present[0], 2)
+    confidence_values = optional(confidence, present[1], 1)
+    score_values = optional(response_scores, present[2])
+    writer.write(QuestionResponse.__table__, ["id", "child_id", "question_id", "answer", "response_time", "confidence_level", "score", "talent_indicators", "created_at"], [
+        (
+            response_id, int(child_ids[child_row]), int(question_ids[pick]), f"Option {'ABCD'[answers[i]]}",
+            response_time_values[i], confidence_values[i], score_values[i],
+            json.dumps({"domain": questions[pick][1]}), response_created[i]
+        )
+        for i, (response_id, child_row, pick) in enumerate(zip(response_ids.tolist(), response_child.tolist(), question_picks.tolist()))
+    ])
+    
+    # Talent assessments
+    assessments_per_child = rng.poisson(args.assessments_per_child, n_children)
+    assessment_child = np.repeat(np.arange(n_children), assessments_per_child)
+    n_assessments = len(assessment_child)
+    talent_names = list(TALENT_DOMAINS)
+    talent_scores = np.round(rng.beta(2, 3, (n_assessments, len(talent_names))), 3)
+    ranking = np.argsort(-talent_scores, axis=1)
+    assessment_dates = timestamps(now, -rng.uniform(0, 365, n_assessments) * 86400)
+    assessment_ids = np.arange(ids["assessments"], ids["assessments"] + n_assessments)
+    ids["assessments"] += n_assessments
+    writer.write(TalentAssessment.__table__, ["id", "child_id", "talent_domains", "primary_talent", "secondary_talents", "confidence_score", "assessment_date"], [
+        (
+            assessment_id, int(child_ids[child_row]),
+            json.dumps(dict(zip(talent_names, talent_scores[i].tolist()))),
+            talent_names[ranking[i, 0]], json.dumps([talent_names[ranking[i, 1]], talent_names[ranking[i, 2]]]),
+            round(float(talent_scores[i].mean() + 0.3), 3), assessment_dates[i]
+        )
+        for i, (assessment_id, child_row) in enumerate(zip(assessment_ids.tolist(), assessment_child.tolist()))
+    ])
+    
+    writer.commit()
+
+def main():
+    """Generate the dataset and report write throughput per table"""
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic dataset at scale")
+    parser.add_argument("--parents", type=int, default=1000, help="Parent accounts to create")
+    parser.add_argument("--children-per-parent", type=float, default=1.6, help="Mean children per parent (at least one each)")
+    parser.add_argument("--sessions-per-child", type=float, default=40, help="Mean game sessions per child")
+    parser.add_argument("--responses-per-child", type=float, default=15, help="Mean question responses per child")
+    parser.add_argument("--assessments-per-child", type=float, default=1.5, help="Mean talent assessments per child")
+    parser.add_argument("--games", type=int, default=200, help="Games to add to the catalog")
+    parser.add_argument("--questions", type=int, default=400, help="Questions to add when the question bank is empty")
+    parser.add_argument("--chunk-parents", type=int, default=2000, help="Parents generated and committed per chunk")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--until", default=datetime.now().strftime("%Y-%m-%d"), help="Date the generated activity ends at (fix it for reproducible timestamps)")
+    args = parser.parse_args()
+    
+    upgrade_database()
+    # Sessions span the year before --until; give each month its partition (PostgreSQL)
+    ensure_partitions(since=(datetime.strptime(args.until, "%Y-%m-%d") - timedelta(days=366)).date())
+    now = np.datetime64(args.until, "us")
+    rng = np.random.default_rng([args.seed, 1 << 30])
+    
+    db = SessionLocal()
+    try:
+        ids = {
+            "users": next_id(db, User),
+            "children": next_id(db, Child),
+            "sessions": next_id(db, GameSession),
+            "responses": next_id(db, QuestionResponse),
+            "assessments": next_id(db, TalentAssessment)
+        }
+        first_game = next_id(db, Game)
+        existing_questions = [(question_id, domain) for question_id, domain in db.query(Question.id, Question.talent_domain).all()]
+        first_question = next_id(db, Question)
+    finally:
+        db.close()
+    
+    writer = BulkWriter(engine)
+    start = time.perf_counter()
+    try:
+        print(f"Generating data on {writer.dialect} (seed {args.seed})...")
+        games = generate_games(writer, rng, first_game, args.games, now)
+        questions = existing_questions or generate_questions(writer, rng, first_question, args.questions, now)
+        writer.commit()
+        
+        pools = telemetry_pools(rng)
+        password_hash = get_password_hash("password123")
+        n_chunks = (args.parents + args.chunk_parents - 1) // args.chunk_parents
+        for chunk in range(n_chunks):
+            generate_chunk(writer, args, chunk, ids, games, questions, pools, password_hash, now)
+            elapsed = time.perf_counter() - start
+            print(f"   chunk {chunk + 1}/{n_chunks}: {sum(writer.rows.values()):,} rows in {elapsed:.1f}s")
+        
+        writer.reset_sequences([User.__table__, Child.__table__, Game.__table__, Question.__table__, GameSession.__table__, QuestionResponse.__table__, TalentAssessment.__table__])
+        elapsed = time.perf_counter() - start
+        
+        print(f"✅ Generated {sum(writer.rows.values()):,} rows in {elapsed:.1f}s ({sum(writer.rows.values()) / elapsed:,.0f} rows/s overall)")
+        for table, rows in writer.rows.items():
+            seconds = writer.seconds[table]
+            print(f"   {table:<20} {rows:>12,} rows  {rows / seconds if seconds else 0:>12,.0f} rows/s written")
+        print("⚠️  Derived tables are not filled; run rebuild_feature_store.py, run_passion_analysis.py and rebuild_cohort_stats.py next")
+    
+    except Exception as e:
+        print(f"❌ Error generating data: {e}")
+        sys.exit(1)
+    finally:
+        writer.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -15,12 +15,17 @@ backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
 from app.core.config import settings
-from app.core.database import Base, engine, SessionLocal
+from app.core.database import engine, SessionLocal
+from app.core.migrations import upgrade_database, head_revision
 from app.models.user import User
 from app.models.child import Child
 from app.models.game import Game
 from app.models.session import GameSession
 from app.models.passion import PassionDomain, PassionInsight
+from app.models.child_features import ChildFeatures
+from app.models.recommendation import ChildRecommendations
+from app.models.cohort_stats import CohortScoreBin
+from app.models.analysis_job import AnalysisJob
 from app.core.auth import get_password_hash
 
 def wait_for_database(max_retries=30, delay=2):
@@ -42,12 +47,14 @@ def wait_for_database(max_retries=30, delay=2):
     return False
 
 def create_tables():
-    """Create all database tables"""
-    print("Creating database tables...")
+    """Create or migrate the database tables"""
+    print("Migrating database schema...")
     
     try:
-        Base.metadata.create_all(bind=engine)
-        print("✅ All tables created successfully!")
+        if upgrade_database():
+            print(f"✅ Schema migrated to revision {head_revision()}")
+        else:
+            print("✅ Schema is already up to date")
         return True
     except Exception as e:
         print(f"❌ Error creating tables: {e}")
@@ -6,10 +6,14 @@ import uvicorn
 import structlog
 
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.migrations import ensure_schema
+from app.core.partitions import ensure_partitions
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.read_replica import track_writes
 from app.api.v1.api import api_router
 from app.core.auth import get_current_user
 from app.models.user import User
+from app.ml.jobs import shutdown_job_manager
 
 # Configure structured logging
 structlog.configure(
@@ -38,14 +42,20 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Passion Detection API")
     
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created")
+    # Bring the schema up to date (a single version read when it already is)
+    if ensure_schema(migrate=settings.DB_MIGRATE_ON_STARTUP):
+        logger.info("Database migrations applied")
+    
+    # Keep monthly game_sessions partitions ready ahead of time (PostgreSQL only)
+    created_partitions = ensure_partitions()
+    if created_partitions:
+        logger.info("Session partitions created", partitions=created_partitions)
     
     yield
     
     # Shutdown
     logger.info("Shutting down Passion Detection API")
+    shutdown_job_manager()
 
 # Create FastAPI app
 app = FastAPI(
@@ -64,8 +74,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Keep a user's reads on the primary right after their writes
+app.middleware("http")(track_writes)
+
 # Security
 security = HTTPBearer()
 
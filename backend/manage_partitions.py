@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Maintain the monthly game_sessions partitions (PostgreSQL)
+Creates partitions ahead of time (run it from cron, e.g. monthly; the API
+also does this at startup), splits old rows out of the default partition with
+--since, lists the partitions and shows which of them a date-window query
+scans with --explain-days.
+"""
+
+import sys
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select, text
+
+from app.core.database import engine
+from app.core.partitions import PARTITIONED_TABLES, ensure_partitions, existing_partitions, is_partitioned
+from app.models.session import GameSession
+
+def list_partitions(connection) -> None:
+    """Print each partition with its estimated row count"""
+    for table in PARTITIONED_TABLES:
+        print(f"{table}:")
+        for name in existing_partitions(connection, table):
+            rows = connection.execute(text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"), {"name": name}).scalar()
+            print(f"   {name:<32} ~{max(rows, 0)} rows")
+
+def explain_window(connection, days: int) -> None:
+    """Print the partitions the progress analytics query reads for a days window"""
+    end_date = datetime.now()
+    query = select(GameSession).where(
+        GameSession.child_id == 1,
+        GameSession.created_at >= end_date - timedelta(days=days),
+        GameSession.created_at <= end_date
+    )
+    compiled = query.compile(connection, compile_kwargs={"literal_binds": True})
+    plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()[0]["Plan"]
+    
+    scanned = set()
+    nodes = [plan]
+    while nodes:
+        node = nodes.pop()
+        if "Relation Name" in node:
+            scanned.add(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    total = len(existing_partitions(connection, "game_sessions"))
+    print(f"A {days} day window scans {len(scanned)} of {total} partitions: {', '.join(sorted(scanned))}")
+
+def main():
+    """Create missing partitions and optionally report on them"""
+    parser = argparse.ArgumentParser(description="Maintain the monthly game_sessions partitions")
+    parser.add_argument("--months-ahead", type=int, default=None, help="Months of partitions to keep ready (default: SESSION_PARTITION_MONTHS_AHEAD)")
+    parser.add_argument("--since", type=lambda value: datetime.strptime(value, "%Y-%m").date(), default=None, help="Also create partitions back to this month (YYYY-MM), moving their rows out of the default partition")
+    parser.add_argument("--list", action="store_true", help="List the partitions and their estimated sizes")
+    parser.add_argument("--explain-days", type=int, default=None, help="Show which partitions a date-window query of this many days reads")
+    args = parser.parse_args()
+    
+    if engine.dialect.name != "postgresql":
+        print(f"⚠️  {engine.dialect.name} databases keep game_sessions as a plain table; nothing to do")
+        return
+    
+    try:
+        with engine.connect() as connection:
+            if not is_partitioned(connection, "game_sessions"):
+                print("❌ game_sessions is not partitioned; run `alembic upgrade head` first")
+                sys.exit(1)
+        
+        created = ensure_partitions(months_ahead=args.months_ahead, since=args.since)
+        print(f"✅ Created {len(created)} partition(s){': ' + ', '.join(created) if created else ''}")
+        
+        with engine.connect() as connection:
+            if args.list:
+                list_partitions(connection)
+            if args.explain_days is not None:
+                explain_window(connection, args.explain_days)
+    
+    except Exception as e:
+        print(f"❌ Error maintaining partitions: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Alembic environment
+Runs migrations against settings.DATABASE_URL with the application models as
+the target metadata, so autogenerate compares against the declared schema.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.core.config import settings
+from app.core.database import Base, engine
+from app.core.partitions import PARTITIONED_TABLES, is_partition
+from app.models.user import User
+from app.models.child import Child
+from app.models.game import Game
+from app.models.session import GameSession
+from app.models.passion import PassionDomain, PassionInsight
+from app.models.question import Question, QuestionResponse, TalentAssessment
+from app.models.child_features import ChildFeatures
+from app.models.recommendation import ChildRecommendations
+from app.models.cohort_stats import CohortScoreBin
+from app.models.analysis_job import AnalysisJob
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Keep partitions and the keys partitioning replaces out of autogenerate"""
+    if type_ == "table":
+        return not (reflected and is_partition(name))
+    if context.get_context().dialect.name != "postgresql":
+        return True
+    
+    # Unique keys of a partitioned table include the partition key, and no
+    # foreign key can reference it
+    if type_ == "unique_constraint":
+        return object.table.name not in PARTITIONED_TABLES
+    if type_ == "foreign_key_constraint":
+        return object.referred_table.name not in PARTITIONED_TABLES
+    return True
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting (alembic upgrade --sql)"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=settings.DATABASE_URL.startswith("sqlite")
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_on(connection) -> None:
+    """Run the migrations on an open connection"""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    """Apply migrations over the caller's connection (app.core.migrations) or a new one"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_on(connection)
+        return
+    
+    with engine.connect() as connection:
+        run_on(connection)
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
\ No newline at end of file
@@ -0,0 +1,242 @@
+"""Initial schema
+
+Tables as created by Base.metadata.create_all before the schema was
+versioned. Databases created that way are stamped at this revision instead of
+running it.
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-16 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0000'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('children',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('parent_id', sa.Integer(), nullable=False),
+    sa.Column('first_name', sa.String(), nullable=False),
+    sa.Column('last_name', sa.String(), nullable=True),
+    sa.Column('date_of_birth', sa.DateTime(), nullable=False),
+    sa.Column('age', sa.Integer(), nullable=False),
+    sa.Column('gender', sa.String(), nullable=True),
+    sa.Column('initial_interests', sa.JSON(), nullable=True),
+    sa.Column('favorite_colors', sa.JSON(), nullable=True),
+    sa.Column('favorite_activities', sa.JSON(), nullable=True),
+    sa.Column('learning_style', sa.String(), nullable=True),
+    sa.Column('current_level', sa.String(), nullable=True),
+    sa.Column('total_play_time', sa.Float(), nullable=True),
+    sa.Column('sessions_completed', sa.Integer(), nullable=True),
+    sa.Column('parental_consent_given', sa.Boolean(), nullable=True),
+    sa.Column('consent_date', sa.DateTime(), nullable=True),
+    sa.Column('data_sharing_preferences', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_activity', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_children_id'), 'children', ['id'], unique=False)
+    op.create_table('game_sessions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('child_id', sa.Integer(), nullable=False),
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('parent_id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.String(), nullable=False),
+    sa.Column('difficulty_level', sa.String(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('duration_seconds', sa.Float(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('completion_percentage', sa.Float(), nullable=True),
+    sa.Column('interactions', sa.JSON(), nullable=True),
+    sa.Column('responses', sa.JSON(), nullable=True),
+    sa.Column('emotional_reactions', sa.JSON(), nullable=True),
+    sa.Column('attention_metrics', sa.JSON(), nullable=True),
+    sa.Column('score', sa.Float(), nullable=True),
+    sa.Column('accuracy', sa.Float(), nullable=True),
+    sa.Column('speed_metrics', sa.JSON(), nullable=True),
+    sa.Column('device_info', sa.JSON(), nullable=True),
+    sa.Column('network_conditions', sa.JSON(), nullable=True),
+    sa.Column('errors_encountered', sa.JSON(), nullable=True),
+    sa.Column('technical_issues', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('session_id')
+    )
+    op.create_index(op.f('ix_game_sessions_id'), 'game_sessions', ['id'], unique=False)
+    op.create_table('games',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('category', sa.String(), nullable=False),
+    sa.Column('config', sa.JSON(), nullable=False),
+    sa.Column('difficulty_levels', sa.JSON(), nullable=True),
+    sa.Column('age_range', sa.JSON(), nullable=False),
+    sa.Column('estimated_duration', sa.Integer(), nullable=True),
+    sa.Column('max_players', sa.Integer(), nullable=True),
+    sa.Column('requires_audio', sa.Boolean(), nullable=True),
+    sa.Column('requires_video', sa.Boolean(), nullable=True),
+    sa.Column('requires_microphone', sa.Boolean(), nullable=True),
+    sa.Column('passion_domains', sa.JSON(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_beta', sa.Boolean(), nullable=True),
+    sa.Column('version', sa.String(), nullable=True),
+    sa.Column('total_plays', sa.Integer(), nullable=True),
+    sa.Column('average_rating', sa.Float(), nullable=True),
+    sa.Column('average_completion_time', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_games_id'), 'games', ['id'], unique=False)
+    op.create_table('passion_domains',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('child_id', sa.Integer(), nullable=False),
+    sa.Column('domain', sa.String(), nullable=False),
+    sa.Column('confidence_score', sa.Float(), nullable=False),
+    sa.Column('strength_level', sa.String(), nullable=False),
+    sa.Column('detection_method', sa.String(), nullable=False),
+    sa.Column('model_version', sa.String(), nullable=True),
+    sa.Column('data_points_used', sa.Integer(), nullable=True),
+    sa.Column('supporting_evidence', sa.JSON(), nullable=True),
+    sa.Column('games_played', sa.JSON(), nullable=True),
+    sa.Column('behavioral_patterns', sa.JSON(), nullable=True),
+    sa.Column('first_detected', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('last_updated', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('trend', sa.String(), nullable=True),
+    sa.Column('recommended_activities', sa.JSON(), nullable=True),
+    sa.Column('difficulty_progression', sa.JSON(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_passion_domains_id'), 'passion_domains', ['id'], unique=False)
+    op.create_table('passion_insights',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('child_id', sa.Integer(), nullable=False),
+    sa.Column('insight_type', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('data', sa.JSON(), nullable=True),
+    sa.Column('related_domains', sa.JSON(), nullable=True),
+    sa.Column('importance_score', sa.Float(), nullable=True),
+    sa.Column('is_highlighted', sa.Boolean(), nullable=True),
+    sa.Column('notify_parent', sa.Boolean(), nullable=True),
+    sa.Column('parent_notified', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_passion_insights_id'), 'passion_insights', ['id'], unique=False)
+    op.create_table('questions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('question_text', sa.Text(), nullable=False),
+    sa.Column('question_type', sa.String(), nullable=False),
+    sa.Column('category', sa.String(), nullable=False),
+    sa.Column('talent_domain', sa.String(), nullable=False),
+    sa.Column('options', sa.JSON(), nullable=True),
+    sa.Column('min_age', sa.Integer(), nullable=True),
+    sa.Column('max_age', sa.Integer(), nullable=True),
+    sa.Column('difficulty_level', sa.String(), nullable=True),
+    sa.Column('scoring_weights', sa.JSON(), nullable=True),
+    sa.Column('expected_duration', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_questions_id'), 'questions', ['id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('full_name', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_parent', sa.Boolean(), nullable=True),
+    sa.Column('is_admin', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('phone_number', sa.String(), nullable=True),
+    sa.Column('address', sa.Text(), nullable=True),
+    sa.Column('date_of_birth', sa.DateTime(), nullable=True),
+    sa.Column('age', sa.Integer(), nullable=True),
+    sa.Column('gender', sa.String(), nullable=True),
+    sa.Column('parent_id', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_table('question_responses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('child_id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=True),
+    sa.Column('answer', sa.Text(), nullable=False),
+    sa.Column('response_time', sa.Float(), nullable=True),
+    sa.Column('confidence_level', sa.Float(), nullable=True),
+    sa.Column('score', sa.Float(), nullable=True),
+    sa.Column('talent_indicators', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['child_id'], ['children.id'], ),
+    sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ),
+    sa.ForeignKeyConstraint(['session_id'], ['game_sessions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_question_responses_id'), 'question_responses', ['id'], unique=False)
+    op.create_table('talent_assessments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('child_id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=True),
+    sa.Column('talent_domains', sa.JSON(), nullable=False),
+    sa.Column('primary_talent', sa.String(), nullable=True),
+    sa.Column('secondary_talents', sa.JSON(), nullable=True),
+    sa.Column('confidence_score', sa.Float(), nullable=True),
+    sa.Column('behavioral_patterns', sa.JSON(), nullable=True),
+    sa.Column('response_patterns', sa.JSON(), nullable=True),
+    sa.Column('interest_indicators', sa.JSON(), nullable=True),
+    sa.Column('recommended_activities', sa.JSON(), nullable=True),
+    sa.Column('development_path', sa.JSON(), nullable=True),
+    sa.Column('assessment_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['child_id'], ['children.id'], ),
+    sa.ForeignKeyConstraint(['session_id'], ['game_sessions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_talent_assessments_id'), 'talent_assessments', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_talent_assessments_id'), table_name='talent_assessments')
+    op.drop_table('talent_assessments')
+    op.drop_index(op.f('ix_question_responses_id'), table_name='question_responses')
+    op.drop_table('question_responses')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_questions_id'), table_name='questions')
+    op.drop_table('questions')
+    op.drop_index(op.f('ix_passion_insights_id'), table_name='passion_insights')
+    op.drop_table('passion_insights')
+    op.drop_index(op.f('ix_passion_domains_id'), table_name='passion_domains')
+    op.drop_table('passion_domains')
+    op.drop_index(op.f('ix_games_id'), table_name='games')
+    op.drop_table('games')
+    op.drop_index(op.f('ix_game_sessions_id'), table_name='game_sessions')
+    op.drop_table('game_sessions')
+    op.drop_index(op.f('ix_children_id'), table_name='children')
+    op.drop_table('children')
\ No newline at end of file
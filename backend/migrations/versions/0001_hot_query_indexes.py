@@ -0,0 +1,50 @@
+"""Composite and partial indexes for the hot query predicates
+
+Per-child lookups on sessions, responses, passion domains and insights,
+assessments and a parent's children were sequential scans. Indexes are
+created with IF NOT EXISTS because databases created by create_all already
+have them, and CONCURRENTLY on PostgreSQL so writes to the hot tables are
+not blocked while they build.
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-16 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = '0000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial index predicate per dialect)
+INDEXES = [
+    ("ix_children_parent_id", "children", ["parent_id"], None),
+    ("ix_game_sessions_child_created", "game_sessions", ["child_id", "created_at"], None),
+    ("ix_game_sessions_child_status_game", "game_sessions", ["child_id", "status", "game_id"], None),
+    ("ix_question_responses_child_created", "question_responses", ["child_id", "created_at"], None),
+    ("ix_talent_assessments_child_date", "talent_assessments", ["child_id", "assessment_date"], None),
+    ("ix_passion_domains_child_active", "passion_domains", ["child_id", "domain"], {"postgresql": "is_active = true", "sqlite": "is_active = 1"}),
+    ("ix_passion_insights_child_created", "passion_insights", ["child_id", "created_at"], None),
+]
+
+
+def upgrade() -> None:
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            options = {f"{dialect}_where": sa.text(predicate) for dialect, predicate in (where or {}).items()}
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=concurrently, **options)
+
+
+def downgrade() -> None:
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=concurrently)
@@ -0,0 +1,104 @@
+"""Partition game_sessions by month on created_at (PostgreSQL)
+
+game_sessions becomes a range-partitioned table with one partition per month
+and a default partition, so date-window analytics only touch the months they
+ask for. Partitions up to SESSION_PARTITION_MONTHS_AHEAD months ahead are
+created here and kept ahead by app.core.partitions.ensure_partitions.
+
+A partitioned table's unique constraints must contain the partition key, so
+the primary key becomes (id, created_at), session_id is unique per
+created_at, and the foreign keys from question_responses and
+talent_assessments to game_sessions.id are dropped. Other databases keep the
+plain table.
+
+The existing rows are copied into the new table, which locks game_sessions
+for the duration of the upgrade.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 12:00:00
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.core.partitions import add_months, month_partition_statements, month_start, months_between
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Foreign keys that cannot reference a partitioned game_sessions.id
+SESSION_FOREIGN_KEYS = [
+    ("question_responses_session_id_fkey", "question_responses"),
+    ("talent_assessments_session_id_fkey", "talent_assessments"),
+]
+
+SESSION_INDEXES = [
+    ("ix_game_sessions_id", ["id"]),
+    ("ix_game_sessions_child_created", ["child_id", "created_at"]),
+    ("ix_game_sessions_child_status_game", ["child_id", "status", "game_id"]),
+]
+
+
+def replace_table(partitioned: bool) -> None:
+    """Copy game_sessions into a new (partitioned or plain) table of the same shape"""
+    op.execute("ALTER TABLE game_sessions RENAME TO game_sessions_old")
+    for name, table in SESSION_FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}")
+    
+    if partitioned:
+        op.execute("UPDATE game_sessions_old SET created_at = COALESCE(started_at, now()) WHERE created_at IS NULL")
+        op.execute("CREATE TABLE game_sessions (LIKE game_sessions_old INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+        op.execute("ALTER TABLE game_sessions ALTER COLUMN created_at SET NOT NULL")
+        op.execute("CREATE TABLE game_sessions_default PARTITION OF game_sessions DEFAULT")
+        
+        # Offline (--sql) runs cannot see the data; older rows then stay in the
+        # default partition until manage_partitions.py --since splits them out
+        this_month = month_start(date.today())
+        first_month = this_month
+        if not context.is_offline_mode():
+            first = op.get_bind().execute(sa.text("SELECT min(created_at) FROM game_sessions_old")).scalar()
+            first_month = min(month_start(first), this_month) if first else this_month
+        for month in months_between(first_month, add_months(this_month, settings.SESSION_PARTITION_MONTHS_AHEAD)):
+            for statement in month_partition_statements("game_sessions", month):
+                op.execute(statement)
+    else:
+        op.execute("CREATE TABLE game_sessions (LIKE game_sessions_old INCLUDING DEFAULTS)")
+        op.execute("ALTER TABLE game_sessions ALTER COLUMN created_at DROP NOT NULL")
+    
+    # Indexes are built after the copy, which is faster than maintaining them row by row
+    op.execute("INSERT INTO game_sessions SELECT * FROM game_sessions_old")
+    op.execute("ALTER SEQUENCE game_sessions_id_seq OWNED BY game_sessions.id")
+    op.execute("DROP TABLE game_sessions_old")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    replace_table(partitioned=True)
+    op.execute("ALTER TABLE game_sessions ADD CONSTRAINT game_sessions_pkey PRIMARY KEY (id, created_at)")
+    op.execute("ALTER TABLE game_sessions ADD CONSTRAINT game_sessions_session_id_key UNIQUE (session_id, created_at)")
+    for name, columns in SESSION_INDEXES:
+        op.create_index(name, "game_sessions", columns)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    replace_table(partitioned=False)
+    op.execute("ALTER TABLE game_sessions ADD CONSTRAINT game_sessions_pkey PRIMARY KEY (id)")
+    op.execute("ALTER TABLE game_sessions ADD CONSTRAINT game_sessions_session_id_key UNIQUE (session_id)")
+    for name, columns in SESSION_INDEXES:
+        op.create_index(name, "game_sessions", columns)
+    for name, table in SESSION_FOREIGN_KEYS:
+        op.create_foreign_key(name, table, "game_sessions", ["session_id"], ["id"])
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""Indexed age bounds and domain membership for the game catalog filters
+
+The catalog filters read age_range['min'] / ['max'] and searched the
+passion_domains JSON list, which no index can serve. games gets indexed
+age_min / age_max columns and game_passion_domains holds one row per
+(game, domain); both are backfilled from the JSON here and kept in sync by
+the Game model from then on.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Backfill statements per dialect: age bounds, then domain rows
+BACKFILL = {
+    "postgresql": [
+        "UPDATE games SET age_min = (age_range ->> 'min')::integer, age_max = (age_range ->> 'max')::integer",
+        "INSERT INTO game_passion_domains (game_id, domain) "
+        "SELECT DISTINCT games.id, domains.value FROM games, json_array_elements_text(games.passion_domains) AS domains(value)",
+    ],
+    "sqlite": [
+        "UPDATE games SET age_min = json_extract(age_range, '$.min'), age_max = json_extract(age_range, '$.max')",
+        "INSERT INTO game_passion_domains (game_id, domain) "
+        "SELECT DISTINCT games.id, domains.value FROM games, json_each(games.passion_domains) AS domains",
+    ],
+}
+
+
+def upgrade() -> None:
+    op.add_column('games', sa.Column('age_min', sa.Integer(), nullable=True))
+    op.add_column('games', sa.Column('age_max', sa.Integer(), nullable=True))
+    op.create_table('game_passion_domains',
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('domain', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['game_id'], ['games.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('game_id', 'domain')
+    )
+    
+    for statement in BACKFILL.get(op.get_context().dialect.name, []):
+        op.execute(statement)
+    
+    # Indexes are built after the backfill
+    op.create_index(op.f('ix_games_age_min'), 'games', ['age_min'], unique=False)
+    op.create_index(op.f('ix_games_age_max'), 'games', ['age_max'], unique=False)
+    op.create_index('ix_game_passion_domains_domain_game', 'game_passion_domains', ['domain', 'game_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_game_passion_domains_domain_game', table_name='game_passion_domains')
+    op.drop_table('game_passion_domains')
+    with op.batch_alter_table('games') as batch_op:
+        batch_op.drop_index(op.f('ix_games_age_max'))
+        batch_op.drop_index(op.f('ix_games_age_min'))
+        batch_op.drop_column('age_max')
+        batch_op.drop_column('age_min')
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""Feature store, stored recommendations and cohort score histograms
+
+Tables for the incremental child features, the precomputed game rankings
+and the cohort percentile histograms, which are not part of the create_all
+schema that 0000 stands for. Databases that already got them from an earlier
+0000 keep their tables; only the missing ones are created.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def create_child_features() -> None:
+    op.create_table('child_features',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('child_id', sa.Integer(), nullable=False),
+    sa.Column('session_count', sa.Integer(), nullable=True),
+    sa.Column('duration_sum', sa.Float(), nullable=True),
+    sa.Column('duration_sum_sq', sa.Float(), nullable=True),
+    sa.Column('score_count', sa.Integer(), nullable=True),
+    sa.Column('score_sum', sa.Float(), nullable=True),
+    sa.Column('score_sum_sq', sa.Float(), nullable=True),
+    sa.Column('max_score', sa.Float(), nullable=True),
+    sa.Column('accuracy_count', sa.Integer(), nullable=True),
+    sa.Column('accuracy_sum', sa.Float(), nullable=True),
+    sa.Column('accuracy_sum_sq', sa.Float(), nullable=True),
+    sa.Column('response_time_count', sa.Integer(), nullable=True),
+    sa.Column('response_time_sum', sa.Float(), nullable=True),
+    sa.Column('emotional_count', sa.Integer(), nullable=True),
+    sa.Column('emotional_sum', sa.Float(), nullable=True),
+    sa.Column('category_counts', sa.JSON(), nullable=True),
+    sa.Column('game_ids', sa.JSON(), nullable=True),
+    sa.Column('last_session_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_child_features_child_id'), 'child_features', ['child_id'], unique=True)
+    op.create_index(op.f('ix_child_features_id'), 'child_features', ['id'], unique=False)
+
+
+def create_child_recommendations() -> None:
+    op.create_table('child_recommendations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('child_id', sa.Integer(), nullable=False),
+    sa.Column('game_ids', sa.JSON(), nullable=False),
+    sa.Column('scores', sa.JSON(), nullable=False),
+    sa.Column('catalog_version', sa.String(), nullable=False),
+    sa.Column('child_age', sa.Integer(), nullable=True),
+    sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_child_recommendations_child_id'), 'child_recommendations', ['child_id'], unique=True)
+    op.create_index(op.f('ix_child_recommendations_id'), 'child_recommendations', ['id'], unique=False)
+
+
+def create_cohort_score_bins() -> None:
+    op.create_table('cohort_score_bins',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('age', sa.Integer(), nullable=False),
+    sa.Column('domain', sa.String(), nullable=False),
+    sa.Column('bin', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('source', 'age', 'domain', 'bin', name='uq_cohort_score_bin')
+    )
+    op.create_index(op.f('ix_cohort_score_bins_id'), 'cohort_score_bins', ['id'], unique=False)
+
+
+TABLES = {
+    "child_features": create_child_features,
+    "child_recommendations": create_child_recommendations,
+    "cohort_score_bins": create_cohort_score_bins,
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, create in TABLES.items():
+        if not inspector.has_table(table):
+            create()
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cohort_score_bins_id'), table_name='cohort_score_bins')
+    op.drop_table('cohort_score_bins')
+    op.drop_index(op.f('ix_child_recommendations_id'), table_name='child_recommendations')
+    op.drop_index(op.f('ix_child_recommendations_child_id'), table_name='child_recommendations')
+    op.drop_table('child_recommendations')
+    op.drop_index(op.f('ix_child_features_id'), table_name='child_features')
+    op.drop_index(op.f('ix_child_features_child_id'), table_name='child_features')
+    op.drop_table('child_features')
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Analysis job state shared by every API worker
+
+Background analysis jobs were tracked in a per-process dict, so a poll that
+reached another worker (or came after a restart) found no job. Their state
+now lives in analysis_jobs.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('analysis_jobs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('job_key', sa.String(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('child_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('coalesced_requests', sa.Integer(), nullable=False),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_analysis_jobs_key_status', 'analysis_jobs', ['job_key', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_analysis_jobs_key_status', table_name='analysis_jobs')
+    op.drop_table('analysis_jobs')
\ No newline at end of file
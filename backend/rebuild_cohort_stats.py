@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Rebuild the age-cohort score histograms from current data
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import SessionLocal
+from app.ml.cohort_stats import rebuild_cohort_stats
+
+def main():
+    """Recount every child's scores into their current age cohort"""
+    parser = argparse.ArgumentParser(description="Rebuild cohort percentile histograms (run e.g. nightly so birthdays move children between cohorts)")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Rows fetched per round trip"
+    )
+    
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        summary = rebuild_cohort_stats(db, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+        
+        print(f"✅ Rebuilt cohort histograms in {elapsed:.2f}s")
+        print(f"   Passion cells: {summary['passion_cells']}, talent cells: {summary['talent_cells']}")
+    
+    except Exception as e:
+        print(f"❌ Error rebuilding cohort histograms: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
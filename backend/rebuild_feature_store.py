@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Rebuild the per-child feature store from raw game sessions
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import SessionLocal
+from app.core.migrations import ensure_schema
+from app.ml.feature_store import rebuild_feature_store, verify_feature_store
+
+def main():
+    """Rebuild or verify the child_features table"""
+    parser = argparse.ArgumentParser(description="Rebuild the child feature store from game sessions")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Compare stored features with raw sessions without writing"
+    )
+    parser.add_argument(
+        "--child-id",
+        type=int,
+        action="append",
+        help="Only rebuild the given child (can be repeated)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Number of sessions fetched per round trip"
+    )
+    
+    args = parser.parse_args()
+    
+    # The child_features table comes from the migrations; refuse to run on an older schema
+    try:
+        ensure_schema(migrate=False)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        
+        if args.verify:
+            print("Verifying feature store against raw sessions...")
+            mismatched = verify_feature_store(db, batch_size=args.batch_size)
+            elapsed = time.perf_counter() - start
+            
+            if mismatched:
+                print(f"❌ {len(mismatched)} children out of sync ({elapsed:.2f}s)")
+                print(f"   Child ids: {mismatched[:20]}{' ...' if len(mismatched) > 20 else ''}")
+                sys.exit(1)
+            
+            print(f"✅ Feature store matches raw sessions ({elapsed:.2f}s)")
+            return
+        
+        print("Rebuilding feature store...")
+        rows = rebuild_feature_store(db, child_ids=args.child_id, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"✅ Rebuilt {rows} child feature rows in {elapsed:.2f}s")
+    
+    except Exception as e:
+        print(f"❌ Error rebuilding feature store: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Precompute ranked game recommendations for many children
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import SessionLocal
+from app.models.child import Child
+from app.ml.recommender import get_game_catalog, refresh_recommendations
+
+def main():
+    """Rank the active game catalog for children in chunks and store the lists"""
+    parser = argparse.ArgumentParser(description="Refresh stored game recommendations")
+    parser.add_argument(
+        "--child-id",
+        type=int,
+        action="append",
+        help="Only refresh the given child (can be repeated); default is every child"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Children ranked and written per transaction"
+    )
+    
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        child_ids = args.child_id or [
+            child_id for (child_id,) in db.query(Child.id).order_by(Child.id).all()
+        ]
+        catalog = get_game_catalog(db)
+        
+        print(f"Ranking {len(catalog.game_ids)} games for {len(child_ids)} children...")
+        start = time.perf_counter()
+        for offset in range(0, len(child_ids), args.chunk_size):
+            refresh_recommendations(db, child_ids[offset:offset + args.chunk_size], catalog, chunk_size=args.chunk_size)
+            db.commit()
+        elapsed = time.perf_counter() - start
+        
+        print(f"✅ Refreshed recommendations for {len(child_ids)} children in {elapsed:.2f}s")
+        print(f"   Catalog version: {catalog.version}")
+    
+    except Exception as e:
+        print(f"❌ Error refreshing recommendations: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
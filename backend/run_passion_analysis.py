@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Run passion detection for many children and store the results
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import SessionLocal
+from app.models.child import Child
+from app.ml.passion_detector import PassionDetector
+
+def main():
+    """Analyze children in chunks and upsert their passion domains and insights"""
+    parser = argparse.ArgumentParser(description="Bulk passion analysis with persisted results")
+    parser.add_argument(
+        "--child-id",
+        type=int,
+        action="append",
+        help="Only analyze the given child (can be repeated); default is every child"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Children analyzed and written per transaction"
+    )
+    
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        child_ids = args.child_id or [
+            child_id for (child_id,) in db.query(Child.id).order_by(Child.id).all()
+        ]
+        
+        print(f"Analyzing {len(child_ids)} children...")
+        start = time.perf_counter()
+        totals = PassionDetector().analyze_and_save_children(child_ids, db, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        
+        print(f"✅ Analyzed {len(child_ids)} children in {elapsed:.2f}s")
+        print(f"   Domains inserted: {totals.get('domains_inserted', 0)}, updated: {totals.get('domains_updated', 0)}, deactivated: {totals.get('domains_deactivated', 0)}")
+        print(f"   Insights inserted: {totals.get('insights_inserted', 0)}, updated: {totals.get('insights_updated', 0)}")
+    
+    except Exception as e:
+        print(f"❌ Error running passion analysis: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
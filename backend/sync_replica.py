@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Stand-in read replica for local SQLite runs
+Copies the DATABASE_URL file to the READ_REPLICA_URL file with SQLite's
+online backup, once or every --interval seconds, so the replica routing and
+its read-your-writes fallback can be tried without PostgreSQL replication.
+The interval plays the part of replication lag.
+"""
+
+import sys
+import time
+import sqlite3
+import argparse
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.database import is_file_sqlite
+
+def copy_database(primary: str, replica: str) -> None:
+    """Replace the replica's contents with a consistent snapshot of the primary"""
+    source = sqlite3.connect(primary)
+    target = sqlite3.connect(replica)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+def main():
+    """Copy the primary SQLite database to the replica file"""
+    parser = argparse.ArgumentParser(description="Copy the SQLite primary to the local read replica")
+    parser.add_argument("--interval", type=float, default=None, help="Keep copying every this many seconds (default: copy once)")
+    args = parser.parse_args()
+    
+    if not settings.READ_REPLICA_URL:
+        print("❌ READ_REPLICA_URL is not set")
+        sys.exit(1)
+    if not (is_file_sqlite(settings.DATABASE_URL) and is_file_sqlite(settings.READ_REPLICA_URL)):
+        print("❌ Both DATABASE_URL and READ_REPLICA_URL must be SQLite files; use PostgreSQL streaming replication otherwise")
+        sys.exit(1)
+    
+    primary = make_url(settings.DATABASE_URL).database
+    replica = make_url(settings.READ_REPLICA_URL).database
+    try:
+        while True:
+            copy_database(primary, replica)
+            print(f"✅ Copied {primary} to {replica}")
+            if args.interval is None:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
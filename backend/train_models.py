@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Train the per-domain passion models from parent-verified passion domains
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.ml.passion_detector import PassionDetector
+from app.ml.training import train_models
+
+def main():
+    """Train all domain models and write a versioned artifact directory"""
+    parser = argparse.ArgumentParser(description="Train passion domain models from verified labels")
+    parser.add_argument(
+        "--version",
+        default=settings.MODEL_VERSION,
+        help="Model version directory to write under MODEL_PATH"
+    )
+    parser.add_argument(
+        "--model",
+        choices=["logistic", "forest"],
+        default="logistic",
+        help="Classifier used for every domain"
+    )
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=-1,
+        help="Parallel training jobs (-1 uses all cores)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Number of sessions fetched per round trip"
+    )
+    
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        print(f"Training {args.model} models for version {args.version}...")
+        summary = train_models(
+            db,
+            PassionDetector(),
+            settings.MODEL_PATH,
+            args.version,
+            model_type=args.model,
+            n_jobs=args.n_jobs,
+            batch_size=args.batch_size
+        )
+        elapsed = time.perf_counter() - start
+        
+        print(f"✅ Trained on {summary['children']} labelled children in {elapsed:.2f}s")
+        for domain, metrics in summary["domains"].items():
+            if "skipped" in metrics:
+                print(f"   ⚠️  {domain}: skipped ({metrics['skipped']})")
+                continue
+            auc = metrics.get("holdout_auc")
+            auc_text = f"auc {auc:.3f}" if auc is not None else "auc n/a"
+            inference = metrics["inference"]
+            print(
+                f"   {domain:<24} {auc_text}  {metrics['file_bytes'] / 1024:.1f} KB  "
+                f"single {inference['single_row_p50_ms']:.3f} ms  batch {inference['batch_ms']:.3f} ms"
+            )
+        print(f"📁 Artifacts written to {Path(settings.MODEL_PATH) / args.version}")
+    
+    except Exception as e:
+        print(f"❌ Error training models: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -2,8 +2,15 @@ import api from './auth';
 
 // Games API functions
 export const getGames = async () => {
-  const response = await api.get('/games');
-  return response.data;
+  // The list is paged; follow X-Next-Cursor until the last page
+  const games = [];
+  let cursor = null;
+  do {
+    const response = await api.get('/games', { params: cursor ? { cursor } : {} });
+    games.push(...response.data);
+    cursor = response.headers['x-next-cursor'];
+  } while (cursor);
+  return games;
 };
 
 export const getGame = async (gameId) => {
@@ -91,7 +91,8 @@ const TalentAssessmentPage = () => {
 
   const completeAssessment = async () => {
     try {
-      const response = await fetch(`/api/v1/questions/assessment/${selectedChild.id}/analyze`, {
+      // Queue the analysis; repeated submissions for the same child join the running job
+      const response = await fetch(`/api/v1/questions/assessment/${selectedChild.id}/analyze/jobs`, {
         method: 'POST',
         headers: {
           'Authorization': `Bearer ${token}`,
@@ -99,9 +100,30 @@ const TalentAssessmentPage = () => {
         }
       });
 
-      if (response.ok) {
+      if (!response.ok) {
+        throw new Error('Failed to start analysis');
+      }
+
+      let job = await response.json();
+      while (job.status === 'queued' || job.status === 'running') {
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+        const statusResponse = await fetch(`/api/v1/questions/assessment/jobs/${job.job_id}`, {
+          headers: {
+            'Authorization': `Bearer ${token}`,
+            'Content-Type': 'application/json'
+          }
+        });
+        if (!statusResponse.ok) {
+          throw new Error('Failed to check analysis status');
+        }
+        job = await statusResponse.json();
+      }
+
+      if (job.status === 'completed') {
         setAssessmentComplete(true);
         toast.success('Assessment completed!');
+      } else {
+        throw new Error(job.error || 'Analysis failed');
       }
     } catch (error) {
       console.error('Error completing assessment:', error);